@@ -232,7 +232,9 @@ class PipeStream(object):
     self.conn = recv_pipe
     self.closed = False
     self.position = 0
-    self.remaining = b''
+    # A memoryview, so that consuming part of a received buffer does not copy
+    # the rest of it.
+    self.remaining = memoryview(b'')
 
     # Data and position of last block streamed. Allows limited seeking backwards
     # of stream.
@@ -261,7 +263,7 @@ class PipeStream(object):
       bytes_read += bytes_from_remaining
       if not self.remaining:
         try:
-          self.remaining = self.conn.recv_bytes()
+          self.remaining = memoryview(self.conn.recv_bytes())
         except EOFError:
           break
 
@@ -294,7 +296,7 @@ class PipeStream(object):
         return
       elif offset == self.last_block_position and self.last_block:
         self.position = offset
-        self.remaining = b''.join([self.last_block, self.remaining])
+        self.remaining = memoryview(b''.join([self.last_block, self.remaining]))
         self.last_block = b''
         return
     raise NotImplementedError(
@@ -29,15 +29,19 @@ https://github.com/apache/beam/blob/master/sdks/python/OWNERS
 
 # pytype: skip-file
 
+import collections
 import errno
+import functools
 import io
 import logging
-import multiprocessing
+import os
 import re
 import threading
 import time
 import traceback
-from itertools import islice
+import uuid
+import weakref
+from concurrent import futures
 from typing import Optional
 from typing import Union
 
@@ -53,6 +57,7 @@ from apache_beam.io.gcp import resource_identifiers
 from apache_beam.metrics import monitoring_infos
 from apache_beam.options.pipeline_options import PipelineOptions
 from apache_beam.utils import retry
+from apache_beam.utils import thread_pool_executor
 from apache_beam.utils.annotations import deprecated
 
 __all__ = ['GcsIO']
@@ -94,13 +99,39 @@ DEFAULT_READ_BUFFER_SIZE = 16 * 1024 * 1024
 # operation from GCS to complete before retrying.
 DEFAULT_READ_SEGMENT_TIMEOUT_SECONDS = 60
 
+# This is the number of slices a single partial-file read operation is split
+# into. Slices are fetched concurrently, each over its own connection, so that
+# a read is not bound by the throughput of a single HTTPS stream. It can be
+# overridden with the BEAM_GCS_DOWNLOAD_CONCURRENCY environment variable, or
+# per file with the read_concurrency argument of GcsIO.open(). A concurrency of
+# 1 issues every read as a single request.
+DEFAULT_READ_CONCURRENCY = 8
+READ_CONCURRENCY_ENV_VAR = 'BEAM_GCS_DOWNLOAD_CONCURRENCY'
+
+# This is the smallest slice a partial-file read operation is split into.
+# Reads no larger than this are issued as a single request.
+MIN_READ_SLICE_SIZE = 1024 * 1024
+
 # This is the size of chunks used when writing to GCS.
 WRITE_CHUNK_SIZE = 8 * 1024 * 1024
 
-# Maximum number of operations permitted in GcsIO.copy_batch() and
-# GcsIO.delete_batch().
+# This is the size of each temporary object written by a parallel composite
+# upload, and the number of those objects that are uploaded concurrently. See
+# GcsParallelComposeUploader.
+DEFAULT_COMPOSE_PART_SIZE = 64 * 1024 * 1024
+DEFAULT_COMPOSE_CONCURRENCY = 8
+
+# Maximum number of source objects permitted in a single compose request.
+MAX_COMPOSE_SOURCE_OBJECTS = 32
+
+# Maximum number of operations permitted in a single batch request issued by
+# GcsIO.copy_batch() and GcsIO.delete_batch().
 MAX_BATCH_OPERATION_SIZE = 100
 
+# Maximum number of batch requests GcsIO.copy_batch() and GcsIO.delete_batch()
+# execute concurrently.
+MAX_BATCH_OPERATION_CONCURRENCY = 16
+
 # Batch endpoint URL for GCS.
 # We have to specify an API specific endpoint here since Google APIs global
 # batch endpoints will be deprecated on 03/25/2019.
@@ -112,10 +143,20 @@ MAX_BATCH_OPERATION_SIZE = 100
 # library that does not use global batch endpoints.
 GCS_BATCH_ENDPOINT = 'https://www.googleapis.com/batch/storage/v1'
 
+_GCS_PATH_PATTERN = re.compile('^gs://([^/]+)/(.*)$')
+
+# Project numbers of buckets, keyed by (credentials, bucket name). They are
+# shared by all GcsIO instances of the process, as GcsFileSystem creates one
+# per operation. Buckets the credentials cannot read, or that do not exist, are
+# recorded as None. Each key has its own lock, held while it is looked up.
+_PROJECT_NUMBERS = {}
+_PROJECT_NUMBER_LOCKS = {}
+_PROJECT_NUMBER_LOCKS_LOCK = threading.Lock()
+
 
 def parse_gcs_path(gcs_path, object_optional=False):
   """Return the bucket and object names of the given gs:// path."""
-  match = re.match('^gs://([^/]+)/(.*)$', gcs_path)
+  match = _GCS_PATH_PATTERN.match(gcs_path)
   if match is None or (match.group(2) == '' and not object_optional):
     raise ValueError(
         'GCS path must be in the form gs://<bucket>/<object>. '
@@ -160,7 +201,15 @@ class GcsIOError(IOError, retry.PermanentException):
 
 
 class GcsIO(object):
-  """Google Cloud Storage I/O client."""
+  """Google Cloud Storage I/O client.
+
+  Requests that GcsIO issues concurrently, such as batches after the first in
+  delete_batch and copy_batch, sliced reads and parallel composite uploads, are
+  only issued for the client GcsIO builds itself. They go through per-thread
+  http objects configured the same way. A ``storage_client`` passed in keeps
+  its own http object for every request, so GcsIO issues its requests one at a
+  time.
+  """
   def __init__(self, storage_client=None, pipeline_options=None):
     # type: (Optional[storage.StorageV1], Optional[Union[dict, PipelineOptions]]) -> None
     if storage_client is None:
@@ -176,18 +225,30 @@ class GcsIO(object):
           additional_http_headers={
               "User-Agent": "apache-beam-%s" % apache_beam.__version__
           })
+      _THREAD_HTTP_CLIENTS.add(storage_client)
     self.client = storage_client
     self._rewrite_cb = None
-    self.bucket_to_project_number = {}
 
   def get_project_number(self, bucket):
-    if bucket not in self.bucket_to_project_number:
-      bucket_metadata = self.get_bucket(bucket_name=bucket)
-      if bucket_metadata:
-        self.bucket_to_project_number[bucket] = bucket_metadata.projectNumber
-      #  else failed to load the bucket metadata due to HttpError
-
-    return self.bucket_to_project_number.get(bucket, None)
+    key = (getattr(self.client, '_credentials', None), bucket)
+    if key not in _PROJECT_NUMBERS:
+      with _PROJECT_NUMBER_LOCKS_LOCK:
+        lock = _PROJECT_NUMBER_LOCKS.setdefault(key, threading.Lock())
+      # Concurrent lookups of the same bucket, e.g. from files opened in
+      # parallel, wait for a single request.
+      with lock:
+        if key not in _PROJECT_NUMBERS:
+          try:
+            request = storage.StorageBucketsGetRequest(bucket=bucket)
+            _PROJECT_NUMBERS[key] = self.client.buckets.Get(
+                request).projectNumber
+          except HttpError as http_error:
+            # Other errors, e.g. 429 or 5xx, may succeed on a later call.
+            if http_error.status_code not in (403, 404):
+              return None
+            _PROJECT_NUMBERS[key] = None
+
+    return _PROJECT_NUMBERS[key]
 
   def _set_rewrite_response_callback(self, callback):
     """For testing purposes only. No backward compatibility guarantees.
@@ -226,7 +287,9 @@ class GcsIO(object):
       filename,
       mode='r',
       read_buffer_size=DEFAULT_READ_BUFFER_SIZE,
-      mime_type='application/octet-stream'):
+      mime_type='application/octet-stream',
+      parallel_composite_upload=False,
+      read_concurrency=None):
     """Open a GCS file path for reading or writing.
 
     Args:
@@ -234,6 +297,19 @@ class GcsIO(object):
       mode (str): ``'r'`` for reading or ``'w'`` for writing.
       read_buffer_size (int): Buffer size to use during read operations.
       mime_type (str): Mime type to set for write operations.
+      parallel_composite_upload (bool): Experimental. No backwards
+        compatibility guarantees. For write operations, upload the file as
+        temporary objects written in parallel and composed into the
+        destination when the file is closed. The destination is then a
+        composite object, which has no MD5 hash. Files smaller than one part
+        are uploaded as usual. Ignored for a ``storage_client`` passed to
+        GcsIO.
+      read_concurrency (int): Experimental. No backwards compatibility
+        guarantees. For read operations, the number of slices each read is
+        split into and fetched concurrently; 1 reads with a single request.
+        Defaults to the BEAM_GCS_DOWNLOAD_CONCURRENCY environment variable, or
+        DEFAULT_READ_CONCURRENCY. Ignored for a ``storage_client`` passed to
+        GcsIO.
 
     Returns:
       GCS file object.
@@ -246,13 +322,17 @@ class GcsIO(object):
           self.client,
           filename,
           buffer_size=read_buffer_size,
-          get_project_number=self.get_project_number)
+          get_project_number=self.get_project_number,
+          concurrency=read_concurrency)
       return io.BufferedReader(
           DownloaderStream(
               downloader, read_buffer_size=read_buffer_size, mode=mode),
           buffer_size=read_buffer_size)
     elif mode == 'w' or mode == 'wb':
-      uploader = GcsUploader(
+      uploader_cls = (
+          GcsParallelComposeUploader if parallel_composite_upload and
+          self.client in _THREAD_HTTP_CLIENTS else GcsUploader)
+      uploader = uploader_cls(
           self.client,
           filename,
           mime_type,
@@ -286,9 +366,11 @@ class GcsIO(object):
   def delete_batch(self, paths):
     """Deletes the objects at the given GCS paths.
 
+    Paths are deleted in batches of MAX_BATCH_OPERATION_SIZE, which are
+    executed concurrently.
+
     Args:
-      paths: List of GCS file path patterns in the form gs://<bucket>/<name>,
-             not to exceed MAX_BATCH_OPERATION_SIZE in length.
+      paths: List of GCS file path patterns in the form gs://<bucket>/<name>.
 
     Returns: List of tuples of (path, exception) in the same order as the paths
              argument, where exception is None if the operation succeeded or
@@ -296,34 +378,61 @@ class GcsIO(object):
     """
     if not paths:
       return []
-
-    paths = iter(paths)
+    return self._execute_in_batches(self._delete_batch, list(paths))
+
+  def _delete_batch(self, paths, http):
+    batch_request = BatchApiRequest(
+        batch_url=GCS_BATCH_ENDPOINT,
+        retryable_codes=retry.SERVER_ERROR_OR_TIMEOUT_CODES,
+        response_encoding='utf-8')
+    # Add() serializes the request right away, so a single request message is
+    # reused for every path.
+    request = storage.StorageObjectsDeleteRequest()
+    for path in paths:
+      request.bucket, request.object = parse_gcs_path(path)
+      batch_request.Add(self.client.objects, 'Delete', request)
+    api_calls = batch_request.Execute(http)
     result_statuses = []
-    while True:
-      paths_chunk = list(islice(paths, MAX_BATCH_OPERATION_SIZE))
-      if not paths_chunk:
-        return result_statuses
-      batch_request = BatchApiRequest(
-          batch_url=GCS_BATCH_ENDPOINT,
-          retryable_codes=retry.SERVER_ERROR_OR_TIMEOUT_CODES,
-          response_encoding='utf-8')
-      for path in paths_chunk:
-        bucket, object_path = parse_gcs_path(path)
-        request = storage.StorageObjectsDeleteRequest(
-            bucket=bucket, object=object_path)
-        batch_request.Add(self.client.objects, 'Delete', request)
-      api_calls = batch_request.Execute(self.client._http)  # pylint: disable=protected-access
-      for i, api_call in enumerate(api_calls):
-        path = paths_chunk[i]
-        exception = None
-        if api_call.is_error:
-          exception = api_call.exception
-          # Return success when the file doesn't exist anymore for idempotency.
-          if isinstance(exception, HttpError) and exception.status_code == 404:
-            exception = None
-        result_statuses.append((path, exception))
+    for i, api_call in enumerate(api_calls):
+      path = paths[i]
+      exception = None
+      if api_call.is_error:
+        exception = api_call.exception
+        # Return success when the file doesn't exist anymore for idempotency.
+        if isinstance(exception, HttpError) and exception.status_code == 404:
+          exception = None
+      result_statuses.append((path, exception))
     return result_statuses
 
+  def _execute_in_batches(self, execute_batch, operations):
+    """Splits operations into batches and executes them.
+
+    Batches are executed concurrently for a client built by GcsIO.
+
+    Args:
+      execute_batch: function receiving a list of at most
+        MAX_BATCH_OPERATION_SIZE operations and the http object to send their
+        batch request with, returning a list of per-operation results.
+      operations: list of operations.
+
+    Returns: List of per-operation results, in the order of operations.
+    """
+    batches = [
+        operations[i:i + MAX_BATCH_OPERATION_SIZE]
+        for i in range(0, len(operations), MAX_BATCH_OPERATION_SIZE)
+    ]
+    if len(batches) == 1 or self.client not in _THREAD_HTTP_CLIENTS:
+      return [
+          result for batch in batches
+          for result in execute_batch(batch, self.client._http)  # pylint: disable=protected-access
+      ]
+
+    batch_results = _map_concurrently(
+        lambda batch: execute_batch(batch, _THREAD_HTTP.get(self.client)),
+        batches,
+        MAX_BATCH_OPERATION_CONCURRENCY)
+    return [result for results in batch_results for result in results]
+
   @retry.with_exponential_backoff(
       retry_filter=retry.retry_on_server_errors_and_timeout_filter)
   def copy(
@@ -356,14 +465,16 @@ class GcsIO(object):
         destinationObject=dest_path,
         destinationKmsKeyName=dest_kms_key_name,
         maxBytesRewrittenPerCall=max_bytes_rewritten_per_call)
+    log_debug = _LOGGER.isEnabledFor(logging.DEBUG)
     response = self.client.objects.Rewrite(request)
     while not response.done:
-      _LOGGER.debug(
-          'Rewrite progress: %d of %d bytes, %s to %s',
-          response.totalBytesRewritten,
-          response.objectSize,
-          src,
-          dest)
+      if log_debug:
+        _LOGGER.debug(
+            'Rewrite progress: %d of %d bytes, %s to %s',
+            response.totalBytesRewritten,
+            response.objectSize,
+            src,
+            dest)
       request.rewriteToken = response.rewriteToken
       response = self.client.objects.Rewrite(request)
       if self._rewrite_cb is not None:
@@ -380,10 +491,12 @@ class GcsIO(object):
       max_bytes_rewritten_per_call=None):
     """Copies the given GCS object from src to dest.
 
+    Pairs are copied in batches of MAX_BATCH_OPERATION_SIZE, which are
+    executed concurrently.
+
     Args:
       src_dest_pairs: list of (src, dest) tuples of gs://<bucket>/<name> files
-                      paths to copy from src to dest, not to exceed
-                      MAX_BATCH_OPERATION_SIZE in length.
+                      paths to copy from src to dest.
       dest_kms_key_name: Experimental. No backwards compatibility guarantees.
         Encrypt dest with this Cloud KMS key. If None, will use dest bucket
         encryption defaults.
@@ -397,6 +510,19 @@ class GcsIO(object):
     """
     if not src_dest_pairs:
       return []
+    return self._execute_in_batches(
+        functools.partial(
+            self._copy_batch,
+            dest_kms_key_name=dest_kms_key_name,
+            max_bytes_rewritten_per_call=max_bytes_rewritten_per_call),
+        list(src_dest_pairs))
+
+  def _copy_batch(
+      self,
+      src_dest_pairs,
+      http,
+      dest_kms_key_name=None,
+      max_bytes_rewritten_per_call=None):
     pair_to_request = {}
     for pair in src_dest_pairs:
       src_bucket, src_path = parse_gcs_path(pair[0])
@@ -410,18 +536,19 @@ class GcsIO(object):
           maxBytesRewrittenPerCall=max_bytes_rewritten_per_call)
       pair_to_request[pair] = request
     pair_to_status = {}
-    while True:
-      pairs_in_batch = list(set(src_dest_pairs) - set(pair_to_status))
-      if not pairs_in_batch:
-        break
+    # Distinct pairs whose rewrite is not finished yet, in input order.
+    pending_pairs = list(pair_to_request)
+    log_debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    while pending_pairs:
       batch_request = BatchApiRequest(
           batch_url=GCS_BATCH_ENDPOINT,
           retryable_codes=retry.SERVER_ERROR_OR_TIMEOUT_CODES,
           response_encoding='utf-8')
-      for pair in pairs_in_batch:
+      for pair in pending_pairs:
         batch_request.Add(self.client.objects, 'Rewrite', pair_to_request[pair])
-      api_calls = batch_request.Execute(self.client._http)  # pylint: disable=protected-access
-      for pair, api_call in zip(pairs_in_batch, api_calls):
+      api_calls = batch_request.Execute(http)
+      next_pending_pairs = []
+      for pair, api_call in zip(pending_pairs, api_calls):
         src, dest = pair
         response = api_call.response
         if self._rewrite_cb is not None:
@@ -434,16 +561,20 @@ class GcsIO(object):
                 GcsIOError(errno.ENOENT, 'Source file not found: %s' % src))
           pair_to_status[pair] = exception
         elif not response.done:
-          _LOGGER.debug(
-              'Rewrite progress: %d of %d bytes, %s to %s',
-              response.totalBytesRewritten,
-              response.objectSize,
-              src,
-              dest)
+          if log_debug:
+            _LOGGER.debug(
+                'Rewrite progress: %d of %d bytes, %s to %s',
+                response.totalBytesRewritten,
+                response.objectSize,
+                src,
+                dest)
           pair_to_request[pair].rewriteToken = response.rewriteToken
+          next_pending_pairs.append(pair)
         else:
-          _LOGGER.debug('Rewrite done: %s to %s', src, dest)
+          if log_debug:
+            _LOGGER.debug('Rewrite done: %s to %s', src, dest)
           pair_to_status[pair] = None
+      pending_pairs = next_pending_pairs
 
     return [(pair[0], pair[1], pair_to_status[pair]) for pair in src_dest_pairs]
 
@@ -453,15 +584,24 @@ class GcsIO(object):
   def copytree(self, src, dest):
     """Renames the given GCS "directory" recursively from src to dest.
 
+    Objects are copied in concurrently executed batches, see copy_batch().
+
     Args:
       src: GCS file path pattern in the form gs://<bucket>/<name>/.
       dest: GCS file path pattern in the form gs://<bucket>/<name>/.
+
+    Raises:
+      GcsIOError or HttpError: the error of the first object that could not be
+        copied.
     """
     assert src.endswith('/')
     assert dest.endswith('/')
-    for entry in self.list_prefix(src):
-      rel_path = entry[len(src):]
-      self.copy(entry, dest + rel_path)
+    src_dest_pairs = [
+        (entry, dest + entry[len(src):]) for entry, _ in self.list_files(src)
+    ]
+    for _, _, exception in self.copy_batch(src_dest_pairs):
+      if exception is not None:
+        raise exception
 
   # We intentionally do not decorate this method with a retry, since the
   # underlying copy and delete operations are already idempotent operations
@@ -605,7 +745,8 @@ class GcsIO(object):
     """
     bucket, prefix = parse_gcs_path(path, object_optional=True)
     request = storage.StorageObjectsListRequest(bucket=bucket, prefix=prefix)
-    file_info = set()
+    # All listed items are in bucket, so build their paths from one prefix.
+    path_prefix = 'gs://%s/' % bucket
     counter = 0
     start_time = time.time()
     if with_metadata:
@@ -619,23 +760,19 @@ class GcsIO(object):
                   request)
 
       for item in response.items:
-        file_name = 'gs://%s/%s' % (item.bucket, item.name)
-        if file_name not in file_info:
-          file_info.add(file_name)
-          counter += 1
-          if counter % 10000 == 0:
-            if with_metadata:
-              _LOGGER.info(
-                  "Finished computing file information of: %s files",
-                  len(file_info))
-            else:
-              _LOGGER.info(
-                  "Finished computing size of: %s files", len(file_info))
-
+        file_name = path_prefix + item.name
+        counter += 1
+        if counter % 10000 == 0:
           if with_metadata:
-            yield file_name, (item.size, self._updated_to_seconds(item.updated))
+            _LOGGER.info(
+                "Finished computing file information of: %s files", counter)
           else:
-            yield file_name, item.size
+            _LOGGER.info("Finished computing size of: %s files", counter)
+
+        if with_metadata:
+          yield file_name, (item.size, self._updated_to_seconds(item.updated))
+        else:
+          yield file_name, item.size
 
       if response.nextPageToken:
         request.pageToken = response.nextPageToken
@@ -656,13 +793,96 @@ class GcsIO(object):
         updated.microsecond / 1000000.0)
 
 
+class _ThreadLocalHttp(threading.local):
+  """Holds an http object for each thread issuing requests for a client.
+
+  httplib2.Http objects are not thread-safe, so requests issued concurrently
+  from worker threads each go through an http object of their own. The http
+  object of a thread is shared by every client used from that thread, so its
+  kept-alive connections are reused across GcsIO instances, downloads and
+  uploads instead of paying a new TLS handshake each time.
+  """
+  def __init__(self):
+    self._http = get_new_http()
+    self._authorized_http = {}
+
+  def get(self, client):
+    """Returns this thread's http object, authorized for the given client."""
+    credentials = getattr(client, '_credentials', None)
+    if credentials is None:
+      return self._http
+    if credentials not in self._authorized_http:
+      self._authorized_http[credentials] = credentials.authorize(self._http)
+    return self._authorized_http[credentials]
+
+
+_THREAD_HTTP = _ThreadLocalHttp()
+
+# Storage clients built by GcsIO, whose requests may be issued from worker
+# threads through _THREAD_HTTP. Other clients may carry an http object with
+# custom settings, which per-thread http objects would not have.
+_THREAD_HTTP_CLIENTS = weakref.WeakSet()
+
+
+def _map_concurrently(fn, items, max_concurrency):
+  """Returns fn applied to each of items, computed on the shared executor.
+
+  At most max_concurrency calls are in flight at once. Sharing the executor
+  reuses its idle threads, and with them their http connections, across
+  GcsIO instances and operations.
+  """
+  executor = thread_pool_executor.shared_unbounded_instance()
+  in_flight = collections.deque()
+  results = []
+  for item in items:
+    if len(in_flight) == max_concurrency:
+      results.append(in_flight.popleft().result())
+    in_flight.append(executor.submit(fn, item))
+  results.extend(future.result() for future in in_flight)
+  return results
+
+
+class _RangeBuffer(object):
+  """A write-only stream collecting each downloaded range in a new buffer.
+
+  A transfer.Download writes every range into the stream it was created with.
+  Handing out each range from a fresh BytesIO, rather than rewinding and
+  truncating a shared one, lets getvalue() return the written bytes without
+  copying them again.
+  """
+  def __init__(self):
+    self._buffer = io.BytesIO()
+
+  def write(self, data):
+    return self._buffer.write(data)
+
+  def reset(self):
+    """Starts collecting a new range in a fresh buffer."""
+    self._buffer = io.BytesIO()
+
+  def getvalue(self):
+    return self._buffer.getvalue()
+
+
 class GcsDownloader(Downloader):
-  def __init__(self, client, path, buffer_size, get_project_number):
+  def __init__(
+      self, client, path, buffer_size, get_project_number, concurrency=None):
     self._client = client
     self._path = path
     self._bucket, self._name = parse_gcs_path(path)
     self._buffer_size = buffer_size
     self._get_project_number = get_project_number
+    if concurrency is None:
+      concurrency = int(
+          os.environ.get(READ_CONCURRENCY_ENV_VAR, DEFAULT_READ_CONCURRENCY))
+    if concurrency < 1:
+      raise ValueError('Read concurrency must be at least 1: %s' % concurrency)
+    if client not in _THREAD_HTTP_CLIENTS:
+      concurrency = 1
+    self._slice_size = max(buffer_size // concurrency, MIN_READ_SLICE_SIZE)
+    self._concurrency = concurrency
+    # Initialized (stream, download) pairs not reading a slice at the moment.
+    self._idle_slice_downloads = []
 
     # Create a request count metric
     resource = resource_identifiers.GoogleCloudStorageBucket(self._bucket)
@@ -710,7 +930,7 @@ class GcsDownloader(Downloader):
     self._get_request.generation = metadata.generation
 
     # Initialize read buffer state.
-    self._download_stream = io.BytesIO()
+    self._download_stream = _RangeBuffer()
     self._downloader = transfer.Download(
         self._download_stream,
         auto_transfer=False,
@@ -734,10 +954,103 @@ class GcsDownloader(Downloader):
     return self._size
 
   def get_range(self, start, end):
-    self._download_stream.seek(0)
-    self._download_stream.truncate(0)
-    self._downloader.GetRange(start, end - 1)
-    return self._download_stream.getvalue()
+    if self._concurrency == 1 or end - start <= self._slice_size:
+      self._download_stream.reset()
+      self._downloader.GetRange(start, end - 1)
+      return self._download_stream.getvalue()
+
+    # Split larger reads into slices that are fetched concurrently.
+    slices = [(slice_start, min(slice_start + self._slice_size, end))
+              for slice_start in range(start, end, self._slice_size)]
+    return b''.join(
+        _map_concurrently(
+            lambda bounds: self._get_slice(*bounds), slices, self._concurrency))
+
+  def _get_slice(self, start, end):
+    # Downloads are initialized once and reused for later slices, by whichever
+    # worker thread reads them.
+    try:
+      stream, downloader = self._idle_slice_downloads.pop()
+    except IndexError:
+      stream = _RangeBuffer()
+      downloader = transfer.Download(
+          stream,
+          auto_transfer=False,
+          total_size=self._size,
+          chunksize=self._slice_size,
+          num_retries=20)
+      self._client.objects.Get(self._get_request, download=downloader)
+    try:
+      downloader.bytes_http = _THREAD_HTTP.get(self._client)
+      stream.reset()
+      downloader.GetRange(start, end - 1)
+      return stream.getvalue()
+    finally:
+      self._idle_slice_downloads.append((stream, downloader))
+
+
+class _ThreadPipe(object):
+  """A bounded pipe passing bytes between two threads of the same process.
+
+  Implements the subset of ``multiprocessing.connection.Connection`` used by
+  ``GcsUploader`` and ``PipeStream``, without the socket round trip and the
+  pickling of ``multiprocessing.Pipe``.
+  """
+  def __init__(self, max_bytes):
+    self._max_bytes = max_bytes
+    self._buffers = collections.deque()
+    self._buffered_bytes = 0
+    self._write_closed = False
+    self._read_closed = False
+    self._condition = threading.Condition()
+
+  def send_bytes(self, data):
+    """Blocks until there is room for data, then adds it to the pipe.
+
+    Raises:
+      BrokenPipeError: if the reading end has been closed.
+    """
+    with self._condition:
+      # A single buffer larger than max_bytes is accepted once the pipe has
+      # been drained.
+      while (not self._read_closed and self._buffered_bytes and
+             self._buffered_bytes + len(data) > self._max_bytes):
+        self._condition.wait()
+      if self._read_closed:
+        raise BrokenPipeError('Reading end of the pipe is closed.')
+      self._buffers.append(data)
+      self._buffered_bytes += len(data)
+      self._condition.notify_all()
+
+  def recv_bytes(self):
+    """Blocks until data is available and returns it.
+
+    Raises:
+      EOFError: if the writing end has been closed and all data was read.
+    """
+    with self._condition:
+      while not self._buffers and not self._write_closed:
+        self._condition.wait()
+      if not self._buffers:
+        raise EOFError
+      data = self._buffers.popleft()
+      self._buffered_bytes -= len(data)
+      self._condition.notify_all()
+      return data
+
+  def close(self):
+    """Closes the writing end; the reader gets EOF once the pipe drains."""
+    with self._condition:
+      self._write_closed = True
+      self._condition.notify_all()
+
+  def close_reader(self):
+    """Closes the reading end, discarding buffered data."""
+    with self._condition:
+      self._read_closed = True
+      self._buffers.clear()
+      self._buffered_bytes = 0
+      self._condition.notify_all()
 
 
 class GcsUploader(Uploader):
@@ -749,18 +1062,14 @@ class GcsUploader(Uploader):
     self._get_project_number = get_project_number
 
     # Set up communication with child thread.
-    parent_conn, child_conn = multiprocessing.Pipe()
-    self._child_conn = child_conn
-    self._conn = parent_conn
+    self._conn = _ThreadPipe(max_bytes=2 * WRITE_CHUNK_SIZE)
 
     # Set up uploader.
     self._insert_request = (
         storage.StorageObjectsInsertRequest(
             bucket=self._bucket, name=self._name))
     self._upload = transfer.Upload(
-        PipeStream(self._child_conn),
-        self._mime_type,
-        chunksize=WRITE_CHUNK_SIZE)
+        PipeStream(self._conn), self._mime_type, chunksize=WRITE_CHUNK_SIZE)
     self._upload.strategy = transfer.RESUMABLE_UPLOAD
 
     # Start uploading thread.
@@ -806,12 +1115,12 @@ class GcsUploader(Uploader):
           traceback.format_exc())
       self._upload_thread.last_error = e
     finally:
-      self._child_conn.close()
+      self._conn.close_reader()
 
   def put(self, data):
     try:
       self._conn.send_bytes(data.tobytes())
-    except EOFError:
+    except BrokenPipeError:
       if self._upload_thread.last_error is not None:
         raise self._upload_thread.last_error  # pylint: disable=raising-bad-type
       raise
@@ -824,3 +1133,154 @@ class GcsUploader(Uploader):
     # Check for exception since the last put() call.
     if self._upload_thread.last_error is not None:
       raise self._upload_thread.last_error  # pylint: disable=raising-bad-type
+
+
+class GcsParallelComposeUploader(Uploader):
+  """Uploads a file as temporary parts that are composed on finish.
+
+  Written data is split into parts of ``part_size`` bytes, which are uploaded
+  concurrently as temporary objects next to the destination. ``finish()``
+  composes the parts into the destination object and deletes them.
+
+  A file that never fills a single part is uploaded with a ``GcsUploader``
+  instead, so it becomes a regular object, with an MD5 hash, and no compose.
+  """
+  def __init__(
+      self,
+      client,
+      path,
+      mime_type,
+      get_project_number,
+      part_size=DEFAULT_COMPOSE_PART_SIZE,
+      max_concurrency=DEFAULT_COMPOSE_CONCURRENCY):
+    self._client = client
+    self._path = path
+    self._bucket, self._name = parse_gcs_path(path)
+    self._mime_type = mime_type
+    self._get_project_number = get_project_number
+    self._part_size = part_size
+    self._part_prefix = '%s.%s' % (self._name, uuid.uuid4().hex)
+    self._buffer = bytearray()
+    self._part_futures = []
+    self._part_error = None
+    self._temp_names = []
+    # Bounds the number of parts uploaded at once, and so held in memory.
+    self._part_slots = threading.BoundedSemaphore(max_concurrency)
+
+    # Create a request count metric
+    project_number = get_project_number(self._bucket)
+    resource = resource_identifiers.GoogleCloudStorageBucket(self._bucket)
+    labels = {
+        monitoring_infos.SERVICE_LABEL: 'Storage',
+        monitoring_infos.METHOD_LABEL: 'Objects.insert',
+        monitoring_infos.RESOURCE_LABEL: resource,
+        monitoring_infos.GCS_BUCKET_LABEL: self._bucket,
+        monitoring_infos.GCS_PROJECT_ID_LABEL: str(project_number)
+    }
+    self._service_call_metric = ServiceCallMetric(
+        request_count_urn=monitoring_infos.API_REQUEST_COUNT_URN,
+        base_labels=labels)
+
+  def put(self, data):
+    data = memoryview(data)
+    while data:
+      size = min(len(data), self._part_size - len(self._buffer))
+      self._buffer += data[:size]
+      data = data[size:]
+      if len(self._buffer) == self._part_size:
+        self._submit_part()
+
+  def finish(self):
+    if not self._part_futures:
+      uploader = GcsUploader(
+          self._client, self._path, self._mime_type, self._get_project_number)
+      uploader.put(memoryview(self._buffer))
+      uploader.finish()
+      return
+
+    try:
+      if self._buffer:
+        self._submit_part()
+      parts = [future.result() for future in self._part_futures]
+      while len(parts) > MAX_COMPOSE_SOURCE_OBJECTS:
+        parts = [
+            self._compose(
+                self._new_temp_name(), parts[i:i + MAX_COMPOSE_SOURCE_OBJECTS])
+            for i in range(0, len(parts), MAX_COMPOSE_SOURCE_OBJECTS)
+        ]
+      self._compose(self._name, parts)
+    finally:
+      futures.wait(self._part_futures)
+      self._delete_temp_objects()
+
+  def _submit_part(self):
+    self._part_slots.acquire()
+    if self._part_error is not None:
+      self._part_slots.release()
+      raise self._part_error
+    future = thread_pool_executor.shared_unbounded_instance().submit(
+        self._upload_part, self._new_temp_name(), self._buffer)
+    future.add_done_callback(self._part_done)
+    self._part_futures.append(future)
+    self._buffer = bytearray()
+
+  def _part_done(self, future):
+    # Record the first failure before freeing the slot, so that the next part
+    # waiting for it sees the failure.
+    if self._part_error is None and future.exception() is not None:
+      self._part_error = future.exception()
+    self._part_slots.release()
+
+  def _upload_part(self, name, data):
+    return self._insert_object(name, data, http=_THREAD_HTTP.get(self._client))
+
+  def _new_temp_name(self):
+    name = '%s.part%d.tmp' % (self._part_prefix, len(self._temp_names))
+    self._temp_names.append(name)
+    return name
+
+  def _insert_object(self, name, data, http=None):
+    """Uploads data as a single object, returning its (name, generation)."""
+    request = storage.StorageObjectsInsertRequest(
+        bucket=self._bucket, name=name)
+    upload = transfer.Upload(
+        io.BytesIO(data), self._mime_type, total_size=len(data))
+    upload.strategy = transfer.SIMPLE_UPLOAD
+    upload.bytes_http = http
+    try:
+      response = self._client.objects.Insert(request, upload=upload)
+      self._service_call_metric.call('ok')
+    except Exception as e:  # pylint: disable=broad-except
+      self._service_call_metric.call(e)
+      _LOGGER.error(
+          'Error while inserting file %s: %s', name, traceback.format_exc())
+      raise
+    return name, response.generation
+
+  def _compose(self, name, parts):
+    """Composes parts into an object, returning its (name, generation)."""
+    source_objects = [
+        storage.ComposeRequest.SourceObjectsValueListEntry(
+            name=part_name, generation=generation)
+        for (part_name, generation) in parts
+    ]
+    request = storage.StorageObjectsComposeRequest(
+        destinationBucket=self._bucket,
+        destinationObject=name,
+        composeRequest=storage.ComposeRequest(
+            destination=storage.Object(
+                bucket=self._bucket, name=name, contentType=self._mime_type),
+            sourceObjects=source_objects))
+    response = self._client.objects.Compose(request)
+    return name, response.generation
+
+  def _delete_temp_objects(self):
+    paths = ['gs://%s/%s' % (self._bucket, name) for name in self._temp_names]
+    try:
+      statuses = GcsIO(self._client).delete_batch(paths)
+    except Exception as e:  # pylint: disable=broad-except
+      statuses = [(path, e) for path in paths]
+    for path, exception in statuses:
+      if exception is not None:
+        _LOGGER.warning(
+            'Failed to delete temporary object %s: %s', path, exception)
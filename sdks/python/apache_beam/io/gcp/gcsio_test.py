@@ -18,14 +18,17 @@
 """Tests for Google Cloud Storage client."""
 # pytype: skip-file
 
+import copy
 import datetime
 import errno
 import io
 import logging
 import os
 import random
+import threading
 import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from email.message import Message
 
 import httplib2
@@ -33,6 +36,7 @@ import mock
 
 # Protect against environments where apitools library is not available.
 # pylint: disable=wrong-import-order, wrong-import-position
+from apache_beam.io.filesystemio import UploaderStream
 from apache_beam.metrics import monitoring_infos
 from apache_beam.metrics.execution import MetricsEnvironment
 from apache_beam.metrics.metricbase import MetricName
@@ -163,6 +167,22 @@ class FakeGcsObjects(object):
     f.contents = b''.join(data_list)
 
     self.add_file(f)
+    return f.get_metadata()
+
+  def Compose(self, compose_request):  # pylint: disable=invalid-name
+    bucket = compose_request.destinationBucket
+    data_list = []
+    for source in compose_request.composeRequest.sourceObjects:
+      f = self.get_file(bucket, source.name)
+      if f is None or f.generation != source.generation:
+        raise HttpError({'status': 404}, None, None)
+      data_list.append(f.contents)
+    name = compose_request.destinationObject
+    generation = self.get_last_generation(bucket, name) + 1
+    f = FakeFile(bucket, name, b''.join(data_list), generation)
+
+    self.add_file(f)
+    return f.get_metadata()
 
   REWRITE_TOKEN = 'test_token'
 
@@ -252,7 +272,8 @@ class FakeBatchApiRequest(object):
     self.operations = []
 
   def Add(self, service, method, request):  # pylint: disable=invalid-name
-    self.operations.append((service, method, request))
+    # Like BatchApiRequest, capture the request as it is when added.
+    self.operations.append((service, method, copy.deepcopy(request)))
 
   def Execute(self, unused_http, **unused_kwargs):  # pylint: disable=invalid-name
     api_calls = []
@@ -336,7 +357,12 @@ class TestGCSIO(unittest.TestCase):
 
   def setUp(self):
     self.client = FakeGcsClient()
+    # Issue requests from worker threads, as for a client built by GcsIO.
+    gcsio._THREAD_HTTP_CLIENTS.add(self.client)
     self.gcs = gcsio.GcsIO(self.client)
+    project_numbers = mock.patch.dict(gcsio._PROJECT_NUMBERS, clear=True)
+    project_numbers.start()
+    self.addCleanup(project_numbers.stop)
 
   def test_default_bucket_name(self):
     self.assertEqual(
@@ -425,6 +451,33 @@ class TestGCSIO(unittest.TestCase):
     self.assertEqual(file_status['checksum'], file_checksum)
     self.assertEqual(file_status['last_updated'], last_updated)
 
+  def test_file_status_single_request(self):
+    file_name = 'gs://gcsio-test/dummy_file'
+    file_size = 1234
+    self._insert_random_file(
+        self.client, file_name, file_size, last_updated=123456.78)
+
+    with mock.patch.object(FakeGcsObjects,
+                           'Get',
+                           autospec=True,
+                           side_effect=FakeGcsObjects.Get) as mock_get:
+      file_status = self.gcs._status(file_name)
+    self.assertEqual(file_status['size'], file_size)
+    self.assertEqual(file_status['last_updated'], 123456.78)
+    self.assertEqual(mock_get.call_count, 1)
+
+  def test_size_after_lookup_during_write(self):
+    file_name = 'gs://gcsio-test/dummy_file'
+    self._insert_random_file(self.client, file_name, 1234)
+    contents = os.urandom(2048)
+
+    f = self.gcs.open(file_name, 'w')
+    f.write(contents)
+    # The object being written is not visible until it is closed.
+    self.assertEqual(1234, self.gcs.size(file_name))
+    f.close()
+    self.assertEqual(len(contents), self.gcs.size(file_name))
+
   def test_file_mode(self):
     file_name = 'gs://gcsio-test/dummy_mode_file'
     with self.gcs.open(file_name, 'wb') as f:
@@ -475,6 +528,62 @@ class TestGCSIO(unittest.TestCase):
     call = get_new_http_mock.return_value.request.mock_calls[-2]
     self.assertIn('apache-beam-', call[2]['headers']['User-Agent'])
 
+  def test_thread_http_shared_across_clients(self):
+    credentials = mock.Mock()
+    credentials.authorize.side_effect = lambda http: mock.Mock()
+    first = gcsio.GcsIO(mock.Mock(_credentials=credentials))
+    second = gcsio.GcsIO(mock.Mock(_credentials=credentials))
+
+    def get_http(gcs):
+      return gcsio._THREAD_HTTP.get(gcs.client)
+
+    self.assertIs(get_http(first), get_http(second))
+    credentials.authorize.assert_called_once()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+      self.assertIsNot(
+          executor.submit(get_http, first).result(), get_http(first))
+
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest', FakeBatchApiRequest)
+  def test_storage_client_http_used_for_every_request(self):
+    client = FakeGcsClient()
+    gcs = gcsio.GcsIO(client)
+    file_name = 'gs://gcsio-test/dummy_file'
+    self._insert_random_file(client, file_name, 1024)
+
+    with mock.patch.object(FakeBatchApiRequest,
+                           'Execute',
+                           autospec=True,
+                           side_effect=FakeBatchApiRequest.Execute) as execute:
+      gcs.delete_batch([
+          'gs://gcsio-test/delete_me_%d' % i
+          for i in range(2 * gcsio.MAX_BATCH_OPERATION_SIZE)
+      ])
+    self.assertEqual([call[0][1] for call in execute.call_args_list],
+                     [client._http, client._http])
+
+    f = gcs.open(file_name, read_concurrency=4)
+    self.assertEqual(f.raw._downloader._concurrency, 1)
+    with gcs.open(file_name, 'w', parallel_composite_upload=True) as f:
+      self.assertIsInstance(f.raw._uploader, gcsio.GcsUploader)
+
+  def test_map_concurrently(self):
+    lock = threading.Lock()
+    in_flight = [0]
+    max_in_flight = [0]
+
+    def square(x):
+      with lock:
+        in_flight[0] += 1
+        max_in_flight[0] = max(max_in_flight[0], in_flight[0])
+      time.sleep(0.001)
+      with lock:
+        in_flight[0] -= 1
+      return x * x
+
+    self.assertEqual([x * x for x in range(20)],
+                     gcsio._map_concurrently(square, range(20), 3))
+    self.assertLessEqual(max_in_flight[0], 3)
+
   @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
   def test_delete_batch(self, *unused_args):
     gcsio.BatchApiRequest = FakeBatchApiRequest
@@ -506,6 +615,23 @@ class TestGCSIO(unittest.TestCase):
     for i in range(num_files):
       self.assertFalse(self.gcs.exists(file_name_pattern % i))
 
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
+  def test_delete_batch_multiple_batches(self, *unused_args):
+    gcsio.BatchApiRequest = FakeBatchApiRequest
+    file_name_pattern = 'gs://gcsio-test/delete_me_%d'
+    file_size = 16
+    num_files = 3 * gcsio.MAX_BATCH_OPERATION_SIZE + 1
+    for i in range(0, num_files, 2):
+      self._insert_random_file(self.client, file_name_pattern % i, file_size)
+
+    result = self.gcs.delete_batch(
+        [file_name_pattern % i for i in range(num_files)])
+    self.assertEqual([file_name_pattern % i for i in range(num_files)],
+                     [file_name for (file_name, _) in result])
+    for file_name, exception in result:
+      self.assertIsNone(exception)
+      self.assertFalse(self.gcs.exists(file_name))
+
   def test_copy(self):
     src_file_name = 'gs://gcsio-test/source'
     dest_file_name = 'gs://gcsio-test/dest'
@@ -566,7 +692,31 @@ class TestGCSIO(unittest.TestCase):
       self.assertTrue(self.gcs.exists(from_name_pattern % i))
       self.assertTrue(self.gcs.exists(to_name_pattern % i))
 
-  def test_copytree(self):
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
+  def test_copy_batch_multiple_batches(self, *unused_args):
+    gcsio.BatchApiRequest = FakeBatchApiRequest
+    from_name_pattern = 'gs://gcsio-test/copy_me_%d'
+    to_name_pattern = 'gs://gcsio-test/destination_%d'
+    file_size = 16
+    num_files = 3 * gcsio.MAX_BATCH_OPERATION_SIZE + 1
+    for i in range(0, num_files, 2):
+      self._insert_random_file(self.client, from_name_pattern % i, file_size)
+
+    result = self.gcs.copy_batch([(from_name_pattern % i, to_name_pattern % i)
+                                  for i in range(num_files)])
+    self.assertEqual(num_files, len(result))
+    for i, (src, dest, exception) in enumerate(result):
+      self.assertEqual(src, from_name_pattern % i)
+      self.assertEqual(dest, to_name_pattern % i)
+      if i % 2:
+        self.assertEqual(exception.errno, errno.ENOENT)
+      else:
+        self.assertIsNone(exception)
+        self.assertTrue(self.gcs.exists(dest))
+
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
+  def test_copytree(self, *unused_args):
+    gcsio.BatchApiRequest = FakeBatchApiRequest
     src_dir_name = 'gs://gcsio-test/source/'
     dest_dir_name = 'gs://gcsio-test/dest/'
     file_size = 1024
@@ -636,6 +786,77 @@ class TestGCSIO(unittest.TestCase):
           f.read(end - start + 1), random_file.contents[start:end + 1])
       self.assertEqual(f.tell(), end + 1)
 
+  def test_file_read_in_slices(self):
+    file_name = 'gs://gcsio-test/sliced_file'
+    file_size = 5 * 1024 * 1024 + 100
+    read_buffer_size = 4 * 1024 * 1024
+    random_file = self._insert_random_file(self.client, file_name, file_size)
+
+    with mock.patch.object(gcsio.GcsDownloader,
+                           '_get_slice',
+                           autospec=True,
+                           side_effect=gcsio.GcsDownloader._get_slice) as m:
+      f = self.gcs.open(
+          file_name, read_buffer_size=read_buffer_size, read_concurrency=4)
+      self.assertEqual(f.read(), random_file.contents)
+    # 4 MB buffer with a concurrency of 4 gives 1 MB slices: the first read is
+    # split into 4 slices and the remaining 1 MB + 100 bytes into 2.
+    self.assertEqual(m.call_count, 6)
+
+  def test_file_read_concurrency_from_environment(self):
+    file_name = 'gs://gcsio-test/sliced_file'
+    self._insert_random_file(self.client, file_name, 1024)
+    with mock.patch.dict(os.environ, {gcsio.READ_CONCURRENCY_ENV_VAR: '3'}):
+      downloader = gcsio.GcsDownloader(
+          self.client,
+          file_name,
+          buffer_size=1024,
+          get_project_number=self.gcs.get_project_number)
+    self.assertEqual(downloader._concurrency, 3)
+
+  def test_file_read_without_concurrency(self):
+    file_name = 'gs://gcsio-test/sliced_file'
+    file_size = 5 * 1024 * 1024 + 100
+    random_file = self._insert_random_file(self.client, file_name, file_size)
+    downloader = gcsio.GcsDownloader(
+        self.client,
+        file_name,
+        buffer_size=1024 * 1024,
+        get_project_number=self.gcs.get_project_number,
+        concurrency=1)
+    get_range = mock.Mock(side_effect=downloader._downloader.GetRange)
+    downloader._downloader.GetRange = get_range
+
+    self.assertEqual(downloader.get_range(0, file_size), random_file.contents)
+    self.assertEqual(
+        downloader.get_range(100, 200), random_file.contents[100:200])
+    # Each read is served by a single range request.
+    self.assertEqual(
+        get_range.call_args_list,
+        [mock.call(0, file_size - 1), mock.call(100, 199)])
+
+  def test_file_read_in_slices_reuses_downloads(self):
+    file_name = 'gs://gcsio-test/sliced_file'
+    file_size = 5 * 1024 * 1024 + 100
+    random_file = self._insert_random_file(self.client, file_name, file_size)
+    downloader = gcsio.GcsDownloader(
+        self.client,
+        file_name,
+        buffer_size=1024 * 1024,
+        get_project_number=self.gcs.get_project_number,
+        concurrency=2)
+
+    with mock.patch.object(FakeGcsObjects,
+                           'Get',
+                           autospec=True,
+                           side_effect=FakeGcsObjects.Get) as mock_get:
+      for _ in range(2):
+        self.assertEqual(
+            downloader.get_range(0, file_size), random_file.contents)
+    # Each of the 12 slices reuses one of the at most 2 downloads initialized
+    # for the slices in flight.
+    self.assertLessEqual(mock_get.call_count, 2)
+
   def test_file_iterator(self):
     file_name = 'gs://gcsio-test/iterating_file'
     lines = []
@@ -723,6 +944,104 @@ class TestGCSIO(unittest.TestCase):
     self.assertEqual(
         self.client.objects.get_file(bucket, name).contents, contents)
 
+  @mock.patch.object(FakeGcsObjects, 'Insert')
+  def test_file_write_upload_error(self, mock_insert):
+    mock_insert.side_effect = HttpError({'status': 403}, None, None)
+    file_name = 'gs://gcsio-test/write_error_file'
+    # Write more than the uploader buffers, so that a writer blocked on the
+    # failed upload is released with the upload error.
+    contents = os.urandom(gcsio.WRITE_CHUNK_SIZE)
+    f = self.gcs.open(file_name, 'w')
+    with self.assertRaises(HttpError) as cm:
+      for _ in range(3):
+        f.write(contents)
+      f.close()
+    self.assertEqual(403, cm.exception.status_code)
+
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
+  def test_file_write_parallel_composite(self, *unused_args):
+    gcsio.BatchApiRequest = FakeBatchApiRequest
+    file_name = 'gs://gcsio-test/composite_file'
+    part_size = 1024
+    # More parts than a single compose request accepts.
+    contents = os.urandom(40 * part_size + 100)
+    uploader = gcsio.GcsParallelComposeUploader(
+        self.client,
+        file_name,
+        'application/octet-stream',
+        self.gcs.get_project_number,
+        part_size=part_size)
+    with io.BufferedWriter(UploaderStream(uploader)) as f:
+      f.write(contents)
+    bucket, name = gcsio.parse_gcs_path(file_name)
+    self.assertEqual(
+        self.client.objects.get_file(bucket, name).contents, contents)
+    # Temporary parts are deleted once composed.
+    self.assertEqual(list(self.client.objects.files), [(bucket, name)])
+
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
+  def test_file_write_parallel_composite_unaligned_writes(self, *unused_args):
+    gcsio.BatchApiRequest = FakeBatchApiRequest
+    file_name = 'gs://gcsio-test/composite_file'
+    part_size = 1024
+    contents = os.urandom(5 * part_size + 100)
+    uploader = gcsio.GcsParallelComposeUploader(
+        self.client,
+        file_name,
+        'application/octet-stream',
+        self.gcs.get_project_number,
+        part_size=part_size)
+    # Writes that straddle part boundaries.
+    for i in range(0, len(contents), 700):
+      uploader.put(memoryview(contents[i:i + 700]))
+    uploader.finish()
+    bucket, name = gcsio.parse_gcs_path(file_name)
+    self.assertEqual(
+        self.client.objects.get_file(bucket, name).contents, contents)
+    self.assertEqual(list(self.client.objects.files), [(bucket, name)])
+
+  @mock.patch('apache_beam.io.gcp.gcsio.BatchApiRequest')
+  def test_file_write_parallel_composite_single_part(self, *unused_args):
+    gcsio.BatchApiRequest = FakeBatchApiRequest
+    file_name = 'gs://gcsio-test/composite_small_file'
+    contents = os.urandom(1024)
+    with mock.patch.object(gcsio, 'GcsUploader',
+                           wraps=gcsio.GcsUploader) as mock_uploader, \
+        mock.patch.object(FakeGcsObjects, 'Compose') as mock_compose:
+      with self.gcs.open(file_name, 'w', parallel_composite_upload=True) as f:
+        f.write(contents)
+    bucket, name = gcsio.parse_gcs_path(file_name)
+    self.assertEqual(
+        self.client.objects.get_file(bucket, name).contents, contents)
+    self.assertEqual(list(self.client.objects.files), [(bucket, name)])
+    # A file smaller than a part is uploaded to the destination as usual.
+    mock_uploader.assert_called_once_with(
+        self.client,
+        file_name,
+        'application/octet-stream',
+        self.gcs.get_project_number)
+    mock_compose.assert_not_called()
+
+  def test_file_write_parallel_composite_part_failure(self):
+    file_name = 'gs://gcsio-test/composite_file'
+    part_size = 1024
+    uploader = gcsio.GcsParallelComposeUploader(
+        self.client,
+        file_name,
+        'application/octet-stream',
+        self.gcs.get_project_number,
+        part_size=part_size,
+        max_concurrency=1)
+    error = IOError('part failed')
+    with mock.patch.object(gcsio.GcsParallelComposeUploader,
+                           '_upload_part',
+                           side_effect=error) as mock_upload_part:
+      uploader.put(memoryview(os.urandom(part_size)))
+      # The next part waits for the failed one, and reports its error.
+      with self.assertRaises(IOError):
+        uploader.put(memoryview(os.urandom(part_size)))
+    mock_upload_part.assert_called_once()
+
   def test_file_close(self):
     file_name = 'gs://gcsio-test/close_file'
     file_size = 5 * 1024 * 1024 + 2000
@@ -896,6 +1215,34 @@ class TestGCSIO(unittest.TestCase):
 
     self.assertEqual(metric_value, 2)
 
+  @mock.patch.object(FakeGcsBuckets, 'Get')
+  def test_get_project_number_caches_failure(self, mock_get):
+    mock_get.side_effect = HttpError({'status': 403}, None, None)
+    self.assertIsNone(self.gcs.get_project_number('gcsio-test'))
+    self.assertIsNone(gcsio.GcsIO(self.client).get_project_number('gcsio-test'))
+    self.assertEqual(mock_get.call_count, 1)
+
+  @mock.patch.object(FakeGcsBuckets, 'Get')
+  def test_get_project_number_retries_transient_failure(self, mock_get):
+    mock_get.side_effect = [
+        HttpError({'status': 503}, None, None),
+        storage.Bucket(name='gcsio-test', projectNumber=DEFAULT_PROJECT_NUMBER)
+    ]
+    self.assertIsNone(self.gcs.get_project_number('gcsio-test'))
+    self.assertEqual(
+        DEFAULT_PROJECT_NUMBER, self.gcs.get_project_number('gcsio-test'))
+
+  def test_get_project_number_shared_across_instances(self):
+    with mock.patch.object(FakeGcsBuckets,
+                           'Get',
+                           autospec=True,
+                           side_effect=FakeGcsBuckets.Get) as mock_get:
+      for _ in range(3):
+        self.assertEqual(
+            DEFAULT_PROJECT_NUMBER,
+            gcsio.GcsIO(self.client).get_project_number('gcsio-test'))
+    self.assertEqual(mock_get.call_count, 1)
+
   def test_downloader_fail_non_existent_object(self):
     file_name = 'gs://gcsio-metrics-test/dummy_mode_file'
     with self.assertRaises(IOError):
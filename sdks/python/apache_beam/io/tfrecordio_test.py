@@ -129,6 +129,25 @@ class TestTFRecordUtil(unittest.TestCase):
         _TFRecordUtil._masked_crc32c(
             b'\x03\x00\x00\x00\x00\x00\x00\x00', crc32c_fn=crc32c_fn))
 
+  def test_masked_crc32c_google_crc32c(self):
+    try:
+      import google_crc32c
+    except ImportError:
+      raise unittest.SkipTest('google-crc32c is not installed')
+    crc32c_fn = google_crc32c.value
+    self.assertEqual(
+        0xfd7fffa,
+        _TFRecordUtil._masked_crc32c(b'\x00' * 32, crc32c_fn=crc32c_fn))
+    self.assertEqual(
+        0xf909b029,
+        _TFRecordUtil._masked_crc32c(b'\xff' * 32, crc32c_fn=crc32c_fn))
+    self.assertEqual(
+        0xfebe8a61, _TFRecordUtil._masked_crc32c(b'foo', crc32c_fn=crc32c_fn))
+    self.assertEqual(
+        0xe4999b0,
+        _TFRecordUtil._masked_crc32c(
+            b'\x03\x00\x00\x00\x00\x00\x00\x00', crc32c_fn=crc32c_fn))
+
   def test_write_record(self):
     file_handle = io.BytesIO()
     _TFRecordUtil.write_record(file_handle, b'foo')
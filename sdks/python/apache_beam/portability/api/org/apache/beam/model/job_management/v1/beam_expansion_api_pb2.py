@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: org/apache/beam/model/job_management/v1/beam_expansion_api.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ...pipeline.v1 import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+from ...pipeline.v1 import schema_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_schema__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n@org/apache/beam/model/job_management/v1/beam_expansion_api.proto\x12\"org.apache.beam.model.expansion.v1\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x1a.org/apache/beam/model/pipeline/v1/schema.proto\"\xd4\x02\n\x10\x45xpansionRequest\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x11\n\tnamespace\x18\x03 \x01(\t\x12l\n\x15output_coder_requests\x18\x04 \x03(\x0b\x32M.org.apache.beam.model.expansion.v1.ExpansionRequest.OutputCoderRequestsEntry\x1a:\n\x18OutputCoderRequestsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xbd\x01\n\x11\x45xpansionResponse\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12@\n\ttransform\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform\x12\x14\n\x0crequirements\x18\x03 \x03(\t\x12\r\n\x05\x65rror\x18\n \x01(\t\" \n\x1e\x44iscoverSchemaTransformRequest\"\x9c\x01\n\x15SchemaTransformConfig\x12@\n\rconfig_schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x1f\n\x17input_pcollection_names\x18\x02 \x03(\t\x12 \n\x18output_pcollection_names\x18\x03 \x03(\t\"\xae\x02\n\x1f\x44iscoverSchemaTransformResponse\x12\x81\x01\n\x18schema_transform_configs\x18\x01 \x03(\x0b\x32_.org.apache.beam.model.expansion.v1.DiscoverSchemaTransformResponse.SchemaTransformConfigsEntry\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x1ax\n\x1bSchemaTransformConfigsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12H\n\x05value\x18\x02 \x01(\x0b\x32\x39.org.apache.beam.model.expansion.v1.SchemaTransformConfig:\x02\x38\x01\x32\xae\x02\n\x10\x45xpansionService\x12u\n\x06\x45xpand\x12\x34.org.apache.beam.model.expansion.v1.ExpansionRequest\x1a\x35.org.apache.beam.model.expansion.v1.ExpansionResponse\x12\xa2\x01\n\x17\x44iscoverSchemaTransform\x12\x42.org.apache.beam.model.expansion.v1.DiscoverSchemaTransformRequest\x1a\x43.org.apache.beam.model.expansion.v1.DiscoverSchemaTransformResponseB\x86\x01\n\"org.apache.beam.model.expansion.v1B\x0c\x45xpansionApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3')
+
+
+
+_EXPANSIONREQUEST = DESCRIPTOR.message_types_by_name['ExpansionRequest']
+_EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY = _EXPANSIONREQUEST.nested_types_by_name['OutputCoderRequestsEntry']
+_EXPANSIONRESPONSE = DESCRIPTOR.message_types_by_name['ExpansionResponse']
+_DISCOVERSCHEMATRANSFORMREQUEST = DESCRIPTOR.message_types_by_name['DiscoverSchemaTransformRequest']
+_SCHEMATRANSFORMCONFIG = DESCRIPTOR.message_types_by_name['SchemaTransformConfig']
+_DISCOVERSCHEMATRANSFORMRESPONSE = DESCRIPTOR.message_types_by_name['DiscoverSchemaTransformResponse']
+_DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY = _DISCOVERSCHEMATRANSFORMRESPONSE.nested_types_by_name['SchemaTransformConfigsEntry']
+ExpansionRequest = _reflection.GeneratedProtocolMessageType('ExpansionRequest', (_message.Message,), {
+
+  'OutputCoderRequestsEntry' : _reflection.GeneratedProtocolMessageType('OutputCoderRequestsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY,
+    '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionRequest.OutputCoderRequestsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _EXPANSIONREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionRequest)
+  })
+_sym_db.RegisterMessage(ExpansionRequest)
+_sym_db.RegisterMessage(ExpansionRequest.OutputCoderRequestsEntry)
+
+ExpansionResponse = _reflection.GeneratedProtocolMessageType('ExpansionResponse', (_message.Message,), {
+  'DESCRIPTOR' : _EXPANSIONRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.ExpansionResponse)
+  })
+_sym_db.RegisterMessage(ExpansionResponse)
+
+DiscoverSchemaTransformRequest = _reflection.GeneratedProtocolMessageType('DiscoverSchemaTransformRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DISCOVERSCHEMATRANSFORMREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.DiscoverSchemaTransformRequest)
+  })
+_sym_db.RegisterMessage(DiscoverSchemaTransformRequest)
+
+SchemaTransformConfig = _reflection.GeneratedProtocolMessageType('SchemaTransformConfig', (_message.Message,), {
+  'DESCRIPTOR' : _SCHEMATRANSFORMCONFIG,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.SchemaTransformConfig)
+  })
+_sym_db.RegisterMessage(SchemaTransformConfig)
+
+DiscoverSchemaTransformResponse = _reflection.GeneratedProtocolMessageType('DiscoverSchemaTransformResponse', (_message.Message,), {
+
+  'SchemaTransformConfigsEntry' : _reflection.GeneratedProtocolMessageType('SchemaTransformConfigsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY,
+    '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.DiscoverSchemaTransformResponse.SchemaTransformConfigsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _DISCOVERSCHEMATRANSFORMRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_expansion_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.expansion.v1.DiscoverSchemaTransformResponse)
+  })
+_sym_db.RegisterMessage(DiscoverSchemaTransformResponse)
+_sym_db.RegisterMessage(DiscoverSchemaTransformResponse.SchemaTransformConfigsEntry)
+
+_EXPANSIONSERVICE = DESCRIPTOR.services_by_name['ExpansionService']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n\"org.apache.beam.model.expansion.v1B\014ExpansionApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1'
+  _EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY._options = None
+  _EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY._serialized_options = b'8\001'
+  _DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY._options = None
+  _DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY._serialized_options = b'8\001'
+  _EXPANSIONREQUEST._serialized_start=210
+  _EXPANSIONREQUEST._serialized_end=550
+  _EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY._serialized_start=492
+  _EXPANSIONREQUEST_OUTPUTCODERREQUESTSENTRY._serialized_end=550
+  _EXPANSIONRESPONSE._serialized_start=553
+  _EXPANSIONRESPONSE._serialized_end=742
+  _DISCOVERSCHEMATRANSFORMREQUEST._serialized_start=744
+  _DISCOVERSCHEMATRANSFORMREQUEST._serialized_end=776
+  _SCHEMATRANSFORMCONFIG._serialized_start=779
+  _SCHEMATRANSFORMCONFIG._serialized_end=935
+  _DISCOVERSCHEMATRANSFORMRESPONSE._serialized_start=938
+  _DISCOVERSCHEMATRANSFORMRESPONSE._serialized_end=1240
+  _DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY._serialized_start=1120
+  _DISCOVERSCHEMATRANSFORMRESPONSE_SCHEMATRANSFORMCONFIGSENTRY._serialized_end=1240
+  _EXPANSIONSERVICE._serialized_start=1243
+  _EXPANSIONSERVICE._serialized_end=1545
+# @@protoc_insertion_point(module_scope)
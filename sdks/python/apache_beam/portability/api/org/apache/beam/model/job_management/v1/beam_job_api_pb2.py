@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: org/apache/beam/model/job_management/v1/beam_job_api.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from ...pipeline.v1 import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+from ...pipeline.v1 import endpoints_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_endpoints__pb2
+from ...pipeline.v1 import metrics_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_metrics__pb2
+from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n:org/apache/beam/model/job_management/v1/beam_job_api.proto\x12\'org.apache.beam.model.job_management.v1\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x1a\x31org/apache/beam/model/pipeline/v1/endpoints.proto\x1a/org/apache/beam/model/pipeline/v1/metrics.proto\x1a\x1cgoogle/protobuf/struct.proto\x1a\x1fgoogle/protobuf/timestamp.proto\"\x97\x01\n\x11PrepareJobRequest\x12=\n\x08pipeline\x18\x01 \x01(\x0b\x32+.org.apache.beam.model.pipeline.v1.Pipeline\x12\x31\n\x10pipeline_options\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x10\n\x08job_name\x18\x03 \x01(\t\"\xa7\x01\n\x12PrepareJobResponse\x12\x16\n\x0epreparation_id\x18\x01 \x01(\t\x12Z\n\x19\x61rtifact_staging_endpoint\x18\x02 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12\x1d\n\x15staging_session_token\x18\x03 \x01(\t\"@\n\rRunJobRequest\x12\x16\n\x0epreparation_id\x18\x01 \x01(\t\x12\x17\n\x0fretrieval_token\x18\x02 \x01(\t\" \n\x0eRunJobResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\"\n\x10\x43\x61ncelJobRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"Z\n\x11\x43\x61ncelJobResponse\x12\x45\n\x05state\x18\x01 \x01(\x0e\x32\x36.org.apache.beam.model.job_management.v1.JobState.Enum\"\xa5\x01\n\x07JobInfo\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x10\n\x08job_name\x18\x02 \x01(\t\x12\x31\n\x10pipeline_options\x18\x03 \x01(\x0b\x32\x17.google.protobuf.Struct\x12\x45\n\x05state\x18\x04 \x01(\x0e\x32\x36.org.apache.beam.model.job_management.v1.JobState.Enum\"\x10\n\x0eGetJobsRequest\"U\n\x0fGetJobsResponse\x12\x42\n\x08job_info\x18\x01 \x03(\x0b\x32\x30.org.apache.beam.model.job_management.v1.JobInfo\"$\n\x12GetJobStateRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\x85\x01\n\rJobStateEvent\x12\x45\n\x05state\x18\x01 \x01(\x0e\x32\x36.org.apache.beam.model.job_management.v1.JobState.Enum\x12-\n\ttimestamp\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\'\n\x15GetJobPipelineRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"W\n\x16GetJobPipelineResponse\x12=\n\x08pipeline\x18\x01 \x01(\x0b\x32+.org.apache.beam.model.pipeline.v1.Pipeline\"$\n\x12JobMessagesRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"\xd1\x02\n\nJobMessage\x12\x12\n\nmessage_id\x18\x01 \x01(\t\x12\x0c\n\x04time\x18\x02 \x01(\t\x12Y\n\nimportance\x18\x03 \x01(\x0e\x32\x45.org.apache.beam.model.job_management.v1.JobMessage.MessageImportance\x12\x14\n\x0cmessage_text\x18\x04 \x01(\t\"\xaf\x01\n\x11MessageImportance\x12\"\n\x1eMESSAGE_IMPORTANCE_UNSPECIFIED\x10\x00\x12\x15\n\x11JOB_MESSAGE_DEBUG\x10\x01\x12\x18\n\x14JOB_MESSAGE_DETAILED\x10\x02\x12\x15\n\x11JOB_MESSAGE_BASIC\x10\x03\x12\x17\n\x13JOB_MESSAGE_WARNING\x10\x04\x12\x15\n\x11JOB_MESSAGE_ERROR\x10\x05\"\xc4\x01\n\x13JobMessagesResponse\x12O\n\x10message_response\x18\x01 \x01(\x0b\x32\x33.org.apache.beam.model.job_management.v1.JobMessageH\x00\x12P\n\x0estate_response\x18\x02 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.JobStateEventH\x00\x42\n\n\x08response\"\xb7\x01\n\x08JobState\"\xaa\x01\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0b\n\x07STOPPED\x10\x01\x12\x0b\n\x07RUNNING\x10\x02\x12\x08\n\x04\x44ONE\x10\x03\x12\n\n\x06\x46\x41ILED\x10\x04\x12\r\n\tCANCELLED\x10\x05\x12\x0b\n\x07UPDATED\x10\x06\x12\x0c\n\x08\x44RAINING\x10\x07\x12\x0b\n\x07\x44RAINED\x10\x08\x12\x0c\n\x08STARTING\x10\t\x12\x0e\n\nCANCELLING\x10\n\x12\x0c\n\x08UPDATING\x10\x0b\"&\n\x14GetJobMetricsRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t\"`\n\x15GetJobMetricsResponse\x12G\n\x07metrics\x18\x01 \x01(\x0b\x32\x36.org.apache.beam.model.job_management.v1.MetricResults\"\x9b\x01\n\rMetricResults\x12\x44\n\tattempted\x18\x01 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\x12\x44\n\tcommitted\x18\x02 \x03(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.MonitoringInfo\" \n\x1e\x44\x65scribePipelineOptionsRequest\"e\n\x12PipelineOptionType\"O\n\x04\x45num\x12\n\n\x06STRING\x10\x00\x12\x0b\n\x07\x42OOLEAN\x10\x01\x12\x0b\n\x07INTEGER\x10\x02\x12\n\n\x06NUMBER\x10\x03\x12\t\n\x05\x41RRAY\x10\x04\x12\n\n\x06OBJECT\x10\x05\"\xb3\x01\n\x18PipelineOptionDescriptor\x12\x0c\n\x04name\x18\x01 \x01(\t\x12N\n\x04type\x18\x02 \x01(\x0e\x32@.org.apache.beam.model.job_management.v1.PipelineOptionType.Enum\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x15\n\rdefault_value\x18\x04 \x01(\t\x12\r\n\x05group\x18\x05 \x01(\t\"u\n\x1f\x44\x65scribePipelineOptionsResponse\x12R\n\x07options\x18\x01 \x03(\x0b\x32\x41.org.apache.beam.model.job_management.v1.PipelineOptionDescriptor2\xf6\n\n\nJobService\x12\x82\x01\n\x07Prepare\x12:.org.apache.beam.model.job_management.v1.PrepareJobRequest\x1a;.org.apache.beam.model.job_management.v1.PrepareJobResponse\x12v\n\x03Run\x12\x36.org.apache.beam.model.job_management.v1.RunJobRequest\x1a\x37.org.apache.beam.model.job_management.v1.RunJobResponse\x12|\n\x07GetJobs\x12\x37.org.apache.beam.model.job_management.v1.GetJobsRequest\x1a\x38.org.apache.beam.model.job_management.v1.GetJobsResponse\x12\x7f\n\x08GetState\x12;.org.apache.beam.model.job_management.v1.GetJobStateRequest\x1a\x36.org.apache.beam.model.job_management.v1.JobStateEvent\x12\x8e\x01\n\x0bGetPipeline\x12>.org.apache.beam.model.job_management.v1.GetJobPipelineRequest\x1a?.org.apache.beam.model.job_management.v1.GetJobPipelineResponse\x12\x7f\n\x06\x43\x61ncel\x12\x39.org.apache.beam.model.job_management.v1.CancelJobRequest\x1a:.org.apache.beam.model.job_management.v1.CancelJobResponse\x12\x87\x01\n\x0eGetStateStream\x12;.org.apache.beam.model.job_management.v1.GetJobStateRequest\x1a\x36.org.apache.beam.model.job_management.v1.JobStateEvent0\x01\x12\x8f\x01\n\x10GetMessageStream\x12;.org.apache.beam.model.job_management.v1.JobMessagesRequest\x1a<.org.apache.beam.model.job_management.v1.JobMessagesResponse0\x01\x12\x8e\x01\n\rGetJobMetrics\x12=.org.apache.beam.model.job_management.v1.GetJobMetricsRequest\x1a>.org.apache.beam.model.job_management.v1.GetJobMetricsResponse\x12\xac\x01\n\x17\x44\x65scribePipelineOptions\x12G.org.apache.beam.model.job_management.v1.DescribePipelineOptionsRequest\x1aH.org.apache.beam.model.job_management.v1.DescribePipelineOptionsResponseB\x84\x01\n&org.apache.beam.model.jobmanagement.v1B\x06JobApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1b\x06proto3')
+
+
+
+_PREPAREJOBREQUEST = DESCRIPTOR.message_types_by_name['PrepareJobRequest']
+_PREPAREJOBRESPONSE = DESCRIPTOR.message_types_by_name['PrepareJobResponse']
+_RUNJOBREQUEST = DESCRIPTOR.message_types_by_name['RunJobRequest']
+_RUNJOBRESPONSE = DESCRIPTOR.message_types_by_name['RunJobResponse']
+_CANCELJOBREQUEST = DESCRIPTOR.message_types_by_name['CancelJobRequest']
+_CANCELJOBRESPONSE = DESCRIPTOR.message_types_by_name['CancelJobResponse']
+_JOBINFO = DESCRIPTOR.message_types_by_name['JobInfo']
+_GETJOBSREQUEST = DESCRIPTOR.message_types_by_name['GetJobsRequest']
+_GETJOBSRESPONSE = DESCRIPTOR.message_types_by_name['GetJobsResponse']
+_GETJOBSTATEREQUEST = DESCRIPTOR.message_types_by_name['GetJobStateRequest']
+_JOBSTATEEVENT = DESCRIPTOR.message_types_by_name['JobStateEvent']
+_GETJOBPIPELINEREQUEST = DESCRIPTOR.message_types_by_name['GetJobPipelineRequest']
+_GETJOBPIPELINERESPONSE = DESCRIPTOR.message_types_by_name['GetJobPipelineResponse']
+_JOBMESSAGESREQUEST = DESCRIPTOR.message_types_by_name['JobMessagesRequest']
+_JOBMESSAGE = DESCRIPTOR.message_types_by_name['JobMessage']
+_JOBMESSAGESRESPONSE = DESCRIPTOR.message_types_by_name['JobMessagesResponse']
+_JOBSTATE = DESCRIPTOR.message_types_by_name['JobState']
+_GETJOBMETRICSREQUEST = DESCRIPTOR.message_types_by_name['GetJobMetricsRequest']
+_GETJOBMETRICSRESPONSE = DESCRIPTOR.message_types_by_name['GetJobMetricsResponse']
+_METRICRESULTS = DESCRIPTOR.message_types_by_name['MetricResults']
+_DESCRIBEPIPELINEOPTIONSREQUEST = DESCRIPTOR.message_types_by_name['DescribePipelineOptionsRequest']
+_PIPELINEOPTIONTYPE = DESCRIPTOR.message_types_by_name['PipelineOptionType']
+_PIPELINEOPTIONDESCRIPTOR = DESCRIPTOR.message_types_by_name['PipelineOptionDescriptor']
+_DESCRIBEPIPELINEOPTIONSRESPONSE = DESCRIPTOR.message_types_by_name['DescribePipelineOptionsResponse']
+_JOBMESSAGE_MESSAGEIMPORTANCE = _JOBMESSAGE.enum_types_by_name['MessageImportance']
+_JOBSTATE_ENUM = _JOBSTATE.enum_types_by_name['Enum']
+_PIPELINEOPTIONTYPE_ENUM = _PIPELINEOPTIONTYPE.enum_types_by_name['Enum']
+PrepareJobRequest = _reflection.GeneratedProtocolMessageType('PrepareJobRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PREPAREJOBREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PrepareJobRequest)
+  })
+_sym_db.RegisterMessage(PrepareJobRequest)
+
+PrepareJobResponse = _reflection.GeneratedProtocolMessageType('PrepareJobResponse', (_message.Message,), {
+  'DESCRIPTOR' : _PREPAREJOBRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PrepareJobResponse)
+  })
+_sym_db.RegisterMessage(PrepareJobResponse)
+
+RunJobRequest = _reflection.GeneratedProtocolMessageType('RunJobRequest', (_message.Message,), {
+  'DESCRIPTOR' : _RUNJOBREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.RunJobRequest)
+  })
+_sym_db.RegisterMessage(RunJobRequest)
+
+RunJobResponse = _reflection.GeneratedProtocolMessageType('RunJobResponse', (_message.Message,), {
+  'DESCRIPTOR' : _RUNJOBRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.RunJobResponse)
+  })
+_sym_db.RegisterMessage(RunJobResponse)
+
+CancelJobRequest = _reflection.GeneratedProtocolMessageType('CancelJobRequest', (_message.Message,), {
+  'DESCRIPTOR' : _CANCELJOBREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CancelJobRequest)
+  })
+_sym_db.RegisterMessage(CancelJobRequest)
+
+CancelJobResponse = _reflection.GeneratedProtocolMessageType('CancelJobResponse', (_message.Message,), {
+  'DESCRIPTOR' : _CANCELJOBRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.CancelJobResponse)
+  })
+_sym_db.RegisterMessage(CancelJobResponse)
+
+JobInfo = _reflection.GeneratedProtocolMessageType('JobInfo', (_message.Message,), {
+  'DESCRIPTOR' : _JOBINFO,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobInfo)
+  })
+_sym_db.RegisterMessage(JobInfo)
+
+GetJobsRequest = _reflection.GeneratedProtocolMessageType('GetJobsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBSREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobsRequest)
+  })
+_sym_db.RegisterMessage(GetJobsRequest)
+
+GetJobsResponse = _reflection.GeneratedProtocolMessageType('GetJobsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBSRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobsResponse)
+  })
+_sym_db.RegisterMessage(GetJobsResponse)
+
+GetJobStateRequest = _reflection.GeneratedProtocolMessageType('GetJobStateRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBSTATEREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobStateRequest)
+  })
+_sym_db.RegisterMessage(GetJobStateRequest)
+
+JobStateEvent = _reflection.GeneratedProtocolMessageType('JobStateEvent', (_message.Message,), {
+  'DESCRIPTOR' : _JOBSTATEEVENT,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobStateEvent)
+  })
+_sym_db.RegisterMessage(JobStateEvent)
+
+GetJobPipelineRequest = _reflection.GeneratedProtocolMessageType('GetJobPipelineRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBPIPELINEREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobPipelineRequest)
+  })
+_sym_db.RegisterMessage(GetJobPipelineRequest)
+
+GetJobPipelineResponse = _reflection.GeneratedProtocolMessageType('GetJobPipelineResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBPIPELINERESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobPipelineResponse)
+  })
+_sym_db.RegisterMessage(GetJobPipelineResponse)
+
+JobMessagesRequest = _reflection.GeneratedProtocolMessageType('JobMessagesRequest', (_message.Message,), {
+  'DESCRIPTOR' : _JOBMESSAGESREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobMessagesRequest)
+  })
+_sym_db.RegisterMessage(JobMessagesRequest)
+
+JobMessage = _reflection.GeneratedProtocolMessageType('JobMessage', (_message.Message,), {
+  'DESCRIPTOR' : _JOBMESSAGE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobMessage)
+  })
+_sym_db.RegisterMessage(JobMessage)
+
+JobMessagesResponse = _reflection.GeneratedProtocolMessageType('JobMessagesResponse', (_message.Message,), {
+  'DESCRIPTOR' : _JOBMESSAGESRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobMessagesResponse)
+  })
+_sym_db.RegisterMessage(JobMessagesResponse)
+
+JobState = _reflection.GeneratedProtocolMessageType('JobState', (_message.Message,), {
+  'DESCRIPTOR' : _JOBSTATE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.JobState)
+  })
+_sym_db.RegisterMessage(JobState)
+
+GetJobMetricsRequest = _reflection.GeneratedProtocolMessageType('GetJobMetricsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBMETRICSREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobMetricsRequest)
+  })
+_sym_db.RegisterMessage(GetJobMetricsRequest)
+
+GetJobMetricsResponse = _reflection.GeneratedProtocolMessageType('GetJobMetricsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETJOBMETRICSRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.GetJobMetricsResponse)
+  })
+_sym_db.RegisterMessage(GetJobMetricsResponse)
+
+MetricResults = _reflection.GeneratedProtocolMessageType('MetricResults', (_message.Message,), {
+  'DESCRIPTOR' : _METRICRESULTS,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.MetricResults)
+  })
+_sym_db.RegisterMessage(MetricResults)
+
+DescribePipelineOptionsRequest = _reflection.GeneratedProtocolMessageType('DescribePipelineOptionsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DESCRIBEPIPELINEOPTIONSREQUEST,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.DescribePipelineOptionsRequest)
+  })
+_sym_db.RegisterMessage(DescribePipelineOptionsRequest)
+
+PipelineOptionType = _reflection.GeneratedProtocolMessageType('PipelineOptionType', (_message.Message,), {
+  'DESCRIPTOR' : _PIPELINEOPTIONTYPE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PipelineOptionType)
+  })
+_sym_db.RegisterMessage(PipelineOptionType)
+
+PipelineOptionDescriptor = _reflection.GeneratedProtocolMessageType('PipelineOptionDescriptor', (_message.Message,), {
+  'DESCRIPTOR' : _PIPELINEOPTIONDESCRIPTOR,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.PipelineOptionDescriptor)
+  })
+_sym_db.RegisterMessage(PipelineOptionDescriptor)
+
+DescribePipelineOptionsResponse = _reflection.GeneratedProtocolMessageType('DescribePipelineOptionsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _DESCRIBEPIPELINEOPTIONSRESPONSE,
+  '__module__' : 'org.apache.beam.model.job_management.v1.beam_job_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.job_management.v1.DescribePipelineOptionsResponse)
+  })
+_sym_db.RegisterMessage(DescribePipelineOptionsResponse)
+
+_JOBSERVICE = DESCRIPTOR.services_by_name['JobService']
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n&org.apache.beam.model.jobmanagement.v1B\006JobApiZRgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/jobmanagement_v1;jobmanagement_v1'
+  _PREPAREJOBREQUEST._serialized_start=324
+  _PREPAREJOBREQUEST._serialized_end=475
+  _PREPAREJOBRESPONSE._serialized_start=478
+  _PREPAREJOBRESPONSE._serialized_end=645
+  _RUNJOBREQUEST._serialized_start=647
+  _RUNJOBREQUEST._serialized_end=711
+  _RUNJOBRESPONSE._serialized_start=713
+  _RUNJOBRESPONSE._serialized_end=745
+  _CANCELJOBREQUEST._serialized_start=747
+  _CANCELJOBREQUEST._serialized_end=781
+  _CANCELJOBRESPONSE._serialized_start=783
+  _CANCELJOBRESPONSE._serialized_end=873
+  _JOBINFO._serialized_start=876
+  _JOBINFO._serialized_end=1041
+  _GETJOBSREQUEST._serialized_start=1043
+  _GETJOBSREQUEST._serialized_end=1059
+  _GETJOBSRESPONSE._serialized_start=1061
+  _GETJOBSRESPONSE._serialized_end=1146
+  _GETJOBSTATEREQUEST._serialized_start=1148
+  _GETJOBSTATEREQUEST._serialized_end=1184
+  _JOBSTATEEVENT._serialized_start=1187
+  _JOBSTATEEVENT._serialized_end=1320
+  _GETJOBPIPELINEREQUEST._serialized_start=1322
+  _GETJOBPIPELINEREQUEST._serialized_end=1361
+  _GETJOBPIPELINERESPONSE._serialized_start=1363
+  _GETJOBPIPELINERESPONSE._serialized_end=1450
+  _JOBMESSAGESREQUEST._serialized_start=1452
+  _JOBMESSAGESREQUEST._serialized_end=1488
+  _JOBMESSAGE._serialized_start=1491
+  _JOBMESSAGE._serialized_end=1828
+  _JOBMESSAGE_MESSAGEIMPORTANCE._serialized_start=1653
+  _JOBMESSAGE_MESSAGEIMPORTANCE._serialized_end=1828
+  _JOBMESSAGESRESPONSE._serialized_start=1831
+  _JOBMESSAGESRESPONSE._serialized_end=2027
+  _JOBSTATE._serialized_start=2030
+  _JOBSTATE._serialized_end=2213
+  _JOBSTATE_ENUM._serialized_start=2043
+  _JOBSTATE_ENUM._serialized_end=2213
+  _GETJOBMETRICSREQUEST._serialized_start=2215
+  _GETJOBMETRICSREQUEST._serialized_end=2253
+  _GETJOBMETRICSRESPONSE._serialized_start=2255
+  _GETJOBMETRICSRESPONSE._serialized_end=2351
+  _METRICRESULTS._serialized_start=2354
+  _METRICRESULTS._serialized_end=2509
+  _DESCRIBEPIPELINEOPTIONSREQUEST._serialized_start=2511
+  _DESCRIBEPIPELINEOPTIONSREQUEST._serialized_end=2543
+  _PIPELINEOPTIONTYPE._serialized_start=2545
+  _PIPELINEOPTIONTYPE._serialized_end=2646
+  _PIPELINEOPTIONTYPE_ENUM._serialized_start=2567
+  _PIPELINEOPTIONTYPE_ENUM._serialized_end=2646
+  _PIPELINEOPTIONDESCRIPTOR._serialized_start=2649
+  _PIPELINEOPTIONDESCRIPTOR._serialized_end=2828
+  _DESCRIBEPIPELINEOPTIONSRESPONSE._serialized_start=2830
+  _DESCRIBEPIPELINEOPTIONSRESPONSE._serialized_end=2947
+  _JOBSERVICE._serialized_start=2950
+  _JOBSERVICE._serialized_end=4348
+# @@protoc_insertion_point(module_scope)
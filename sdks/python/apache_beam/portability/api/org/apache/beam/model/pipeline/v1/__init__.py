@@ -0,0 +1,33 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one or more
+# contributor license agreements.  See the NOTICE file distributed with
+# this work for additional information regarding copyright ownership.
+# The ASF licenses this file to You under the Apache License, Version 2.0
+# (the "License"); you may not use this file except in compliance with
+# the License.  You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from . import beam_runner_api_pb2_grpc
+from . import schema_pb2_urns
+from . import standard_window_fns_pb2_grpc
+from . import external_transforms_pb2_grpc
+from . import metrics_pb2_grpc
+from . import schema_pb2_grpc
+from . import metrics_pb2_urns
+from . import external_transforms_pb2
+from . import beam_runner_api_pb2
+from . import schema_pb2
+from . import endpoints_pb2_grpc
+from . import external_transforms_pb2_urns
+from . import metrics_pb2
+from . import beam_runner_api_pb2_urns
+from . import standard_window_fns_pb2
+from . import endpoints_pb2
+from . import standard_window_fns_pb2_urns
@@ -0,0 +1,1372 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: org/apache/beam/model/pipeline/v1/beam_runner_api.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import endpoints_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_endpoints__pb2
+from google.protobuf import descriptor_pb2 as google_dot_protobuf_dot_descriptor__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n7org/apache/beam/model/pipeline/v1/beam_runner_api.proto\x12!org.apache.beam.model.pipeline.v1\x1a\x31org/apache/beam/model/pipeline/v1/endpoints.proto\x1a google/protobuf/descriptor.proto\"\xc2\x01\n\rBeamConstants\"\xb0\x01\n\tConstants\x12\x31\n\x14MIN_TIMESTAMP_MILLIS\x10\x00\x1a\x17\xaa\xb4\xfa\xc2\x05\x11-9223372036854775\x12\x30\n\x14MAX_TIMESTAMP_MILLIS\x10\x01\x1a\x16\xaa\xb4\xfa\xc2\x05\x10\x39\x32\x32\x33\x33\x37\x32\x30\x33\x36\x38\x35\x34\x37\x37\x35\x12>\n\"GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS\x10\x02\x1a\x16\xaa\xb4\xfa\xc2\x05\x10\x39\x32\x32\x33\x33\x37\x31\x39\x35\x30\x34\x35\x34\x37\x37\x35\"\xb5\x07\n\nComponents\x12Q\n\ntransforms\x18\x01 \x03(\x0b\x32=.org.apache.beam.model.pipeline.v1.Components.TransformsEntry\x12U\n\x0cpcollections\x18\x02 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry\x12\x64\n\x14windowing_strategies\x18\x03 \x03(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry\x12I\n\x06\x63oders\x18\x04 \x03(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.Components.CodersEntry\x12U\n\x0c\x65nvironments\x18\x05 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry\x1a`\n\x0fTransformsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12<\n\x05value\x18\x02 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransform:\x02\x38\x01\x1a\x63\n\x11PcollectionsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollection:\x02\x38\x01\x1ap\n\x18WindowingStrategiesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x43\n\x05value\x18\x02 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategy:\x02\x38\x01\x1aW\n\x0b\x43odersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x37\n\x05value\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.Coder:\x02\x38\x01\x1a\x63\n\x11\x45nvironmentsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12=\n\x05value\x18\x02 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment:\x02\x38\x01\"\xc5\x01\n\x08Pipeline\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12\x1a\n\x12root_transform_ids\x18\x02 \x03(\t\x12\x44\n\x0c\x64isplay_data\x18\x03 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x14\n\x0crequirements\x18\x04 \x03(\t\"\xd5\x04\n\nPTransform\x12\x13\n\x0bunique_name\x18\x05 \x01(\t\x12=\n\x04spec\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x15\n\rsubtransforms\x18\x02 \x03(\t\x12I\n\x06inputs\x18\x03 \x03(\x0b\x32\x39.org.apache.beam.model.pipeline.v1.PTransform.InputsEntry\x12K\n\x07outputs\x18\x04 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry\x12\x44\n\x0c\x64isplay_data\x18\x06 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x16\n\x0e\x65nvironment_id\x18\x07 \x01(\t\x12S\n\x0b\x61nnotations\x18\x08 \x03(\x0b\x32>.org.apache.beam.model.pipeline.v1.PTransform.AnnotationsEntry\x1a-\n\x0bInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a.\n\x0cOutputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\x1a\x32\n\x10\x41nnotationsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01\"\xc5\x10\n\x13StandardPTransforms\"\xdb\x03\n\nPrimitives\x12)\n\x06PAR_DO\x10\x00\x1a\x1d\xa2\xb4\xfa\xc2\x05\x17\x62\x65\x61m:transform:pardo:v1\x12,\n\x07\x46LATTEN\x10\x01\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:transform:flatten:v1\x12\x36\n\x0cGROUP_BY_KEY\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:group_by_key:v1\x12,\n\x07IMPULSE\x10\x03\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:transform:impulse:v1\x12\x37\n\x0e\x41SSIGN_WINDOWS\x10\x04\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:window_into:v1\x12\x33\n\x0bTEST_STREAM\x10\x05\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:transform:teststream:v1\x12\x34\n\x0bMAP_WINDOWS\x10\x06\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:map_windows:v1\x12\x38\n\rMERGE_WINDOWS\x10\x07\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:transform:merge_windows:v1\x12\x30\n\tTO_STRING\x10\x08\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:transform:to_string:v1\"t\n\x14\x44\x65precatedPrimitives\x12&\n\x04READ\x10\x00\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:transform:read:v1\x12\x34\n\x0b\x43REATE_VIEW\x10\x01\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:create_view:v1\"\x81\x04\n\nComposites\x12<\n\x0f\x43OMBINE_PER_KEY\x10\x00\x1a\'\xa2\xb4\xfa\xc2\x05!beam:transform:combine_per_key:v1\x12>\n\x10\x43OMBINE_GLOBALLY\x10\x01\x1a(\xa2\xb4\xfa\xc2\x05\"beam:transform:combine_globally:v1\x12\x30\n\tRESHUFFLE\x10\x02\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:transform:reshuffle:v1\x12\x34\n\x0bWRITE_FILES\x10\x03\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:write_files:v1\x12\x34\n\x0bPUBSUB_READ\x10\x04\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:transform:pubsub_read:v1\x12\x36\n\x0cPUBSUB_WRITE\x10\x05\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:pubsub_write:v1\x12\x39\n\x0fPUBSUB_WRITE_V2\x10\x07\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:transform:pubsub_write:v2\x12\x64\n#GROUP_INTO_BATCHES_WITH_SHARDED_KEY\x10\x06\x1a;\xa2\xb4\xfa\xc2\x05\x35\x62\x65\x61m:transform:group_into_batches_with_sharded_key:v1\"\xe3\x03\n\x11\x43ombineComponents\x12R\n\x1a\x43OMBINE_PER_KEY_PRECOMBINE\x10\x00\x1a\x32\xa2\xb4\xfa\xc2\x05,beam:transform:combine_per_key_precombine:v1\x12\x62\n\"COMBINE_PER_KEY_MERGE_ACCUMULATORS\x10\x01\x1a:\xa2\xb4\xfa\xc2\x05\x34\x62\x65\x61m:transform:combine_per_key_merge_accumulators:v1\x12\\\n\x1f\x43OMBINE_PER_KEY_EXTRACT_OUTPUTS\x10\x02\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:combine_per_key_extract_outputs:v1\x12J\n\x16\x43OMBINE_GROUPED_VALUES\x10\x03\x1a.\xa2\xb4\xfa\xc2\x05(beam:transform:combine_grouped_values:v1\x12l\n\'COMBINE_PER_KEY_CONVERT_TO_ACCUMULATORS\x10\x04\x1a?\xa2\xb4\xfa\xc2\x05\x39\x62\x65\x61m:transform:combine_per_key_convert_to_accumulators:v1\"\x8d\x03\n\x19SplittableParDoComponents\x12L\n\x15PAIR_WITH_RESTRICTION\x10\x00\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:transform:sdf_pair_with_restriction:v1\x12X\n\x1bSPLIT_AND_SIZE_RESTRICTIONS\x10\x01\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:sdf_split_and_size_restrictions:v1\x12o\n\'PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS\x10\x02\x1a\x42\xa2\xb4\xfa\xc2\x05<beam:transform:sdf_process_sized_element_and_restrictions:v1\x12W\n\x1aTRUNCATE_SIZED_RESTRICTION\x10\x03\x1a\x37\xa2\xb4\xfa\xc2\x05\x31\x62\x65\x61m:transform:sdf_truncate_sized_restrictions:v1\"`\n\x1aGroupIntoBatchesComponents\x12\x42\n\x12GROUP_INTO_BATCHES\x10\x00\x1a*\xa2\xb4\xfa\xc2\x05$beam:transform:group_into_batches:v1\"\x82\x01\n\x16StandardSideInputTypes\"h\n\x04\x45num\x12/\n\x08ITERABLE\x10\x00\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:side_input:iterable:v1\x12/\n\x08MULTIMAP\x10\x01\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:side_input:multimap:v1\"x\n\x16StandardUserStateTypes\"^\n\x04\x45num\x12%\n\x03\x42\x41G\x10\x00\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:user_state:bag:v1\x12/\n\x08MULTIMAP\x10\x01\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:user_state:multimap:v1\"\xe0\x01\n\x0bPCollection\x12\x13\n\x0bunique_name\x18\x01 \x01(\t\x12\x10\n\x08\x63oder_id\x18\x02 \x01(\t\x12\x45\n\nis_bounded\x18\x03 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\x12\x1d\n\x15windowing_strategy_id\x18\x04 \x01(\t\x12\x44\n\x0c\x64isplay_data\x18\x05 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\"\xc2\x06\n\x0cParDoPayload\x12>\n\x05\x64o_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12T\n\x0bside_inputs\x18\x03 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry\x12T\n\x0bstate_specs\x18\x04 \x03(\x0b\x32?.org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry\x12\x61\n\x12timer_family_specs\x18\t \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry\x12\x1c\n\x14restriction_coder_id\x18\x07 \x01(\t\x12\x1d\n\x15requests_finalization\x18\x08 \x01(\x08\x12\"\n\x1arequires_time_sorted_input\x18\n \x01(\x08\x12\x1d\n\x15requires_stable_input\x18\x0b \x01(\x08\x12.\n&on_window_expiration_timer_family_spec\x18\x0c \x01(\t\x1a_\n\x0fSideInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInput:\x02\x38\x01\x1a_\n\x0fStateSpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.StateSpec:\x02\x38\x01\x1ak\n\x15TimerFamilySpecsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x41\n\x05value\x18\x02 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.TimerFamilySpec:\x02\x38\x01J\x04\x08\x06\x10\x07\"\xab\x04\n\tStateSpec\x12]\n\x16read_modify_write_spec\x18\x01 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpecH\x00\x12\x43\n\x08\x62\x61g_spec\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.BagStateSpecH\x00\x12O\n\x0e\x63ombining_spec\x18\x03 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.CombiningStateSpecH\x00\x12\x43\n\x08map_spec\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.MapStateSpecH\x00\x12\x43\n\x08set_spec\x18\x05 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.SetStateSpecH\x00\x12T\n\x11ordered_list_spec\x18\x06 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.OrderedListStateSpecH\x00\x12\x41\n\x08protocol\x18\x07 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpecB\x06\n\x04spec\",\n\x18ReadModifyWriteStateSpec\x12\x10\n\x08\x63oder_id\x18\x01 \x01(\t\"(\n\x0c\x42\x61gStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"0\n\x14OrderedListStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"w\n\x12\x43ombiningStateSpec\x12\x1c\n\x14\x61\x63\x63umulator_coder_id\x18\x01 \x01(\t\x12\x43\n\ncombine_fn\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"<\n\x0cMapStateSpec\x12\x14\n\x0ckey_coder_id\x18\x01 \x01(\t\x12\x16\n\x0evalue_coder_id\x18\x02 \x01(\t\"(\n\x0cSetStateSpec\x12\x18\n\x10\x65lement_coder_id\x18\x01 \x01(\t\"y\n\x0fTimerFamilySpec\x12G\n\x0btime_domain\x18\x01 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.TimeDomain.Enum\x12\x1d\n\x15timer_family_coder_id\x18\x02 \x01(\t\"@\n\tIsBounded\"3\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\r\n\tUNBOUNDED\x10\x01\x12\x0b\n\x07\x42OUNDED\x10\x02\"\x95\x01\n\x0bReadPayload\x12?\n\x06source\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x45\n\nis_bounded\x18\x02 \x01(\x0e\x32\x31.org.apache.beam.model.pipeline.v1.IsBounded.Enum\"W\n\x11WindowIntoPayload\x12\x42\n\twindow_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"s\n\x0e\x43ombinePayload\x12\x43\n\ncombine_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x1c\n\x14\x61\x63\x63umulator_coder_id\x18\x02 \x01(\t\"\xaf\x06\n\x11TestStreamPayload\x12\x10\n\x08\x63oder_id\x18\x01 \x01(\t\x12J\n\x06\x65vents\x18\x02 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\x12I\n\x08\x65ndpoint\x18\x03 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x1a\xae\x04\n\x05\x45vent\x12\x66\n\x0fwatermark_event\x18\x01 \x01(\x0b\x32K.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermarkH\x00\x12q\n\x15processing_time_event\x18\x02 \x01(\x0b\x32P.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTimeH\x00\x12_\n\relement_event\x18\x03 \x01(\x0b\x32\x46.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElementsH\x00\x1a\x36\n\x10\x41\x64vanceWatermark\x12\x15\n\rnew_watermark\x18\x01 \x01(\x03\x12\x0b\n\x03tag\x18\x02 \x01(\t\x1a\x31\n\x15\x41\x64vanceProcessingTime\x12\x18\n\x10\x61\x64vance_duration\x18\x01 \x01(\x03\x1au\n\x0b\x41\x64\x64\x45lements\x12Y\n\x08\x65lements\x18\x01 \x03(\x0b\x32G.org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement\x12\x0b\n\x03tag\x18\x03 \x01(\tB\x07\n\x05\x65vent\x1a@\n\x12TimestampedElement\x12\x17\n\x0f\x65ncoded_element\x18\x01 \x01(\x0c\x12\x11\n\ttimestamp\x18\x02 \x01(\x03\"#\n\rEventsRequest\x12\x12\n\noutput_ids\x18\x01 \x03(\t\"\x95\x03\n\x11WriteFilesPayload\x12=\n\x04sink\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12H\n\x0f\x66ormat_function\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x17\n\x0fwindowed_writes\x18\x03 \x01(\x08\x12\"\n\x1arunner_determined_sharding\x18\x04 \x01(\x08\x12Y\n\x0bside_inputs\x18\x05 \x03(\x0b\x32\x44.org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry\x1a_\n\x0fSideInputsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12;\n\x05value\x18\x02 \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInput:\x02\x38\x01\"\xcf\x01\n\x11PubSubReadPayload\x12\r\n\x05topic\x18\x01 \x01(\t\x12\x14\n\x0csubscription\x18\x02 \x01(\t\x12\x1b\n\x13timestamp_attribute\x18\x03 \x01(\t\x12\x14\n\x0cid_attribute\x18\x04 \x01(\t\x12\x17\n\x0fwith_attributes\x18\x05 \x01(\x08\x12 \n\x18topic_runtime_overridden\x18\x06 \x01(\t\x12\'\n\x1fsubscription_runtime_overridden\x18\x07 \x01(\t\"x\n\x12PubSubWritePayload\x12\r\n\x05topic\x18\x01 \x01(\t\x12\x1b\n\x13timestamp_attribute\x18\x02 \x01(\t\x12\x14\n\x0cid_attribute\x18\x03 \x01(\t\x12 \n\x18topic_runtime_overridden\x18\x04 \x01(\t\"n\n\x17GroupIntoBatchesPayload\x12\x12\n\nbatch_size\x18\x01 \x01(\x03\x12\x18\n\x10\x62\x61tch_size_bytes\x18\x03 \x01(\x03\x12%\n\x1dmax_buffering_duration_millis\x18\x02 \x01(\x03\"c\n\x05\x43oder\x12=\n\x04spec\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12\x1b\n\x13\x63omponent_coder_ids\x18\x02 \x03(\t\"\xf5\x06\n\x0eStandardCoders\"\xe2\x06\n\x04\x45num\x12$\n\x05\x42YTES\x10\x00\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:coder:bytes:v1\x12\x30\n\x0bSTRING_UTF8\x10\n\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:coder:string_utf8:v1\x12\x1e\n\x02KV\x10\x01\x1a\x16\xa2\xb4\xfa\xc2\x05\x10\x62\x65\x61m:coder:kv:v1\x12\"\n\x04\x42OOL\x10\x0c\x1a\x18\xa2\xb4\xfa\xc2\x05\x12\x62\x65\x61m:coder:bool:v1\x12&\n\x06VARINT\x10\x02\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:varint:v1\x12&\n\x06\x44OUBLE\x10\x0b\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:coder:double:v1\x12*\n\x08ITERABLE\x10\x03\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:coder:iterable:v1\x12$\n\x05TIMER\x10\x04\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:coder:timer:v1\x12\x38\n\x0fINTERVAL_WINDOW\x10\x05\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:coder:interval_window:v1\x12\x34\n\rLENGTH_PREFIX\x10\x06\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:length_prefix:v1\x12\x34\n\rGLOBAL_WINDOW\x10\x07\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:global_window:v1\x12\x36\n\x0eWINDOWED_VALUE\x10\x08\x1a\"\xa2\xb4\xfa\xc2\x05\x1c\x62\x65\x61m:coder:windowed_value:v1\x12\x42\n\x14PARAM_WINDOWED_VALUE\x10\x0e\x1a(\xa2\xb4\xfa\xc2\x05\"beam:coder:param_windowed_value:v1\x12\x44\n\x15STATE_BACKED_ITERABLE\x10\t\x1a)\xa2\xb4\xfa\xc2\x05#beam:coder:state_backed_iterable:v1\x12\x34\n\rCUSTOM_WINDOW\x10\x10\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:coder:custom_window:v1\x12 \n\x03ROW\x10\r\x1a\x17\xa2\xb4\xfa\xc2\x05\x11\x62\x65\x61m:coder:row:v1\x12\x30\n\x0bSHARDED_KEY\x10\x0f\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:coder:sharded_key:v1\x12*\n\x08NULLABLE\x10\x11\x1a\x1c\xa2\xb4\xfa\xc2\x05\x16\x62\x65\x61m:coder:nullable:v1\"\x8c\x05\n\x11WindowingStrategy\x12\x42\n\twindow_fn\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12I\n\x0cmerge_status\x18\x02 \x01(\x0e\x32\x33.org.apache.beam.model.pipeline.v1.MergeStatus.Enum\x12\x17\n\x0fwindow_coder_id\x18\x03 \x01(\t\x12;\n\x07trigger\x18\x04 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12S\n\x11\x61\x63\x63umulation_mode\x18\x05 \x01(\x0e\x32\x38.org.apache.beam.model.pipeline.v1.AccumulationMode.Enum\x12G\n\x0boutput_time\x18\x06 \x01(\x0e\x32\x32.org.apache.beam.model.pipeline.v1.OutputTime.Enum\x12Q\n\x10\x63losing_behavior\x18\x07 \x01(\x0e\x32\x37.org.apache.beam.model.pipeline.v1.ClosingBehavior.Enum\x12\x18\n\x10\x61llowed_lateness\x18\x08 \x01(\x03\x12P\n\x10on_time_behavior\x18\t \x01(\x0e\x32\x36.org.apache.beam.model.pipeline.v1.OnTimeBehavior.Enum\x12\x1d\n\x15\x61ssigns_to_one_window\x18\n \x01(\x08\x12\x16\n\x0e\x65nvironment_id\x18\x0b \x01(\t\"\\\n\x0bMergeStatus\"M\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0bNON_MERGING\x10\x01\x12\x0f\n\x0bNEEDS_MERGE\x10\x02\x12\x12\n\x0e\x41LREADY_MERGED\x10\x03\"]\n\x10\x41\x63\x63umulationMode\"I\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0e\n\nDISCARDING\x10\x01\x12\x10\n\x0c\x41\x43\x43UMULATING\x10\x02\x12\x0e\n\nRETRACTING\x10\x03\"Q\n\x0f\x43losingBehavior\">\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0b\x45MIT_ALWAYS\x10\x01\x12\x14\n\x10\x45MIT_IF_NONEMPTY\x10\x02\"P\n\x0eOnTimeBehavior\">\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0f\n\x0b\x46IRE_ALWAYS\x10\x01\x12\x14\n\x10\x46IRE_IF_NONEMPTY\x10\x02\"b\n\nOutputTime\"T\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x11\n\rEND_OF_WINDOW\x10\x01\x12\x12\n\x0eLATEST_IN_PANE\x10\x02\x12\x14\n\x10\x45\x41RLIEST_IN_PANE\x10\x03\"n\n\nTimeDomain\"`\n\x04\x45num\x12\x0f\n\x0bUNSPECIFIED\x10\x00\x12\x0e\n\nEVENT_TIME\x10\x01\x12\x13\n\x0fPROCESSING_TIME\x10\x02\"\x04\x08\x03\x10\x03*\x1cSYNCHRONIZED_PROCESSING_TIME\"\x82\x0e\n\x07Trigger\x12H\n\tafter_all\x18\x01 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.Trigger.AfterAllH\x00\x12H\n\tafter_any\x18\x02 \x01(\x0b\x32\x33.org.apache.beam.model.pipeline.v1.Trigger.AfterAnyH\x00\x12J\n\nafter_each\x18\x03 \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.Trigger.AfterEachH\x00\x12Z\n\x13\x61\x66ter_end_of_window\x18\x04 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindowH\x00\x12_\n\x15\x61\x66ter_processing_time\x18\x05 \x01(\x0b\x32>.org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTimeH\x00\x12x\n\"after_synchronized_processing_time\x18\x06 \x01(\x0b\x32J.org.apache.beam.model.pipeline.v1.Trigger.AfterSynchronizedProcessingTimeH\x00\x12\x43\n\x06\x61lways\x18\x0c \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.Trigger.AlwaysH\x00\x12\x45\n\x07\x64\x65\x66\x61ult\x18\x07 \x01(\x0b\x32\x32.org.apache.beam.model.pipeline.v1.Trigger.DefaultH\x00\x12P\n\relement_count\x18\x08 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.Trigger.ElementCountH\x00\x12\x41\n\x05never\x18\t \x01(\x0b\x32\x30.org.apache.beam.model.pipeline.v1.Trigger.NeverH\x00\x12J\n\nor_finally\x18\n \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.Trigger.OrFinallyH\x00\x12\x43\n\x06repeat\x18\x0b \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.Trigger.RepeatH\x00\x1aK\n\x08\x41\x66terAll\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aK\n\x08\x41\x66terAny\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aL\n\tAfterEach\x12?\n\x0bsubtriggers\x18\x01 \x03(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1a\x97\x01\n\x10\x41\x66terEndOfWindow\x12\x41\n\rearly_firings\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12@\n\x0clate_firings\x18\x02 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aj\n\x13\x41\x66terProcessingTime\x12S\n\x14timestamp_transforms\x18\x01 \x03(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.TimestampTransform\x1a!\n\x1f\x41\x66terSynchronizedProcessingTime\x1a\t\n\x07\x44\x65\x66\x61ult\x1a%\n\x0c\x45lementCount\x12\x15\n\relement_count\x18\x01 \x01(\x05\x1a\x07\n\x05Never\x1a\x08\n\x06\x41lways\x1a\x82\x01\n\tOrFinally\x12\x38\n\x04main\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x12;\n\x07\x66inally\x18\x02 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.Trigger\x1aH\n\x06Repeat\x12>\n\nsubtrigger\x18\x01 \x01(\x0b\x32*.org.apache.beam.model.pipeline.v1.TriggerB\t\n\x07trigger\"\x96\x02\n\x12TimestampTransform\x12L\n\x05\x64\x65lay\x18\x01 \x01(\x0b\x32;.org.apache.beam.model.pipeline.v1.TimestampTransform.DelayH\x00\x12Q\n\x08\x61lign_to\x18\x02 \x01(\x0b\x32=.org.apache.beam.model.pipeline.v1.TimestampTransform.AlignToH\x00\x1a\x1d\n\x05\x44\x65lay\x12\x14\n\x0c\x64\x65lay_millis\x18\x01 \x01(\x03\x1a)\n\x07\x41lignTo\x12\x0e\n\x06period\x18\x03 \x01(\x03\x12\x0e\n\x06offset\x18\x04 \x01(\x03\x42\x15\n\x13timestamp_transform\"\xe2\x01\n\tSideInput\x12G\n\x0e\x61\x63\x63\x65ss_pattern\x18\x01 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12@\n\x07view_fn\x18\x02 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\x12J\n\x11window_mapping_fn\x18\x03 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpec\"\x89\x04\n\x11StandardArtifacts\"\x9f\x02\n\x05Types\x12*\n\x04\x46ILE\x10\x00\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:artifact:type:file:v1\x12(\n\x03URL\x10\x01\x1a\x1f\xa2\xb4\xfa\xc2\x05\x19\x62\x65\x61m:artifact:type:url:v1\x12\x32\n\x08\x45MBEDDED\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:artifact:type:embedded:v1\x12*\n\x04PYPI\x10\x03\x1a \xa2\xb4\xfa\xc2\x05\x1a\x62\x65\x61m:artifact:type:pypi:v1\x12,\n\x05MAVEN\x10\x04\x1a!\xa2\xb4\xfa\xc2\x05\x1b\x62\x65\x61m:artifact:type:maven:v1\x12\x32\n\x08\x44\x45\x46\x45RRED\x10\x05\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:artifact:type:deferred:v1\"\xd1\x01\n\x05Roles\x12\x36\n\nSTAGING_TO\x10\x00\x1a&\xa2\xb4\xfa\xc2\x05 beam:artifact:role:staging_to:v1\x12L\n\x15PIP_REQUIREMENTS_FILE\x10\x01\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:artifact:role:pip_requirements_file:v1\x12\x42\n\x10GO_WORKER_BINARY\x10\x02\x1a,\xa2\xb4\xfa\xc2\x05&beam:artifact:role:go_worker_binary:v1\"3\n\x13\x41rtifactFilePayload\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\t\"1\n\x12\x41rtifactUrlPayload\x12\x0b\n\x03url\x18\x01 \x01(\t\x12\x0e\n\x06sha256\x18\x02 \x01(\t\"#\n\x13\x45mbeddedFilePayload\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\"3\n\x0bPyPIPayload\x12\x13\n\x0b\x61rtifact_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\"8\n\x0cMavenPayload\x12\x10\n\x08\x61rtifact\x18\x01 \x01(\t\x12\x16\n\x0erepository_url\x18\x02 \x01(\t\"4\n\x17\x44\x65\x66\x65rredArtifactPayload\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"3\n\x1c\x41rtifactStagingToRolePayload\x12\x13\n\x0bstaged_name\x18\x01 \x01(\t\"e\n\x13\x41rtifactInformation\x12\x10\n\x08type_urn\x18\x01 \x01(\t\x12\x14\n\x0ctype_payload\x18\x02 \x01(\x0c\x12\x10\n\x08role_urn\x18\x03 \x01(\t\x12\x14\n\x0crole_payload\x18\x04 \x01(\x0c\"\xec\x02\n\x0b\x45nvironment\x12\x0b\n\x03urn\x18\x02 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\x12\x44\n\x0c\x64isplay_data\x18\x04 \x03(\x0b\x32..org.apache.beam.model.pipeline.v1.DisplayData\x12\x14\n\x0c\x63\x61pabilities\x18\x05 \x03(\t\x12L\n\x0c\x64\x65pendencies\x18\x06 \x03(\x0b\x32\x36.org.apache.beam.model.pipeline.v1.ArtifactInformation\x12Y\n\x0eresource_hints\x18\x07 \x03(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.Environment.ResourceHintsEntry\x1a\x34\n\x12ResourceHintsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x0c:\x02\x38\x01J\x04\x08\x01\x10\x02\"\xc7\x01\n\x14StandardEnvironments\"\xae\x01\n\x0c\x45nvironments\x12$\n\x06\x44OCKER\x10\x00\x1a\x18\xa2\xb4\xfa\xc2\x05\x12\x62\x65\x61m:env:docker:v1\x12&\n\x07PROCESS\x10\x01\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:env:process:v1\x12(\n\x08\x45XTERNAL\x10\x02\x1a\x1a\xa2\xb4\xfa\xc2\x05\x14\x62\x65\x61m:env:external:v1\x12&\n\x07\x44\x45\x46\x41ULT\x10\x03\x1a\x19\xa2\xb4\xfa\xc2\x05\x13\x62\x65\x61m:env:default:v1\"(\n\rDockerPayload\x12\x17\n\x0f\x63ontainer_image\x18\x01 \x01(\t\"\xb0\x01\n\x0eProcessPayload\x12\n\n\x02os\x18\x01 \x01(\t\x12\x0c\n\x04\x61rch\x18\x02 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x03 \x01(\t\x12G\n\x03\x65nv\x18\x04 \x03(\x0b\x32:.org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry\x1a*\n\x08\x45nvEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xdb\x01\n\x0f\x45xternalPayload\x12I\n\x08\x65ndpoint\x18\x01 \x01(\x0b\x32\x37.org.apache.beam.model.pipeline.v1.ApiServiceDescriptor\x12N\n\x06params\x18\x02 \x03(\x0b\x32>.org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry\x1a-\n\x0bParamsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xe1\x04\n\x11StandardProtocols\"\xcb\x04\n\x04\x45num\x12H\n\x19LEGACY_PROGRESS_REPORTING\x10\x00\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:progress_reporting:v0\x12\x41\n\x12PROGRESS_REPORTING\x10\x01\x1a)\xa2\xb4\xfa\xc2\x05#beam:protocol:progress_reporting:v1\x12\x37\n\rWORKER_STATUS\x10\x02\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:protocol:worker_status:v1\x12U\n\x1cMULTI_CORE_BUNDLE_PROCESSING\x10\x03\x1a\x33\xa2\xb4\xfa\xc2\x05-beam:protocol:multi_core_bundle_processing:v1\x12;\n\x0fSIBLING_WORKERS\x10\x05\x1a&\xa2\xb4\xfa\xc2\x05 beam:protocol:sibling_workers:v1\x12M\n\x18HARNESS_MONITORING_INFOS\x10\x04\x1a/\xa2\xb4\xfa\xc2\x05)beam:protocol:harness_monitoring_infos:v1\x12\x61\n\"CONTROL_REQUEST_ELEMENTS_EMBEDDING\x10\x06\x1a\x39\xa2\xb4\xfa\xc2\x05\x33\x62\x65\x61m:protocol:control_request_elements_embedding:v1\x12\x37\n\rSTATE_CACHING\x10\x07\x1a$\xa2\xb4\xfa\xc2\x05\x1e\x62\x65\x61m:protocol:state_caching:v1\"\xd8\x01\n\x17StandardRunnerProtocols\"\xbc\x01\n\x04\x45num\x12O\n\x19MONITORING_INFO_SHORT_IDS\x10\x00\x1a\x30\xa2\xb4\xfa\xc2\x05*beam:protocol:monitoring_info_short_ids:v1\x12\x63\n#CONTROL_RESPONSE_ELEMENTS_EMBEDDING\x10\x06\x1a:\xa2\xb4\xfa\xc2\x05\x34\x62\x65\x61m:protocol:control_response_elements_embedding:v1\"\xff\x03\n\x14StandardRequirements\"\xe6\x03\n\x04\x45num\x12J\n\x1cREQUIRES_STATEFUL_PROCESSING\x10\x00\x1a(\xa2\xb4\xfa\xc2\x05\"beam:requirement:pardo:stateful:v1\x12N\n\x1cREQUIRES_BUNDLE_FINALIZATION\x10\x01\x1a,\xa2\xb4\xfa\xc2\x05&beam:requirement:pardo:finalization:v1\x12G\n\x15REQUIRES_STABLE_INPUT\x10\x02\x1a,\xa2\xb4\xfa\xc2\x05&beam:requirement:pardo:stable_input:v1\x12Q\n\x1aREQUIRES_TIME_SORTED_INPUT\x10\x03\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:requirement:pardo:time_sorted_input:v1\x12M\n\x18REQUIRES_SPLITTABLE_DOFN\x10\x04\x1a/\xa2\xb4\xfa\xc2\x05)beam:requirement:pardo:splittable_dofn:v1\x12W\n\x1dREQUIRES_ON_WINDOW_EXPIRATION\x10\x05\x1a\x34\xa2\xb4\xfa\xc2\x05.beam:requirement:pardo:on_window_expiration:v1\",\n\x0c\x46unctionSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"W\n\x13StandardDisplayData\"@\n\x0b\x44isplayData\x12\x31\n\x08LABELLED\x10\x00\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:display_data:labelled:v1\"\xa4\x01\n\x0fLabelledPayload\x12\r\n\x05label\x18\x01 \x01(\t\x12\x16\n\x0cstring_value\x18\x02 \x01(\tH\x00\x12\x14\n\nbool_value\x18\x03 \x01(\x08H\x00\x12\x16\n\x0c\x64ouble_value\x18\x04 \x01(\x01H\x00\x12\x13\n\tint_value\x18\x05 \x01(\x03H\x00\x12\x0b\n\x03key\x18\x06 \x01(\t\x12\x11\n\tnamespace\x18\x07 \x01(\tB\x07\n\x05value\"+\n\x0b\x44isplayData\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"\xc1\x06\n\x15MessageWithComponents\x12\x41\n\ncomponents\x18\x01 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12\x39\n\x05\x63oder\x18\x02 \x01(\x0b\x32(.org.apache.beam.model.pipeline.v1.CoderH\x00\x12L\n\x0f\x63ombine_payload\x18\x03 \x01(\x0b\x32\x31.org.apache.beam.model.pipeline.v1.CombinePayloadH\x00\x12H\n\rfunction_spec\x18\x04 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.FunctionSpecH\x00\x12I\n\x0epar_do_payload\x18\x06 \x01(\x0b\x32/.org.apache.beam.model.pipeline.v1.ParDoPayloadH\x00\x12\x43\n\nptransform\x18\x07 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.PTransformH\x00\x12\x45\n\x0bpcollection\x18\x08 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.PCollectionH\x00\x12\x46\n\x0cread_payload\x18\t \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.ReadPayloadH\x00\x12\x42\n\nside_input\x18\x0b \x01(\x0b\x32,.org.apache.beam.model.pipeline.v1.SideInputH\x00\x12S\n\x13window_into_payload\x18\x0c \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowIntoPayloadH\x00\x12R\n\x12windowing_strategy\x18\r \x01(\x0b\x32\x34.org.apache.beam.model.pipeline.v1.WindowingStrategyH\x00\x42\x06\n\x04root\"\xb9\x08\n\x16\x45xecutableStagePayload\x12\x43\n\x0b\x65nvironment\x18\x01 \x01(\x0b\x32..org.apache.beam.model.pipeline.v1.Environment\x12g\n\x13wire_coder_settings\x18\t \x03(\x0b\x32J.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting\x12\r\n\x05input\x18\x02 \x01(\t\x12Z\n\x0bside_inputs\x18\x03 \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId\x12\x12\n\ntransforms\x18\x04 \x03(\t\x12\x0f\n\x07outputs\x18\x05 \x03(\t\x12\x41\n\ncomponents\x18\x06 \x01(\x0b\x32-.org.apache.beam.model.pipeline.v1.Components\x12Z\n\x0buser_states\x18\x07 \x03(\x0b\x32\x45.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId\x12Q\n\x06timers\x18\x08 \x03(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId\x12^\n\rtimerFamilies\x18\n \x03(\x0b\x32G.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId\x1a\x37\n\x0bSideInputId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x37\n\x0bUserStateId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x33\n\x07TimerId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\x39\n\rTimerFamilyId\x12\x14\n\x0ctransform_id\x18\x01 \x01(\t\x12\x12\n\nlocal_name\x18\x02 \x01(\t\x1a\xac\x01\n\x10WireCoderSetting\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x12\x1c\n\x12input_or_output_id\x18\x03 \x01(\tH\x00\x12R\n\x05timer\x18\x04 \x01(\x0b\x32\x41.org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerIdH\x00\x42\x08\n\x06target\"\x8f\x01\n\x15StandardResourceHints\"v\n\x04\x45num\x12\x34\n\x0b\x41\x43\x43\x45LERATOR\x10\x00\x1a#\xa2\xb4\xfa\xc2\x05\x1d\x62\x65\x61m:resources:accelerator:v1\x12\x38\n\rMIN_RAM_BYTES\x10\x01\x1a%\xa2\xb4\xfa\xc2\x05\x1f\x62\x65\x61m:resources:min_ram_bytes:v12\x8f\x01\n\x11TestStreamService\x12z\n\x06\x45vents\x12\x30.org.apache.beam.model.pipeline.v1.EventsRequest\x1a:.org.apache.beam.model.pipeline.v1.TestStreamPayload.Event\"\x00\x30\x01:6\n\x08\x62\x65\x61m_urn\x12!.google.protobuf.EnumValueOptions\x18\xc4\xa6\xafX \x01(\t:;\n\rbeam_constant\x12!.google.protobuf.EnumValueOptions\x18\xc5\xa6\xafX \x01(\tBx\n!org.apache.beam.model.pipeline.v1B\tRunnerApiZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+
+BEAM_URN_FIELD_NUMBER = 185324356
+beam_urn = DESCRIPTOR.extensions_by_name['beam_urn']
+BEAM_CONSTANT_FIELD_NUMBER = 185324357
+beam_constant = DESCRIPTOR.extensions_by_name['beam_constant']
+
+_BEAMCONSTANTS = DESCRIPTOR.message_types_by_name['BeamConstants']
+_COMPONENTS = DESCRIPTOR.message_types_by_name['Components']
+_COMPONENTS_TRANSFORMSENTRY = _COMPONENTS.nested_types_by_name['TransformsEntry']
+_COMPONENTS_PCOLLECTIONSENTRY = _COMPONENTS.nested_types_by_name['PcollectionsEntry']
+_COMPONENTS_WINDOWINGSTRATEGIESENTRY = _COMPONENTS.nested_types_by_name['WindowingStrategiesEntry']
+_COMPONENTS_CODERSENTRY = _COMPONENTS.nested_types_by_name['CodersEntry']
+_COMPONENTS_ENVIRONMENTSENTRY = _COMPONENTS.nested_types_by_name['EnvironmentsEntry']
+_PIPELINE = DESCRIPTOR.message_types_by_name['Pipeline']
+_PTRANSFORM = DESCRIPTOR.message_types_by_name['PTransform']
+_PTRANSFORM_INPUTSENTRY = _PTRANSFORM.nested_types_by_name['InputsEntry']
+_PTRANSFORM_OUTPUTSENTRY = _PTRANSFORM.nested_types_by_name['OutputsEntry']
+_PTRANSFORM_ANNOTATIONSENTRY = _PTRANSFORM.nested_types_by_name['AnnotationsEntry']
+_STANDARDPTRANSFORMS = DESCRIPTOR.message_types_by_name['StandardPTransforms']
+_STANDARDSIDEINPUTTYPES = DESCRIPTOR.message_types_by_name['StandardSideInputTypes']
+_STANDARDUSERSTATETYPES = DESCRIPTOR.message_types_by_name['StandardUserStateTypes']
+_PCOLLECTION = DESCRIPTOR.message_types_by_name['PCollection']
+_PARDOPAYLOAD = DESCRIPTOR.message_types_by_name['ParDoPayload']
+_PARDOPAYLOAD_SIDEINPUTSENTRY = _PARDOPAYLOAD.nested_types_by_name['SideInputsEntry']
+_PARDOPAYLOAD_STATESPECSENTRY = _PARDOPAYLOAD.nested_types_by_name['StateSpecsEntry']
+_PARDOPAYLOAD_TIMERFAMILYSPECSENTRY = _PARDOPAYLOAD.nested_types_by_name['TimerFamilySpecsEntry']
+_STATESPEC = DESCRIPTOR.message_types_by_name['StateSpec']
+_READMODIFYWRITESTATESPEC = DESCRIPTOR.message_types_by_name['ReadModifyWriteStateSpec']
+_BAGSTATESPEC = DESCRIPTOR.message_types_by_name['BagStateSpec']
+_ORDEREDLISTSTATESPEC = DESCRIPTOR.message_types_by_name['OrderedListStateSpec']
+_COMBININGSTATESPEC = DESCRIPTOR.message_types_by_name['CombiningStateSpec']
+_MAPSTATESPEC = DESCRIPTOR.message_types_by_name['MapStateSpec']
+_SETSTATESPEC = DESCRIPTOR.message_types_by_name['SetStateSpec']
+_TIMERFAMILYSPEC = DESCRIPTOR.message_types_by_name['TimerFamilySpec']
+_ISBOUNDED = DESCRIPTOR.message_types_by_name['IsBounded']
+_READPAYLOAD = DESCRIPTOR.message_types_by_name['ReadPayload']
+_WINDOWINTOPAYLOAD = DESCRIPTOR.message_types_by_name['WindowIntoPayload']
+_COMBINEPAYLOAD = DESCRIPTOR.message_types_by_name['CombinePayload']
+_TESTSTREAMPAYLOAD = DESCRIPTOR.message_types_by_name['TestStreamPayload']
+_TESTSTREAMPAYLOAD_EVENT = _TESTSTREAMPAYLOAD.nested_types_by_name['Event']
+_TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK = _TESTSTREAMPAYLOAD_EVENT.nested_types_by_name['AdvanceWatermark']
+_TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME = _TESTSTREAMPAYLOAD_EVENT.nested_types_by_name['AdvanceProcessingTime']
+_TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS = _TESTSTREAMPAYLOAD_EVENT.nested_types_by_name['AddElements']
+_TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT = _TESTSTREAMPAYLOAD.nested_types_by_name['TimestampedElement']
+_EVENTSREQUEST = DESCRIPTOR.message_types_by_name['EventsRequest']
+_WRITEFILESPAYLOAD = DESCRIPTOR.message_types_by_name['WriteFilesPayload']
+_WRITEFILESPAYLOAD_SIDEINPUTSENTRY = _WRITEFILESPAYLOAD.nested_types_by_name['SideInputsEntry']
+_PUBSUBREADPAYLOAD = DESCRIPTOR.message_types_by_name['PubSubReadPayload']
+_PUBSUBWRITEPAYLOAD = DESCRIPTOR.message_types_by_name['PubSubWritePayload']
+_GROUPINTOBATCHESPAYLOAD = DESCRIPTOR.message_types_by_name['GroupIntoBatchesPayload']
+_CODER = DESCRIPTOR.message_types_by_name['Coder']
+_STANDARDCODERS = DESCRIPTOR.message_types_by_name['StandardCoders']
+_WINDOWINGSTRATEGY = DESCRIPTOR.message_types_by_name['WindowingStrategy']
+_MERGESTATUS = DESCRIPTOR.message_types_by_name['MergeStatus']
+_ACCUMULATIONMODE = DESCRIPTOR.message_types_by_name['AccumulationMode']
+_CLOSINGBEHAVIOR = DESCRIPTOR.message_types_by_name['ClosingBehavior']
+_ONTIMEBEHAVIOR = DESCRIPTOR.message_types_by_name['OnTimeBehavior']
+_OUTPUTTIME = DESCRIPTOR.message_types_by_name['OutputTime']
+_TIMEDOMAIN = DESCRIPTOR.message_types_by_name['TimeDomain']
+_TRIGGER = DESCRIPTOR.message_types_by_name['Trigger']
+_TRIGGER_AFTERALL = _TRIGGER.nested_types_by_name['AfterAll']
+_TRIGGER_AFTERANY = _TRIGGER.nested_types_by_name['AfterAny']
+_TRIGGER_AFTEREACH = _TRIGGER.nested_types_by_name['AfterEach']
+_TRIGGER_AFTERENDOFWINDOW = _TRIGGER.nested_types_by_name['AfterEndOfWindow']
+_TRIGGER_AFTERPROCESSINGTIME = _TRIGGER.nested_types_by_name['AfterProcessingTime']
+_TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME = _TRIGGER.nested_types_by_name['AfterSynchronizedProcessingTime']
+_TRIGGER_DEFAULT = _TRIGGER.nested_types_by_name['Default']
+_TRIGGER_ELEMENTCOUNT = _TRIGGER.nested_types_by_name['ElementCount']
+_TRIGGER_NEVER = _TRIGGER.nested_types_by_name['Never']
+_TRIGGER_ALWAYS = _TRIGGER.nested_types_by_name['Always']
+_TRIGGER_ORFINALLY = _TRIGGER.nested_types_by_name['OrFinally']
+_TRIGGER_REPEAT = _TRIGGER.nested_types_by_name['Repeat']
+_TIMESTAMPTRANSFORM = DESCRIPTOR.message_types_by_name['TimestampTransform']
+_TIMESTAMPTRANSFORM_DELAY = _TIMESTAMPTRANSFORM.nested_types_by_name['Delay']
+_TIMESTAMPTRANSFORM_ALIGNTO = _TIMESTAMPTRANSFORM.nested_types_by_name['AlignTo']
+_SIDEINPUT = DESCRIPTOR.message_types_by_name['SideInput']
+_STANDARDARTIFACTS = DESCRIPTOR.message_types_by_name['StandardArtifacts']
+_ARTIFACTFILEPAYLOAD = DESCRIPTOR.message_types_by_name['ArtifactFilePayload']
+_ARTIFACTURLPAYLOAD = DESCRIPTOR.message_types_by_name['ArtifactUrlPayload']
+_EMBEDDEDFILEPAYLOAD = DESCRIPTOR.message_types_by_name['EmbeddedFilePayload']
+_PYPIPAYLOAD = DESCRIPTOR.message_types_by_name['PyPIPayload']
+_MAVENPAYLOAD = DESCRIPTOR.message_types_by_name['MavenPayload']
+_DEFERREDARTIFACTPAYLOAD = DESCRIPTOR.message_types_by_name['DeferredArtifactPayload']
+_ARTIFACTSTAGINGTOROLEPAYLOAD = DESCRIPTOR.message_types_by_name['ArtifactStagingToRolePayload']
+_ARTIFACTINFORMATION = DESCRIPTOR.message_types_by_name['ArtifactInformation']
+_ENVIRONMENT = DESCRIPTOR.message_types_by_name['Environment']
+_ENVIRONMENT_RESOURCEHINTSENTRY = _ENVIRONMENT.nested_types_by_name['ResourceHintsEntry']
+_STANDARDENVIRONMENTS = DESCRIPTOR.message_types_by_name['StandardEnvironments']
+_DOCKERPAYLOAD = DESCRIPTOR.message_types_by_name['DockerPayload']
+_PROCESSPAYLOAD = DESCRIPTOR.message_types_by_name['ProcessPayload']
+_PROCESSPAYLOAD_ENVENTRY = _PROCESSPAYLOAD.nested_types_by_name['EnvEntry']
+_EXTERNALPAYLOAD = DESCRIPTOR.message_types_by_name['ExternalPayload']
+_EXTERNALPAYLOAD_PARAMSENTRY = _EXTERNALPAYLOAD.nested_types_by_name['ParamsEntry']
+_STANDARDPROTOCOLS = DESCRIPTOR.message_types_by_name['StandardProtocols']
+_STANDARDRUNNERPROTOCOLS = DESCRIPTOR.message_types_by_name['StandardRunnerProtocols']
+_STANDARDREQUIREMENTS = DESCRIPTOR.message_types_by_name['StandardRequirements']
+_FUNCTIONSPEC = DESCRIPTOR.message_types_by_name['FunctionSpec']
+_STANDARDDISPLAYDATA = DESCRIPTOR.message_types_by_name['StandardDisplayData']
+_LABELLEDPAYLOAD = DESCRIPTOR.message_types_by_name['LabelledPayload']
+_DISPLAYDATA = DESCRIPTOR.message_types_by_name['DisplayData']
+_MESSAGEWITHCOMPONENTS = DESCRIPTOR.message_types_by_name['MessageWithComponents']
+_EXECUTABLESTAGEPAYLOAD = DESCRIPTOR.message_types_by_name['ExecutableStagePayload']
+_EXECUTABLESTAGEPAYLOAD_SIDEINPUTID = _EXECUTABLESTAGEPAYLOAD.nested_types_by_name['SideInputId']
+_EXECUTABLESTAGEPAYLOAD_USERSTATEID = _EXECUTABLESTAGEPAYLOAD.nested_types_by_name['UserStateId']
+_EXECUTABLESTAGEPAYLOAD_TIMERID = _EXECUTABLESTAGEPAYLOAD.nested_types_by_name['TimerId']
+_EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID = _EXECUTABLESTAGEPAYLOAD.nested_types_by_name['TimerFamilyId']
+_EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING = _EXECUTABLESTAGEPAYLOAD.nested_types_by_name['WireCoderSetting']
+_STANDARDRESOURCEHINTS = DESCRIPTOR.message_types_by_name['StandardResourceHints']
+_BEAMCONSTANTS_CONSTANTS = _BEAMCONSTANTS.enum_types_by_name['Constants']
+_STANDARDPTRANSFORMS_PRIMITIVES = _STANDARDPTRANSFORMS.enum_types_by_name['Primitives']
+_STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES = _STANDARDPTRANSFORMS.enum_types_by_name['DeprecatedPrimitives']
+_STANDARDPTRANSFORMS_COMPOSITES = _STANDARDPTRANSFORMS.enum_types_by_name['Composites']
+_STANDARDPTRANSFORMS_COMBINECOMPONENTS = _STANDARDPTRANSFORMS.enum_types_by_name['CombineComponents']
+_STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS = _STANDARDPTRANSFORMS.enum_types_by_name['SplittableParDoComponents']
+_STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS = _STANDARDPTRANSFORMS.enum_types_by_name['GroupIntoBatchesComponents']
+_STANDARDSIDEINPUTTYPES_ENUM = _STANDARDSIDEINPUTTYPES.enum_types_by_name['Enum']
+_STANDARDUSERSTATETYPES_ENUM = _STANDARDUSERSTATETYPES.enum_types_by_name['Enum']
+_ISBOUNDED_ENUM = _ISBOUNDED.enum_types_by_name['Enum']
+_STANDARDCODERS_ENUM = _STANDARDCODERS.enum_types_by_name['Enum']
+_MERGESTATUS_ENUM = _MERGESTATUS.enum_types_by_name['Enum']
+_ACCUMULATIONMODE_ENUM = _ACCUMULATIONMODE.enum_types_by_name['Enum']
+_CLOSINGBEHAVIOR_ENUM = _CLOSINGBEHAVIOR.enum_types_by_name['Enum']
+_ONTIMEBEHAVIOR_ENUM = _ONTIMEBEHAVIOR.enum_types_by_name['Enum']
+_OUTPUTTIME_ENUM = _OUTPUTTIME.enum_types_by_name['Enum']
+_TIMEDOMAIN_ENUM = _TIMEDOMAIN.enum_types_by_name['Enum']
+_STANDARDARTIFACTS_TYPES = _STANDARDARTIFACTS.enum_types_by_name['Types']
+_STANDARDARTIFACTS_ROLES = _STANDARDARTIFACTS.enum_types_by_name['Roles']
+_STANDARDENVIRONMENTS_ENVIRONMENTS = _STANDARDENVIRONMENTS.enum_types_by_name['Environments']
+_STANDARDPROTOCOLS_ENUM = _STANDARDPROTOCOLS.enum_types_by_name['Enum']
+_STANDARDRUNNERPROTOCOLS_ENUM = _STANDARDRUNNERPROTOCOLS.enum_types_by_name['Enum']
+_STANDARDREQUIREMENTS_ENUM = _STANDARDREQUIREMENTS.enum_types_by_name['Enum']
+_STANDARDDISPLAYDATA_DISPLAYDATA = _STANDARDDISPLAYDATA.enum_types_by_name['DisplayData']
+_STANDARDRESOURCEHINTS_ENUM = _STANDARDRESOURCEHINTS.enum_types_by_name['Enum']
+BeamConstants = _reflection.GeneratedProtocolMessageType('BeamConstants', (_message.Message,), {
+  'DESCRIPTOR' : _BEAMCONSTANTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.BeamConstants)
+  })
+_sym_db.RegisterMessage(BeamConstants)
+
+Components = _reflection.GeneratedProtocolMessageType('Components', (_message.Message,), {
+
+  'TransformsEntry' : _reflection.GeneratedProtocolMessageType('TransformsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _COMPONENTS_TRANSFORMSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.TransformsEntry)
+    })
+  ,
+
+  'PcollectionsEntry' : _reflection.GeneratedProtocolMessageType('PcollectionsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _COMPONENTS_PCOLLECTIONSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.PcollectionsEntry)
+    })
+  ,
+
+  'WindowingStrategiesEntry' : _reflection.GeneratedProtocolMessageType('WindowingStrategiesEntry', (_message.Message,), {
+    'DESCRIPTOR' : _COMPONENTS_WINDOWINGSTRATEGIESENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.WindowingStrategiesEntry)
+    })
+  ,
+
+  'CodersEntry' : _reflection.GeneratedProtocolMessageType('CodersEntry', (_message.Message,), {
+    'DESCRIPTOR' : _COMPONENTS_CODERSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.CodersEntry)
+    })
+  ,
+
+  'EnvironmentsEntry' : _reflection.GeneratedProtocolMessageType('EnvironmentsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _COMPONENTS_ENVIRONMENTSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components.EnvironmentsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _COMPONENTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Components)
+  })
+_sym_db.RegisterMessage(Components)
+_sym_db.RegisterMessage(Components.TransformsEntry)
+_sym_db.RegisterMessage(Components.PcollectionsEntry)
+_sym_db.RegisterMessage(Components.WindowingStrategiesEntry)
+_sym_db.RegisterMessage(Components.CodersEntry)
+_sym_db.RegisterMessage(Components.EnvironmentsEntry)
+
+Pipeline = _reflection.GeneratedProtocolMessageType('Pipeline', (_message.Message,), {
+  'DESCRIPTOR' : _PIPELINE,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Pipeline)
+  })
+_sym_db.RegisterMessage(Pipeline)
+
+PTransform = _reflection.GeneratedProtocolMessageType('PTransform', (_message.Message,), {
+
+  'InputsEntry' : _reflection.GeneratedProtocolMessageType('InputsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PTRANSFORM_INPUTSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform.InputsEntry)
+    })
+  ,
+
+  'OutputsEntry' : _reflection.GeneratedProtocolMessageType('OutputsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PTRANSFORM_OUTPUTSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform.OutputsEntry)
+    })
+  ,
+
+  'AnnotationsEntry' : _reflection.GeneratedProtocolMessageType('AnnotationsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PTRANSFORM_ANNOTATIONSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform.AnnotationsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PTRANSFORM,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PTransform)
+  })
+_sym_db.RegisterMessage(PTransform)
+_sym_db.RegisterMessage(PTransform.InputsEntry)
+_sym_db.RegisterMessage(PTransform.OutputsEntry)
+_sym_db.RegisterMessage(PTransform.AnnotationsEntry)
+
+StandardPTransforms = _reflection.GeneratedProtocolMessageType('StandardPTransforms', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDPTRANSFORMS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardPTransforms)
+  })
+_sym_db.RegisterMessage(StandardPTransforms)
+
+StandardSideInputTypes = _reflection.GeneratedProtocolMessageType('StandardSideInputTypes', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDSIDEINPUTTYPES,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardSideInputTypes)
+  })
+_sym_db.RegisterMessage(StandardSideInputTypes)
+
+StandardUserStateTypes = _reflection.GeneratedProtocolMessageType('StandardUserStateTypes', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDUSERSTATETYPES,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardUserStateTypes)
+  })
+_sym_db.RegisterMessage(StandardUserStateTypes)
+
+PCollection = _reflection.GeneratedProtocolMessageType('PCollection', (_message.Message,), {
+  'DESCRIPTOR' : _PCOLLECTION,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PCollection)
+  })
+_sym_db.RegisterMessage(PCollection)
+
+ParDoPayload = _reflection.GeneratedProtocolMessageType('ParDoPayload', (_message.Message,), {
+
+  'SideInputsEntry' : _reflection.GeneratedProtocolMessageType('SideInputsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PARDOPAYLOAD_SIDEINPUTSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.SideInputsEntry)
+    })
+  ,
+
+  'StateSpecsEntry' : _reflection.GeneratedProtocolMessageType('StateSpecsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PARDOPAYLOAD_STATESPECSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.StateSpecsEntry)
+    })
+  ,
+
+  'TimerFamilySpecsEntry' : _reflection.GeneratedProtocolMessageType('TimerFamilySpecsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload.TimerFamilySpecsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PARDOPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ParDoPayload)
+  })
+_sym_db.RegisterMessage(ParDoPayload)
+_sym_db.RegisterMessage(ParDoPayload.SideInputsEntry)
+_sym_db.RegisterMessage(ParDoPayload.StateSpecsEntry)
+_sym_db.RegisterMessage(ParDoPayload.TimerFamilySpecsEntry)
+
+StateSpec = _reflection.GeneratedProtocolMessageType('StateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _STATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StateSpec)
+  })
+_sym_db.RegisterMessage(StateSpec)
+
+ReadModifyWriteStateSpec = _reflection.GeneratedProtocolMessageType('ReadModifyWriteStateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _READMODIFYWRITESTATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ReadModifyWriteStateSpec)
+  })
+_sym_db.RegisterMessage(ReadModifyWriteStateSpec)
+
+BagStateSpec = _reflection.GeneratedProtocolMessageType('BagStateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _BAGSTATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.BagStateSpec)
+  })
+_sym_db.RegisterMessage(BagStateSpec)
+
+OrderedListStateSpec = _reflection.GeneratedProtocolMessageType('OrderedListStateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _ORDEREDLISTSTATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.OrderedListStateSpec)
+  })
+_sym_db.RegisterMessage(OrderedListStateSpec)
+
+CombiningStateSpec = _reflection.GeneratedProtocolMessageType('CombiningStateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _COMBININGSTATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.CombiningStateSpec)
+  })
+_sym_db.RegisterMessage(CombiningStateSpec)
+
+MapStateSpec = _reflection.GeneratedProtocolMessageType('MapStateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _MAPSTATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MapStateSpec)
+  })
+_sym_db.RegisterMessage(MapStateSpec)
+
+SetStateSpec = _reflection.GeneratedProtocolMessageType('SetStateSpec', (_message.Message,), {
+  'DESCRIPTOR' : _SETSTATESPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SetStateSpec)
+  })
+_sym_db.RegisterMessage(SetStateSpec)
+
+TimerFamilySpec = _reflection.GeneratedProtocolMessageType('TimerFamilySpec', (_message.Message,), {
+  'DESCRIPTOR' : _TIMERFAMILYSPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimerFamilySpec)
+  })
+_sym_db.RegisterMessage(TimerFamilySpec)
+
+IsBounded = _reflection.GeneratedProtocolMessageType('IsBounded', (_message.Message,), {
+  'DESCRIPTOR' : _ISBOUNDED,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.IsBounded)
+  })
+_sym_db.RegisterMessage(IsBounded)
+
+ReadPayload = _reflection.GeneratedProtocolMessageType('ReadPayload', (_message.Message,), {
+  'DESCRIPTOR' : _READPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ReadPayload)
+  })
+_sym_db.RegisterMessage(ReadPayload)
+
+WindowIntoPayload = _reflection.GeneratedProtocolMessageType('WindowIntoPayload', (_message.Message,), {
+  'DESCRIPTOR' : _WINDOWINTOPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WindowIntoPayload)
+  })
+_sym_db.RegisterMessage(WindowIntoPayload)
+
+CombinePayload = _reflection.GeneratedProtocolMessageType('CombinePayload', (_message.Message,), {
+  'DESCRIPTOR' : _COMBINEPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.CombinePayload)
+  })
+_sym_db.RegisterMessage(CombinePayload)
+
+TestStreamPayload = _reflection.GeneratedProtocolMessageType('TestStreamPayload', (_message.Message,), {
+
+  'Event' : _reflection.GeneratedProtocolMessageType('Event', (_message.Message,), {
+
+    'AdvanceWatermark' : _reflection.GeneratedProtocolMessageType('AdvanceWatermark', (_message.Message,), {
+      'DESCRIPTOR' : _TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK,
+      '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceWatermark)
+      })
+    ,
+
+    'AdvanceProcessingTime' : _reflection.GeneratedProtocolMessageType('AdvanceProcessingTime', (_message.Message,), {
+      'DESCRIPTOR' : _TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME,
+      '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AdvanceProcessingTime)
+      })
+    ,
+
+    'AddElements' : _reflection.GeneratedProtocolMessageType('AddElements', (_message.Message,), {
+      'DESCRIPTOR' : _TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS,
+      '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+      # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event.AddElements)
+      })
+    ,
+    'DESCRIPTOR' : _TESTSTREAMPAYLOAD_EVENT,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.Event)
+    })
+  ,
+
+  'TimestampedElement' : _reflection.GeneratedProtocolMessageType('TimestampedElement', (_message.Message,), {
+    'DESCRIPTOR' : _TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload.TimestampedElement)
+    })
+  ,
+  'DESCRIPTOR' : _TESTSTREAMPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TestStreamPayload)
+  })
+_sym_db.RegisterMessage(TestStreamPayload)
+_sym_db.RegisterMessage(TestStreamPayload.Event)
+_sym_db.RegisterMessage(TestStreamPayload.Event.AdvanceWatermark)
+_sym_db.RegisterMessage(TestStreamPayload.Event.AdvanceProcessingTime)
+_sym_db.RegisterMessage(TestStreamPayload.Event.AddElements)
+_sym_db.RegisterMessage(TestStreamPayload.TimestampedElement)
+
+EventsRequest = _reflection.GeneratedProtocolMessageType('EventsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _EVENTSREQUEST,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.EventsRequest)
+  })
+_sym_db.RegisterMessage(EventsRequest)
+
+WriteFilesPayload = _reflection.GeneratedProtocolMessageType('WriteFilesPayload', (_message.Message,), {
+
+  'SideInputsEntry' : _reflection.GeneratedProtocolMessageType('SideInputsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _WRITEFILESPAYLOAD_SIDEINPUTSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WriteFilesPayload.SideInputsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _WRITEFILESPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WriteFilesPayload)
+  })
+_sym_db.RegisterMessage(WriteFilesPayload)
+_sym_db.RegisterMessage(WriteFilesPayload.SideInputsEntry)
+
+PubSubReadPayload = _reflection.GeneratedProtocolMessageType('PubSubReadPayload', (_message.Message,), {
+  'DESCRIPTOR' : _PUBSUBREADPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PubSubReadPayload)
+  })
+_sym_db.RegisterMessage(PubSubReadPayload)
+
+PubSubWritePayload = _reflection.GeneratedProtocolMessageType('PubSubWritePayload', (_message.Message,), {
+  'DESCRIPTOR' : _PUBSUBWRITEPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PubSubWritePayload)
+  })
+_sym_db.RegisterMessage(PubSubWritePayload)
+
+GroupIntoBatchesPayload = _reflection.GeneratedProtocolMessageType('GroupIntoBatchesPayload', (_message.Message,), {
+  'DESCRIPTOR' : _GROUPINTOBATCHESPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.GroupIntoBatchesPayload)
+  })
+_sym_db.RegisterMessage(GroupIntoBatchesPayload)
+
+Coder = _reflection.GeneratedProtocolMessageType('Coder', (_message.Message,), {
+  'DESCRIPTOR' : _CODER,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Coder)
+  })
+_sym_db.RegisterMessage(Coder)
+
+StandardCoders = _reflection.GeneratedProtocolMessageType('StandardCoders', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDCODERS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardCoders)
+  })
+_sym_db.RegisterMessage(StandardCoders)
+
+WindowingStrategy = _reflection.GeneratedProtocolMessageType('WindowingStrategy', (_message.Message,), {
+  'DESCRIPTOR' : _WINDOWINGSTRATEGY,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.WindowingStrategy)
+  })
+_sym_db.RegisterMessage(WindowingStrategy)
+
+MergeStatus = _reflection.GeneratedProtocolMessageType('MergeStatus', (_message.Message,), {
+  'DESCRIPTOR' : _MERGESTATUS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MergeStatus)
+  })
+_sym_db.RegisterMessage(MergeStatus)
+
+AccumulationMode = _reflection.GeneratedProtocolMessageType('AccumulationMode', (_message.Message,), {
+  'DESCRIPTOR' : _ACCUMULATIONMODE,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.AccumulationMode)
+  })
+_sym_db.RegisterMessage(AccumulationMode)
+
+ClosingBehavior = _reflection.GeneratedProtocolMessageType('ClosingBehavior', (_message.Message,), {
+  'DESCRIPTOR' : _CLOSINGBEHAVIOR,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ClosingBehavior)
+  })
+_sym_db.RegisterMessage(ClosingBehavior)
+
+OnTimeBehavior = _reflection.GeneratedProtocolMessageType('OnTimeBehavior', (_message.Message,), {
+  'DESCRIPTOR' : _ONTIMEBEHAVIOR,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.OnTimeBehavior)
+  })
+_sym_db.RegisterMessage(OnTimeBehavior)
+
+OutputTime = _reflection.GeneratedProtocolMessageType('OutputTime', (_message.Message,), {
+  'DESCRIPTOR' : _OUTPUTTIME,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.OutputTime)
+  })
+_sym_db.RegisterMessage(OutputTime)
+
+TimeDomain = _reflection.GeneratedProtocolMessageType('TimeDomain', (_message.Message,), {
+  'DESCRIPTOR' : _TIMEDOMAIN,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimeDomain)
+  })
+_sym_db.RegisterMessage(TimeDomain)
+
+Trigger = _reflection.GeneratedProtocolMessageType('Trigger', (_message.Message,), {
+
+  'AfterAll' : _reflection.GeneratedProtocolMessageType('AfterAll', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_AFTERALL,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterAll)
+    })
+  ,
+
+  'AfterAny' : _reflection.GeneratedProtocolMessageType('AfterAny', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_AFTERANY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterAny)
+    })
+  ,
+
+  'AfterEach' : _reflection.GeneratedProtocolMessageType('AfterEach', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_AFTEREACH,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterEach)
+    })
+  ,
+
+  'AfterEndOfWindow' : _reflection.GeneratedProtocolMessageType('AfterEndOfWindow', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_AFTERENDOFWINDOW,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterEndOfWindow)
+    })
+  ,
+
+  'AfterProcessingTime' : _reflection.GeneratedProtocolMessageType('AfterProcessingTime', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_AFTERPROCESSINGTIME,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterProcessingTime)
+    })
+  ,
+
+  'AfterSynchronizedProcessingTime' : _reflection.GeneratedProtocolMessageType('AfterSynchronizedProcessingTime', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.AfterSynchronizedProcessingTime)
+    })
+  ,
+
+  'Default' : _reflection.GeneratedProtocolMessageType('Default', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_DEFAULT,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Default)
+    })
+  ,
+
+  'ElementCount' : _reflection.GeneratedProtocolMessageType('ElementCount', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_ELEMENTCOUNT,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.ElementCount)
+    })
+  ,
+
+  'Never' : _reflection.GeneratedProtocolMessageType('Never', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_NEVER,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Never)
+    })
+  ,
+
+  'Always' : _reflection.GeneratedProtocolMessageType('Always', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_ALWAYS,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Always)
+    })
+  ,
+
+  'OrFinally' : _reflection.GeneratedProtocolMessageType('OrFinally', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_ORFINALLY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.OrFinally)
+    })
+  ,
+
+  'Repeat' : _reflection.GeneratedProtocolMessageType('Repeat', (_message.Message,), {
+    'DESCRIPTOR' : _TRIGGER_REPEAT,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger.Repeat)
+    })
+  ,
+  'DESCRIPTOR' : _TRIGGER,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Trigger)
+  })
+_sym_db.RegisterMessage(Trigger)
+_sym_db.RegisterMessage(Trigger.AfterAll)
+_sym_db.RegisterMessage(Trigger.AfterAny)
+_sym_db.RegisterMessage(Trigger.AfterEach)
+_sym_db.RegisterMessage(Trigger.AfterEndOfWindow)
+_sym_db.RegisterMessage(Trigger.AfterProcessingTime)
+_sym_db.RegisterMessage(Trigger.AfterSynchronizedProcessingTime)
+_sym_db.RegisterMessage(Trigger.Default)
+_sym_db.RegisterMessage(Trigger.ElementCount)
+_sym_db.RegisterMessage(Trigger.Never)
+_sym_db.RegisterMessage(Trigger.Always)
+_sym_db.RegisterMessage(Trigger.OrFinally)
+_sym_db.RegisterMessage(Trigger.Repeat)
+
+TimestampTransform = _reflection.GeneratedProtocolMessageType('TimestampTransform', (_message.Message,), {
+
+  'Delay' : _reflection.GeneratedProtocolMessageType('Delay', (_message.Message,), {
+    'DESCRIPTOR' : _TIMESTAMPTRANSFORM_DELAY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimestampTransform.Delay)
+    })
+  ,
+
+  'AlignTo' : _reflection.GeneratedProtocolMessageType('AlignTo', (_message.Message,), {
+    'DESCRIPTOR' : _TIMESTAMPTRANSFORM_ALIGNTO,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimestampTransform.AlignTo)
+    })
+  ,
+  'DESCRIPTOR' : _TIMESTAMPTRANSFORM,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.TimestampTransform)
+  })
+_sym_db.RegisterMessage(TimestampTransform)
+_sym_db.RegisterMessage(TimestampTransform.Delay)
+_sym_db.RegisterMessage(TimestampTransform.AlignTo)
+
+SideInput = _reflection.GeneratedProtocolMessageType('SideInput', (_message.Message,), {
+  'DESCRIPTOR' : _SIDEINPUT,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SideInput)
+  })
+_sym_db.RegisterMessage(SideInput)
+
+StandardArtifacts = _reflection.GeneratedProtocolMessageType('StandardArtifacts', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDARTIFACTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardArtifacts)
+  })
+_sym_db.RegisterMessage(StandardArtifacts)
+
+ArtifactFilePayload = _reflection.GeneratedProtocolMessageType('ArtifactFilePayload', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTFILEPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactFilePayload)
+  })
+_sym_db.RegisterMessage(ArtifactFilePayload)
+
+ArtifactUrlPayload = _reflection.GeneratedProtocolMessageType('ArtifactUrlPayload', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTURLPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactUrlPayload)
+  })
+_sym_db.RegisterMessage(ArtifactUrlPayload)
+
+EmbeddedFilePayload = _reflection.GeneratedProtocolMessageType('EmbeddedFilePayload', (_message.Message,), {
+  'DESCRIPTOR' : _EMBEDDEDFILEPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.EmbeddedFilePayload)
+  })
+_sym_db.RegisterMessage(EmbeddedFilePayload)
+
+PyPIPayload = _reflection.GeneratedProtocolMessageType('PyPIPayload', (_message.Message,), {
+  'DESCRIPTOR' : _PYPIPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.PyPIPayload)
+  })
+_sym_db.RegisterMessage(PyPIPayload)
+
+MavenPayload = _reflection.GeneratedProtocolMessageType('MavenPayload', (_message.Message,), {
+  'DESCRIPTOR' : _MAVENPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MavenPayload)
+  })
+_sym_db.RegisterMessage(MavenPayload)
+
+DeferredArtifactPayload = _reflection.GeneratedProtocolMessageType('DeferredArtifactPayload', (_message.Message,), {
+  'DESCRIPTOR' : _DEFERREDARTIFACTPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DeferredArtifactPayload)
+  })
+_sym_db.RegisterMessage(DeferredArtifactPayload)
+
+ArtifactStagingToRolePayload = _reflection.GeneratedProtocolMessageType('ArtifactStagingToRolePayload', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTSTAGINGTOROLEPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactStagingToRolePayload)
+  })
+_sym_db.RegisterMessage(ArtifactStagingToRolePayload)
+
+ArtifactInformation = _reflection.GeneratedProtocolMessageType('ArtifactInformation', (_message.Message,), {
+  'DESCRIPTOR' : _ARTIFACTINFORMATION,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ArtifactInformation)
+  })
+_sym_db.RegisterMessage(ArtifactInformation)
+
+Environment = _reflection.GeneratedProtocolMessageType('Environment', (_message.Message,), {
+
+  'ResourceHintsEntry' : _reflection.GeneratedProtocolMessageType('ResourceHintsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _ENVIRONMENT_RESOURCEHINTSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Environment.ResourceHintsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _ENVIRONMENT,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.Environment)
+  })
+_sym_db.RegisterMessage(Environment)
+_sym_db.RegisterMessage(Environment.ResourceHintsEntry)
+
+StandardEnvironments = _reflection.GeneratedProtocolMessageType('StandardEnvironments', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDENVIRONMENTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardEnvironments)
+  })
+_sym_db.RegisterMessage(StandardEnvironments)
+
+DockerPayload = _reflection.GeneratedProtocolMessageType('DockerPayload', (_message.Message,), {
+  'DESCRIPTOR' : _DOCKERPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DockerPayload)
+  })
+_sym_db.RegisterMessage(DockerPayload)
+
+ProcessPayload = _reflection.GeneratedProtocolMessageType('ProcessPayload', (_message.Message,), {
+
+  'EnvEntry' : _reflection.GeneratedProtocolMessageType('EnvEntry', (_message.Message,), {
+    'DESCRIPTOR' : _PROCESSPAYLOAD_ENVENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ProcessPayload.EnvEntry)
+    })
+  ,
+  'DESCRIPTOR' : _PROCESSPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ProcessPayload)
+  })
+_sym_db.RegisterMessage(ProcessPayload)
+_sym_db.RegisterMessage(ProcessPayload.EnvEntry)
+
+ExternalPayload = _reflection.GeneratedProtocolMessageType('ExternalPayload', (_message.Message,), {
+
+  'ParamsEntry' : _reflection.GeneratedProtocolMessageType('ParamsEntry', (_message.Message,), {
+    'DESCRIPTOR' : _EXTERNALPAYLOAD_PARAMSENTRY,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalPayload.ParamsEntry)
+    })
+  ,
+  'DESCRIPTOR' : _EXTERNALPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalPayload)
+  })
+_sym_db.RegisterMessage(ExternalPayload)
+_sym_db.RegisterMessage(ExternalPayload.ParamsEntry)
+
+StandardProtocols = _reflection.GeneratedProtocolMessageType('StandardProtocols', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDPROTOCOLS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardProtocols)
+  })
+_sym_db.RegisterMessage(StandardProtocols)
+
+StandardRunnerProtocols = _reflection.GeneratedProtocolMessageType('StandardRunnerProtocols', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDRUNNERPROTOCOLS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardRunnerProtocols)
+  })
+_sym_db.RegisterMessage(StandardRunnerProtocols)
+
+StandardRequirements = _reflection.GeneratedProtocolMessageType('StandardRequirements', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDREQUIREMENTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardRequirements)
+  })
+_sym_db.RegisterMessage(StandardRequirements)
+
+FunctionSpec = _reflection.GeneratedProtocolMessageType('FunctionSpec', (_message.Message,), {
+  'DESCRIPTOR' : _FUNCTIONSPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.FunctionSpec)
+  })
+_sym_db.RegisterMessage(FunctionSpec)
+
+StandardDisplayData = _reflection.GeneratedProtocolMessageType('StandardDisplayData', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDDISPLAYDATA,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardDisplayData)
+  })
+_sym_db.RegisterMessage(StandardDisplayData)
+
+LabelledPayload = _reflection.GeneratedProtocolMessageType('LabelledPayload', (_message.Message,), {
+  'DESCRIPTOR' : _LABELLEDPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.LabelledPayload)
+  })
+_sym_db.RegisterMessage(LabelledPayload)
+
+DisplayData = _reflection.GeneratedProtocolMessageType('DisplayData', (_message.Message,), {
+  'DESCRIPTOR' : _DISPLAYDATA,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.DisplayData)
+  })
+_sym_db.RegisterMessage(DisplayData)
+
+MessageWithComponents = _reflection.GeneratedProtocolMessageType('MessageWithComponents', (_message.Message,), {
+  'DESCRIPTOR' : _MESSAGEWITHCOMPONENTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.MessageWithComponents)
+  })
+_sym_db.RegisterMessage(MessageWithComponents)
+
+ExecutableStagePayload = _reflection.GeneratedProtocolMessageType('ExecutableStagePayload', (_message.Message,), {
+
+  'SideInputId' : _reflection.GeneratedProtocolMessageType('SideInputId', (_message.Message,), {
+    'DESCRIPTOR' : _EXECUTABLESTAGEPAYLOAD_SIDEINPUTID,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.SideInputId)
+    })
+  ,
+
+  'UserStateId' : _reflection.GeneratedProtocolMessageType('UserStateId', (_message.Message,), {
+    'DESCRIPTOR' : _EXECUTABLESTAGEPAYLOAD_USERSTATEID,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.UserStateId)
+    })
+  ,
+
+  'TimerId' : _reflection.GeneratedProtocolMessageType('TimerId', (_message.Message,), {
+    'DESCRIPTOR' : _EXECUTABLESTAGEPAYLOAD_TIMERID,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerId)
+    })
+  ,
+
+  'TimerFamilyId' : _reflection.GeneratedProtocolMessageType('TimerFamilyId', (_message.Message,), {
+    'DESCRIPTOR' : _EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.TimerFamilyId)
+    })
+  ,
+
+  'WireCoderSetting' : _reflection.GeneratedProtocolMessageType('WireCoderSetting', (_message.Message,), {
+    'DESCRIPTOR' : _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING,
+    '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+    # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload.WireCoderSetting)
+    })
+  ,
+  'DESCRIPTOR' : _EXECUTABLESTAGEPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExecutableStagePayload)
+  })
+_sym_db.RegisterMessage(ExecutableStagePayload)
+_sym_db.RegisterMessage(ExecutableStagePayload.SideInputId)
+_sym_db.RegisterMessage(ExecutableStagePayload.UserStateId)
+_sym_db.RegisterMessage(ExecutableStagePayload.TimerId)
+_sym_db.RegisterMessage(ExecutableStagePayload.TimerFamilyId)
+_sym_db.RegisterMessage(ExecutableStagePayload.WireCoderSetting)
+
+StandardResourceHints = _reflection.GeneratedProtocolMessageType('StandardResourceHints', (_message.Message,), {
+  'DESCRIPTOR' : _STANDARDRESOURCEHINTS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.beam_runner_api_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.StandardResourceHints)
+  })
+_sym_db.RegisterMessage(StandardResourceHints)
+
+_TESTSTREAMSERVICE = DESCRIPTOR.services_by_name['TestStreamService']
+if _descriptor._USE_C_DESCRIPTORS == False:
+  google_dot_protobuf_dot_descriptor__pb2.EnumValueOptions.RegisterExtension(beam_urn)
+  google_dot_protobuf_dot_descriptor__pb2.EnumValueOptions.RegisterExtension(beam_constant)
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\tRunnerApiZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _BEAMCONSTANTS_CONSTANTS.values_by_name["MIN_TIMESTAMP_MILLIS"]._options = None
+  _BEAMCONSTANTS_CONSTANTS.values_by_name["MIN_TIMESTAMP_MILLIS"]._serialized_options = b'\252\264\372\302\005\021-9223372036854775'
+  _BEAMCONSTANTS_CONSTANTS.values_by_name["MAX_TIMESTAMP_MILLIS"]._options = None
+  _BEAMCONSTANTS_CONSTANTS.values_by_name["MAX_TIMESTAMP_MILLIS"]._serialized_options = b'\252\264\372\302\005\0209223372036854775'
+  _BEAMCONSTANTS_CONSTANTS.values_by_name["GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS"]._options = None
+  _BEAMCONSTANTS_CONSTANTS.values_by_name["GLOBAL_WINDOW_MAX_TIMESTAMP_MILLIS"]._serialized_options = b'\252\264\372\302\005\0209223371950454775'
+  _COMPONENTS_TRANSFORMSENTRY._options = None
+  _COMPONENTS_TRANSFORMSENTRY._serialized_options = b'8\001'
+  _COMPONENTS_PCOLLECTIONSENTRY._options = None
+  _COMPONENTS_PCOLLECTIONSENTRY._serialized_options = b'8\001'
+  _COMPONENTS_WINDOWINGSTRATEGIESENTRY._options = None
+  _COMPONENTS_WINDOWINGSTRATEGIESENTRY._serialized_options = b'8\001'
+  _COMPONENTS_CODERSENTRY._options = None
+  _COMPONENTS_CODERSENTRY._serialized_options = b'8\001'
+  _COMPONENTS_ENVIRONMENTSENTRY._options = None
+  _COMPONENTS_ENVIRONMENTSENTRY._serialized_options = b'8\001'
+  _PTRANSFORM_INPUTSENTRY._options = None
+  _PTRANSFORM_INPUTSENTRY._serialized_options = b'8\001'
+  _PTRANSFORM_OUTPUTSENTRY._options = None
+  _PTRANSFORM_OUTPUTSENTRY._serialized_options = b'8\001'
+  _PTRANSFORM_ANNOTATIONSENTRY._options = None
+  _PTRANSFORM_ANNOTATIONSENTRY._serialized_options = b'8\001'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["PAR_DO"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["PAR_DO"]._serialized_options = b'\242\264\372\302\005\027beam:transform:pardo:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["FLATTEN"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["FLATTEN"]._serialized_options = b'\242\264\372\302\005\031beam:transform:flatten:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["GROUP_BY_KEY"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["GROUP_BY_KEY"]._serialized_options = b'\242\264\372\302\005\036beam:transform:group_by_key:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["IMPULSE"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["IMPULSE"]._serialized_options = b'\242\264\372\302\005\031beam:transform:impulse:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["ASSIGN_WINDOWS"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["ASSIGN_WINDOWS"]._serialized_options = b'\242\264\372\302\005\035beam:transform:window_into:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["TEST_STREAM"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["TEST_STREAM"]._serialized_options = b'\242\264\372\302\005\034beam:transform:teststream:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MAP_WINDOWS"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MAP_WINDOWS"]._serialized_options = b'\242\264\372\302\005\035beam:transform:map_windows:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MERGE_WINDOWS"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["MERGE_WINDOWS"]._serialized_options = b'\242\264\372\302\005\037beam:transform:merge_windows:v1'
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["TO_STRING"]._options = None
+  _STANDARDPTRANSFORMS_PRIMITIVES.values_by_name["TO_STRING"]._serialized_options = b'\242\264\372\302\005\033beam:transform:to_string:v1'
+  _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["READ"]._options = None
+  _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["READ"]._serialized_options = b'\242\264\372\302\005\026beam:transform:read:v1'
+  _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["CREATE_VIEW"]._options = None
+  _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES.values_by_name["CREATE_VIEW"]._serialized_options = b'\242\264\372\302\005\035beam:transform:create_view:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_PER_KEY"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_PER_KEY"]._serialized_options = b'\242\264\372\302\005!beam:transform:combine_per_key:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_GLOBALLY"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["COMBINE_GLOBALLY"]._serialized_options = b'\242\264\372\302\005\"beam:transform:combine_globally:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["RESHUFFLE"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["RESHUFFLE"]._serialized_options = b'\242\264\372\302\005\033beam:transform:reshuffle:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["WRITE_FILES"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["WRITE_FILES"]._serialized_options = b'\242\264\372\302\005\035beam:transform:write_files:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["PUBSUB_READ"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["PUBSUB_READ"]._serialized_options = b'\242\264\372\302\005\035beam:transform:pubsub_read:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["PUBSUB_WRITE"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["PUBSUB_WRITE"]._serialized_options = b'\242\264\372\302\005\036beam:transform:pubsub_write:v1'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["PUBSUB_WRITE_V2"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["PUBSUB_WRITE_V2"]._serialized_options = b'\242\264\372\302\005\036beam:transform:pubsub_write:v2'
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["GROUP_INTO_BATCHES_WITH_SHARDED_KEY"]._options = None
+  _STANDARDPTRANSFORMS_COMPOSITES.values_by_name["GROUP_INTO_BATCHES_WITH_SHARDED_KEY"]._serialized_options = b'\242\264\372\302\0055beam:transform:group_into_batches_with_sharded_key:v1'
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_PRECOMBINE"]._options = None
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_PRECOMBINE"]._serialized_options = b'\242\264\372\302\005,beam:transform:combine_per_key_precombine:v1'
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_MERGE_ACCUMULATORS"]._options = None
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_MERGE_ACCUMULATORS"]._serialized_options = b'\242\264\372\302\0054beam:transform:combine_per_key_merge_accumulators:v1'
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_EXTRACT_OUTPUTS"]._options = None
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_EXTRACT_OUTPUTS"]._serialized_options = b'\242\264\372\302\0051beam:transform:combine_per_key_extract_outputs:v1'
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_GROUPED_VALUES"]._options = None
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_GROUPED_VALUES"]._serialized_options = b'\242\264\372\302\005(beam:transform:combine_grouped_values:v1'
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_CONVERT_TO_ACCUMULATORS"]._options = None
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS.values_by_name["COMBINE_PER_KEY_CONVERT_TO_ACCUMULATORS"]._serialized_options = b'\242\264\372\302\0059beam:transform:combine_per_key_convert_to_accumulators:v1'
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PAIR_WITH_RESTRICTION"]._options = None
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PAIR_WITH_RESTRICTION"]._serialized_options = b'\242\264\372\302\005+beam:transform:sdf_pair_with_restriction:v1'
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["SPLIT_AND_SIZE_RESTRICTIONS"]._options = None
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["SPLIT_AND_SIZE_RESTRICTIONS"]._serialized_options = b'\242\264\372\302\0051beam:transform:sdf_split_and_size_restrictions:v1'
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS"]._options = None
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["PROCESS_SIZED_ELEMENTS_AND_RESTRICTIONS"]._serialized_options = b'\242\264\372\302\005<beam:transform:sdf_process_sized_element_and_restrictions:v1'
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["TRUNCATE_SIZED_RESTRICTION"]._options = None
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS.values_by_name["TRUNCATE_SIZED_RESTRICTION"]._serialized_options = b'\242\264\372\302\0051beam:transform:sdf_truncate_sized_restrictions:v1'
+  _STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS.values_by_name["GROUP_INTO_BATCHES"]._options = None
+  _STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS.values_by_name["GROUP_INTO_BATCHES"]._serialized_options = b'\242\264\372\302\005$beam:transform:group_into_batches:v1'
+  _STANDARDSIDEINPUTTYPES_ENUM.values_by_name["ITERABLE"]._options = None
+  _STANDARDSIDEINPUTTYPES_ENUM.values_by_name["ITERABLE"]._serialized_options = b'\242\264\372\302\005\033beam:side_input:iterable:v1'
+  _STANDARDSIDEINPUTTYPES_ENUM.values_by_name["MULTIMAP"]._options = None
+  _STANDARDSIDEINPUTTYPES_ENUM.values_by_name["MULTIMAP"]._serialized_options = b'\242\264\372\302\005\033beam:side_input:multimap:v1'
+  _STANDARDUSERSTATETYPES_ENUM.values_by_name["BAG"]._options = None
+  _STANDARDUSERSTATETYPES_ENUM.values_by_name["BAG"]._serialized_options = b'\242\264\372\302\005\026beam:user_state:bag:v1'
+  _STANDARDUSERSTATETYPES_ENUM.values_by_name["MULTIMAP"]._options = None
+  _STANDARDUSERSTATETYPES_ENUM.values_by_name["MULTIMAP"]._serialized_options = b'\242\264\372\302\005\033beam:user_state:multimap:v1'
+  _PARDOPAYLOAD_SIDEINPUTSENTRY._options = None
+  _PARDOPAYLOAD_SIDEINPUTSENTRY._serialized_options = b'8\001'
+  _PARDOPAYLOAD_STATESPECSENTRY._options = None
+  _PARDOPAYLOAD_STATESPECSENTRY._serialized_options = b'8\001'
+  _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY._options = None
+  _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY._serialized_options = b'8\001'
+  _WRITEFILESPAYLOAD_SIDEINPUTSENTRY._options = None
+  _WRITEFILESPAYLOAD_SIDEINPUTSENTRY._serialized_options = b'8\001'
+  _STANDARDCODERS_ENUM.values_by_name["BYTES"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["BYTES"]._serialized_options = b'\242\264\372\302\005\023beam:coder:bytes:v1'
+  _STANDARDCODERS_ENUM.values_by_name["STRING_UTF8"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["STRING_UTF8"]._serialized_options = b'\242\264\372\302\005\031beam:coder:string_utf8:v1'
+  _STANDARDCODERS_ENUM.values_by_name["KV"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["KV"]._serialized_options = b'\242\264\372\302\005\020beam:coder:kv:v1'
+  _STANDARDCODERS_ENUM.values_by_name["BOOL"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["BOOL"]._serialized_options = b'\242\264\372\302\005\022beam:coder:bool:v1'
+  _STANDARDCODERS_ENUM.values_by_name["VARINT"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["VARINT"]._serialized_options = b'\242\264\372\302\005\024beam:coder:varint:v1'
+  _STANDARDCODERS_ENUM.values_by_name["DOUBLE"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["DOUBLE"]._serialized_options = b'\242\264\372\302\005\024beam:coder:double:v1'
+  _STANDARDCODERS_ENUM.values_by_name["ITERABLE"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["ITERABLE"]._serialized_options = b'\242\264\372\302\005\026beam:coder:iterable:v1'
+  _STANDARDCODERS_ENUM.values_by_name["TIMER"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["TIMER"]._serialized_options = b'\242\264\372\302\005\023beam:coder:timer:v1'
+  _STANDARDCODERS_ENUM.values_by_name["INTERVAL_WINDOW"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["INTERVAL_WINDOW"]._serialized_options = b'\242\264\372\302\005\035beam:coder:interval_window:v1'
+  _STANDARDCODERS_ENUM.values_by_name["LENGTH_PREFIX"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["LENGTH_PREFIX"]._serialized_options = b'\242\264\372\302\005\033beam:coder:length_prefix:v1'
+  _STANDARDCODERS_ENUM.values_by_name["GLOBAL_WINDOW"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["GLOBAL_WINDOW"]._serialized_options = b'\242\264\372\302\005\033beam:coder:global_window:v1'
+  _STANDARDCODERS_ENUM.values_by_name["WINDOWED_VALUE"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["WINDOWED_VALUE"]._serialized_options = b'\242\264\372\302\005\034beam:coder:windowed_value:v1'
+  _STANDARDCODERS_ENUM.values_by_name["PARAM_WINDOWED_VALUE"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["PARAM_WINDOWED_VALUE"]._serialized_options = b'\242\264\372\302\005\"beam:coder:param_windowed_value:v1'
+  _STANDARDCODERS_ENUM.values_by_name["STATE_BACKED_ITERABLE"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["STATE_BACKED_ITERABLE"]._serialized_options = b'\242\264\372\302\005#beam:coder:state_backed_iterable:v1'
+  _STANDARDCODERS_ENUM.values_by_name["CUSTOM_WINDOW"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["CUSTOM_WINDOW"]._serialized_options = b'\242\264\372\302\005\033beam:coder:custom_window:v1'
+  _STANDARDCODERS_ENUM.values_by_name["ROW"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["ROW"]._serialized_options = b'\242\264\372\302\005\021beam:coder:row:v1'
+  _STANDARDCODERS_ENUM.values_by_name["SHARDED_KEY"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["SHARDED_KEY"]._serialized_options = b'\242\264\372\302\005\031beam:coder:sharded_key:v1'
+  _STANDARDCODERS_ENUM.values_by_name["NULLABLE"]._options = None
+  _STANDARDCODERS_ENUM.values_by_name["NULLABLE"]._serialized_options = b'\242\264\372\302\005\026beam:coder:nullable:v1'
+  _STANDARDARTIFACTS_TYPES.values_by_name["FILE"]._options = None
+  _STANDARDARTIFACTS_TYPES.values_by_name["FILE"]._serialized_options = b'\242\264\372\302\005\032beam:artifact:type:file:v1'
+  _STANDARDARTIFACTS_TYPES.values_by_name["URL"]._options = None
+  _STANDARDARTIFACTS_TYPES.values_by_name["URL"]._serialized_options = b'\242\264\372\302\005\031beam:artifact:type:url:v1'
+  _STANDARDARTIFACTS_TYPES.values_by_name["EMBEDDED"]._options = None
+  _STANDARDARTIFACTS_TYPES.values_by_name["EMBEDDED"]._serialized_options = b'\242\264\372\302\005\036beam:artifact:type:embedded:v1'
+  _STANDARDARTIFACTS_TYPES.values_by_name["PYPI"]._options = None
+  _STANDARDARTIFACTS_TYPES.values_by_name["PYPI"]._serialized_options = b'\242\264\372\302\005\032beam:artifact:type:pypi:v1'
+  _STANDARDARTIFACTS_TYPES.values_by_name["MAVEN"]._options = None
+  _STANDARDARTIFACTS_TYPES.values_by_name["MAVEN"]._serialized_options = b'\242\264\372\302\005\033beam:artifact:type:maven:v1'
+  _STANDARDARTIFACTS_TYPES.values_by_name["DEFERRED"]._options = None
+  _STANDARDARTIFACTS_TYPES.values_by_name["DEFERRED"]._serialized_options = b'\242\264\372\302\005\036beam:artifact:type:deferred:v1'
+  _STANDARDARTIFACTS_ROLES.values_by_name["STAGING_TO"]._options = None
+  _STANDARDARTIFACTS_ROLES.values_by_name["STAGING_TO"]._serialized_options = b'\242\264\372\302\005 beam:artifact:role:staging_to:v1'
+  _STANDARDARTIFACTS_ROLES.values_by_name["PIP_REQUIREMENTS_FILE"]._options = None
+  _STANDARDARTIFACTS_ROLES.values_by_name["PIP_REQUIREMENTS_FILE"]._serialized_options = b'\242\264\372\302\005+beam:artifact:role:pip_requirements_file:v1'
+  _STANDARDARTIFACTS_ROLES.values_by_name["GO_WORKER_BINARY"]._options = None
+  _STANDARDARTIFACTS_ROLES.values_by_name["GO_WORKER_BINARY"]._serialized_options = b'\242\264\372\302\005&beam:artifact:role:go_worker_binary:v1'
+  _ENVIRONMENT_RESOURCEHINTSENTRY._options = None
+  _ENVIRONMENT_RESOURCEHINTSENTRY._serialized_options = b'8\001'
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["DOCKER"]._options = None
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["DOCKER"]._serialized_options = b'\242\264\372\302\005\022beam:env:docker:v1'
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["PROCESS"]._options = None
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["PROCESS"]._serialized_options = b'\242\264\372\302\005\023beam:env:process:v1'
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["EXTERNAL"]._options = None
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["EXTERNAL"]._serialized_options = b'\242\264\372\302\005\024beam:env:external:v1'
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["DEFAULT"]._options = None
+  _STANDARDENVIRONMENTS_ENVIRONMENTS.values_by_name["DEFAULT"]._serialized_options = b'\242\264\372\302\005\023beam:env:default:v1'
+  _PROCESSPAYLOAD_ENVENTRY._options = None
+  _PROCESSPAYLOAD_ENVENTRY._serialized_options = b'8\001'
+  _EXTERNALPAYLOAD_PARAMSENTRY._options = None
+  _EXTERNALPAYLOAD_PARAMSENTRY._serialized_options = b'8\001'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["LEGACY_PROGRESS_REPORTING"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["LEGACY_PROGRESS_REPORTING"]._serialized_options = b'\242\264\372\302\005#beam:protocol:progress_reporting:v0'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["PROGRESS_REPORTING"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["PROGRESS_REPORTING"]._serialized_options = b'\242\264\372\302\005#beam:protocol:progress_reporting:v1'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["WORKER_STATUS"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["WORKER_STATUS"]._serialized_options = b'\242\264\372\302\005\036beam:protocol:worker_status:v1'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["MULTI_CORE_BUNDLE_PROCESSING"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["MULTI_CORE_BUNDLE_PROCESSING"]._serialized_options = b'\242\264\372\302\005-beam:protocol:multi_core_bundle_processing:v1'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["SIBLING_WORKERS"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["SIBLING_WORKERS"]._serialized_options = b'\242\264\372\302\005 beam:protocol:sibling_workers:v1'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["HARNESS_MONITORING_INFOS"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["HARNESS_MONITORING_INFOS"]._serialized_options = b'\242\264\372\302\005)beam:protocol:harness_monitoring_infos:v1'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["CONTROL_REQUEST_ELEMENTS_EMBEDDING"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["CONTROL_REQUEST_ELEMENTS_EMBEDDING"]._serialized_options = b'\242\264\372\302\0053beam:protocol:control_request_elements_embedding:v1'
+  _STANDARDPROTOCOLS_ENUM.values_by_name["STATE_CACHING"]._options = None
+  _STANDARDPROTOCOLS_ENUM.values_by_name["STATE_CACHING"]._serialized_options = b'\242\264\372\302\005\036beam:protocol:state_caching:v1'
+  _STANDARDRUNNERPROTOCOLS_ENUM.values_by_name["MONITORING_INFO_SHORT_IDS"]._options = None
+  _STANDARDRUNNERPROTOCOLS_ENUM.values_by_name["MONITORING_INFO_SHORT_IDS"]._serialized_options = b'\242\264\372\302\005*beam:protocol:monitoring_info_short_ids:v1'
+  _STANDARDRUNNERPROTOCOLS_ENUM.values_by_name["CONTROL_RESPONSE_ELEMENTS_EMBEDDING"]._options = None
+  _STANDARDRUNNERPROTOCOLS_ENUM.values_by_name["CONTROL_RESPONSE_ELEMENTS_EMBEDDING"]._serialized_options = b'\242\264\372\302\0054beam:protocol:control_response_elements_embedding:v1'
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STATEFUL_PROCESSING"]._options = None
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STATEFUL_PROCESSING"]._serialized_options = b'\242\264\372\302\005\"beam:requirement:pardo:stateful:v1'
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_BUNDLE_FINALIZATION"]._options = None
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_BUNDLE_FINALIZATION"]._serialized_options = b'\242\264\372\302\005&beam:requirement:pardo:finalization:v1'
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STABLE_INPUT"]._options = None
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_STABLE_INPUT"]._serialized_options = b'\242\264\372\302\005&beam:requirement:pardo:stable_input:v1'
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_TIME_SORTED_INPUT"]._options = None
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_TIME_SORTED_INPUT"]._serialized_options = b'\242\264\372\302\005+beam:requirement:pardo:time_sorted_input:v1'
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_SPLITTABLE_DOFN"]._options = None
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_SPLITTABLE_DOFN"]._serialized_options = b'\242\264\372\302\005)beam:requirement:pardo:splittable_dofn:v1'
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_ON_WINDOW_EXPIRATION"]._options = None
+  _STANDARDREQUIREMENTS_ENUM.values_by_name["REQUIRES_ON_WINDOW_EXPIRATION"]._serialized_options = b'\242\264\372\302\005.beam:requirement:pardo:on_window_expiration:v1'
+  _STANDARDDISPLAYDATA_DISPLAYDATA.values_by_name["LABELLED"]._options = None
+  _STANDARDDISPLAYDATA_DISPLAYDATA.values_by_name["LABELLED"]._serialized_options = b'\242\264\372\302\005\035beam:display_data:labelled:v1'
+  _STANDARDRESOURCEHINTS_ENUM.values_by_name["ACCELERATOR"]._options = None
+  _STANDARDRESOURCEHINTS_ENUM.values_by_name["ACCELERATOR"]._serialized_options = b'\242\264\372\302\005\035beam:resources:accelerator:v1'
+  _STANDARDRESOURCEHINTS_ENUM.values_by_name["MIN_RAM_BYTES"]._options = None
+  _STANDARDRESOURCEHINTS_ENUM.values_by_name["MIN_RAM_BYTES"]._serialized_options = b'\242\264\372\302\005\037beam:resources:min_ram_bytes:v1'
+  _BEAMCONSTANTS._serialized_start=180
+  _BEAMCONSTANTS._serialized_end=374
+  _BEAMCONSTANTS_CONSTANTS._serialized_start=198
+  _BEAMCONSTANTS_CONSTANTS._serialized_end=374
+  _COMPONENTS._serialized_start=377
+  _COMPONENTS._serialized_end=1326
+  _COMPONENTS_TRANSFORMSENTRY._serialized_start=825
+  _COMPONENTS_TRANSFORMSENTRY._serialized_end=921
+  _COMPONENTS_PCOLLECTIONSENTRY._serialized_start=923
+  _COMPONENTS_PCOLLECTIONSENTRY._serialized_end=1022
+  _COMPONENTS_WINDOWINGSTRATEGIESENTRY._serialized_start=1024
+  _COMPONENTS_WINDOWINGSTRATEGIESENTRY._serialized_end=1136
+  _COMPONENTS_CODERSENTRY._serialized_start=1138
+  _COMPONENTS_CODERSENTRY._serialized_end=1225
+  _COMPONENTS_ENVIRONMENTSENTRY._serialized_start=1227
+  _COMPONENTS_ENVIRONMENTSENTRY._serialized_end=1326
+  _PIPELINE._serialized_start=1329
+  _PIPELINE._serialized_end=1526
+  _PTRANSFORM._serialized_start=1529
+  _PTRANSFORM._serialized_end=2126
+  _PTRANSFORM_INPUTSENTRY._serialized_start=1981
+  _PTRANSFORM_INPUTSENTRY._serialized_end=2026
+  _PTRANSFORM_OUTPUTSENTRY._serialized_start=2028
+  _PTRANSFORM_OUTPUTSENTRY._serialized_end=2074
+  _PTRANSFORM_ANNOTATIONSENTRY._serialized_start=2076
+  _PTRANSFORM_ANNOTATIONSENTRY._serialized_end=2126
+  _STANDARDPTRANSFORMS._serialized_start=2129
+  _STANDARDPTRANSFORMS._serialized_end=4246
+  _STANDARDPTRANSFORMS_PRIMITIVES._serialized_start=2153
+  _STANDARDPTRANSFORMS_PRIMITIVES._serialized_end=2628
+  _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES._serialized_start=2630
+  _STANDARDPTRANSFORMS_DEPRECATEDPRIMITIVES._serialized_end=2746
+  _STANDARDPTRANSFORMS_COMPOSITES._serialized_start=2749
+  _STANDARDPTRANSFORMS_COMPOSITES._serialized_end=3262
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS._serialized_start=3265
+  _STANDARDPTRANSFORMS_COMBINECOMPONENTS._serialized_end=3748
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS._serialized_start=3751
+  _STANDARDPTRANSFORMS_SPLITTABLEPARDOCOMPONENTS._serialized_end=4148
+  _STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS._serialized_start=4150
+  _STANDARDPTRANSFORMS_GROUPINTOBATCHESCOMPONENTS._serialized_end=4246
+  _STANDARDSIDEINPUTTYPES._serialized_start=4249
+  _STANDARDSIDEINPUTTYPES._serialized_end=4379
+  _STANDARDSIDEINPUTTYPES_ENUM._serialized_start=4275
+  _STANDARDSIDEINPUTTYPES_ENUM._serialized_end=4379
+  _STANDARDUSERSTATETYPES._serialized_start=4381
+  _STANDARDUSERSTATETYPES._serialized_end=4501
+  _STANDARDUSERSTATETYPES_ENUM._serialized_start=4407
+  _STANDARDUSERSTATETYPES_ENUM._serialized_end=4501
+  _PCOLLECTION._serialized_start=4504
+  _PCOLLECTION._serialized_end=4728
+  _PARDOPAYLOAD._serialized_start=4731
+  _PARDOPAYLOAD._serialized_end=5565
+  _PARDOPAYLOAD_SIDEINPUTSENTRY._serialized_start=5258
+  _PARDOPAYLOAD_SIDEINPUTSENTRY._serialized_end=5353
+  _PARDOPAYLOAD_STATESPECSENTRY._serialized_start=5355
+  _PARDOPAYLOAD_STATESPECSENTRY._serialized_end=5450
+  _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY._serialized_start=5452
+  _PARDOPAYLOAD_TIMERFAMILYSPECSENTRY._serialized_end=5559
+  _STATESPEC._serialized_start=5568
+  _STATESPEC._serialized_end=6123
+  _READMODIFYWRITESTATESPEC._serialized_start=6125
+  _READMODIFYWRITESTATESPEC._serialized_end=6169
+  _BAGSTATESPEC._serialized_start=6171
+  _BAGSTATESPEC._serialized_end=6211
+  _ORDEREDLISTSTATESPEC._serialized_start=6213
+  _ORDEREDLISTSTATESPEC._serialized_end=6261
+  _COMBININGSTATESPEC._serialized_start=6263
+  _COMBININGSTATESPEC._serialized_end=6382
+  _MAPSTATESPEC._serialized_start=6384
+  _MAPSTATESPEC._serialized_end=6444
+  _SETSTATESPEC._serialized_start=6446
+  _SETSTATESPEC._serialized_end=6486
+  _TIMERFAMILYSPEC._serialized_start=6488
+  _TIMERFAMILYSPEC._serialized_end=6609
+  _ISBOUNDED._serialized_start=6611
+  _ISBOUNDED._serialized_end=6675
+  _ISBOUNDED_ENUM._serialized_start=6624
+  _ISBOUNDED_ENUM._serialized_end=6675
+  _READPAYLOAD._serialized_start=6678
+  _READPAYLOAD._serialized_end=6827
+  _WINDOWINTOPAYLOAD._serialized_start=6829
+  _WINDOWINTOPAYLOAD._serialized_end=6916
+  _COMBINEPAYLOAD._serialized_start=6918
+  _COMBINEPAYLOAD._serialized_end=7033
+  _TESTSTREAMPAYLOAD._serialized_start=7036
+  _TESTSTREAMPAYLOAD._serialized_end=7851
+  _TESTSTREAMPAYLOAD_EVENT._serialized_start=7227
+  _TESTSTREAMPAYLOAD_EVENT._serialized_end=7785
+  _TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK._serialized_start=7552
+  _TESTSTREAMPAYLOAD_EVENT_ADVANCEWATERMARK._serialized_end=7606
+  _TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME._serialized_start=7608
+  _TESTSTREAMPAYLOAD_EVENT_ADVANCEPROCESSINGTIME._serialized_end=7657
+  _TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS._serialized_start=7659
+  _TESTSTREAMPAYLOAD_EVENT_ADDELEMENTS._serialized_end=7776
+  _TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT._serialized_start=7787
+  _TESTSTREAMPAYLOAD_TIMESTAMPEDELEMENT._serialized_end=7851
+  _EVENTSREQUEST._serialized_start=7853
+  _EVENTSREQUEST._serialized_end=7888
+  _WRITEFILESPAYLOAD._serialized_start=7891
+  _WRITEFILESPAYLOAD._serialized_end=8296
+  _WRITEFILESPAYLOAD_SIDEINPUTSENTRY._serialized_start=5258
+  _WRITEFILESPAYLOAD_SIDEINPUTSENTRY._serialized_end=5353
+  _PUBSUBREADPAYLOAD._serialized_start=8299
+  _PUBSUBREADPAYLOAD._serialized_end=8506
+  _PUBSUBWRITEPAYLOAD._serialized_start=8508
+  _PUBSUBWRITEPAYLOAD._serialized_end=8628
+  _GROUPINTOBATCHESPAYLOAD._serialized_start=8630
+  _GROUPINTOBATCHESPAYLOAD._serialized_end=8740
+  _CODER._serialized_start=8742
+  _CODER._serialized_end=8841
+  _STANDARDCODERS._serialized_start=8844
+  _STANDARDCODERS._serialized_end=9729
+  _STANDARDCODERS_ENUM._serialized_start=8863
+  _STANDARDCODERS_ENUM._serialized_end=9729
+  _WINDOWINGSTRATEGY._serialized_start=9732
+  _WINDOWINGSTRATEGY._serialized_end=10384
+  _MERGESTATUS._serialized_start=10386
+  _MERGESTATUS._serialized_end=10478
+  _MERGESTATUS_ENUM._serialized_start=10401
+  _MERGESTATUS_ENUM._serialized_end=10478
+  _ACCUMULATIONMODE._serialized_start=10480
+  _ACCUMULATIONMODE._serialized_end=10573
+  _ACCUMULATIONMODE_ENUM._serialized_start=10500
+  _ACCUMULATIONMODE_ENUM._serialized_end=10573
+  _CLOSINGBEHAVIOR._serialized_start=10575
+  _CLOSINGBEHAVIOR._serialized_end=10656
+  _CLOSINGBEHAVIOR_ENUM._serialized_start=10594
+  _CLOSINGBEHAVIOR_ENUM._serialized_end=10656
+  _ONTIMEBEHAVIOR._serialized_start=10658
+  _ONTIMEBEHAVIOR._serialized_end=10738
+  _ONTIMEBEHAVIOR_ENUM._serialized_start=10676
+  _ONTIMEBEHAVIOR_ENUM._serialized_end=10738
+  _OUTPUTTIME._serialized_start=10740
+  _OUTPUTTIME._serialized_end=10838
+  _OUTPUTTIME_ENUM._serialized_start=10754
+  _OUTPUTTIME_ENUM._serialized_end=10838
+  _TIMEDOMAIN._serialized_start=10840
+  _TIMEDOMAIN._serialized_end=10950
+  _TIMEDOMAIN_ENUM._serialized_start=10854
+  _TIMEDOMAIN_ENUM._serialized_end=10950
+  _TRIGGER._serialized_start=10953
+  _TRIGGER._serialized_end=12747
+  _TRIGGER_AFTERALL._serialized_start=11933
+  _TRIGGER_AFTERALL._serialized_end=12008
+  _TRIGGER_AFTERANY._serialized_start=12010
+  _TRIGGER_AFTERANY._serialized_end=12085
+  _TRIGGER_AFTEREACH._serialized_start=12087
+  _TRIGGER_AFTEREACH._serialized_end=12163
+  _TRIGGER_AFTERENDOFWINDOW._serialized_start=12166
+  _TRIGGER_AFTERENDOFWINDOW._serialized_end=12317
+  _TRIGGER_AFTERPROCESSINGTIME._serialized_start=12319
+  _TRIGGER_AFTERPROCESSINGTIME._serialized_end=12425
+  _TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME._serialized_start=12427
+  _TRIGGER_AFTERSYNCHRONIZEDPROCESSINGTIME._serialized_end=12460
+  _TRIGGER_DEFAULT._serialized_start=12462
+  _TRIGGER_DEFAULT._serialized_end=12471
+  _TRIGGER_ELEMENTCOUNT._serialized_start=12473
+  _TRIGGER_ELEMENTCOUNT._serialized_end=12510
+  _TRIGGER_NEVER._serialized_start=12512
+  _TRIGGER_NEVER._serialized_end=12519
+  _TRIGGER_ALWAYS._serialized_start=12521
+  _TRIGGER_ALWAYS._serialized_end=12529
+  _TRIGGER_ORFINALLY._serialized_start=12532
+  _TRIGGER_ORFINALLY._serialized_end=12662
+  _TRIGGER_REPEAT._serialized_start=12664
+  _TRIGGER_REPEAT._serialized_end=12736
+  _TIMESTAMPTRANSFORM._serialized_start=12750
+  _TIMESTAMPTRANSFORM._serialized_end=13028
+  _TIMESTAMPTRANSFORM_DELAY._serialized_start=12933
+  _TIMESTAMPTRANSFORM_DELAY._serialized_end=12962
+  _TIMESTAMPTRANSFORM_ALIGNTO._serialized_start=12964
+  _TIMESTAMPTRANSFORM_ALIGNTO._serialized_end=13005
+  _SIDEINPUT._serialized_start=13031
+  _SIDEINPUT._serialized_end=13257
+  _STANDARDARTIFACTS._serialized_start=13260
+  _STANDARDARTIFACTS._serialized_end=13781
+  _STANDARDARTIFACTS_TYPES._serialized_start=13282
+  _STANDARDARTIFACTS_TYPES._serialized_end=13569
+  _STANDARDARTIFACTS_ROLES._serialized_start=13572
+  _STANDARDARTIFACTS_ROLES._serialized_end=13781
+  _ARTIFACTFILEPAYLOAD._serialized_start=13783
+  _ARTIFACTFILEPAYLOAD._serialized_end=13834
+  _ARTIFACTURLPAYLOAD._serialized_start=13836
+  _ARTIFACTURLPAYLOAD._serialized_end=13885
+  _EMBEDDEDFILEPAYLOAD._serialized_start=13887
+  _EMBEDDEDFILEPAYLOAD._serialized_end=13922
+  _PYPIPAYLOAD._serialized_start=13924
+  _PYPIPAYLOAD._serialized_end=13975
+  _MAVENPAYLOAD._serialized_start=13977
+  _MAVENPAYLOAD._serialized_end=14033
+  _DEFERREDARTIFACTPAYLOAD._serialized_start=14035
+  _DEFERREDARTIFACTPAYLOAD._serialized_end=14087
+  _ARTIFACTSTAGINGTOROLEPAYLOAD._serialized_start=14089
+  _ARTIFACTSTAGINGTOROLEPAYLOAD._serialized_end=14140
+  _ARTIFACTINFORMATION._serialized_start=14142
+  _ARTIFACTINFORMATION._serialized_end=14243
+  _ENVIRONMENT._serialized_start=14246
+  _ENVIRONMENT._serialized_end=14610
+  _ENVIRONMENT_RESOURCEHINTSENTRY._serialized_start=14552
+  _ENVIRONMENT_RESOURCEHINTSENTRY._serialized_end=14604
+  _STANDARDENVIRONMENTS._serialized_start=14613
+  _STANDARDENVIRONMENTS._serialized_end=14812
+  _STANDARDENVIRONMENTS_ENVIRONMENTS._serialized_start=14638
+  _STANDARDENVIRONMENTS_ENVIRONMENTS._serialized_end=14812
+  _DOCKERPAYLOAD._serialized_start=14814
+  _DOCKERPAYLOAD._serialized_end=14854
+  _PROCESSPAYLOAD._serialized_start=14857
+  _PROCESSPAYLOAD._serialized_end=15033
+  _PROCESSPAYLOAD_ENVENTRY._serialized_start=14991
+  _PROCESSPAYLOAD_ENVENTRY._serialized_end=15033
+  _EXTERNALPAYLOAD._serialized_start=15036
+  _EXTERNALPAYLOAD._serialized_end=15255
+  _EXTERNALPAYLOAD_PARAMSENTRY._serialized_start=15210
+  _EXTERNALPAYLOAD_PARAMSENTRY._serialized_end=15255
+  _STANDARDPROTOCOLS._serialized_start=15258
+  _STANDARDPROTOCOLS._serialized_end=15867
+  _STANDARDPROTOCOLS_ENUM._serialized_start=15280
+  _STANDARDPROTOCOLS_ENUM._serialized_end=15867
+  _STANDARDRUNNERPROTOCOLS._serialized_start=15870
+  _STANDARDRUNNERPROTOCOLS._serialized_end=16086
+  _STANDARDRUNNERPROTOCOLS_ENUM._serialized_start=15898
+  _STANDARDRUNNERPROTOCOLS_ENUM._serialized_end=16086
+  _STANDARDREQUIREMENTS._serialized_start=16089
+  _STANDARDREQUIREMENTS._serialized_end=16600
+  _STANDARDREQUIREMENTS_ENUM._serialized_start=16114
+  _STANDARDREQUIREMENTS_ENUM._serialized_end=16600
+  _FUNCTIONSPEC._serialized_start=16602
+  _FUNCTIONSPEC._serialized_end=16646
+  _STANDARDDISPLAYDATA._serialized_start=16648
+  _STANDARDDISPLAYDATA._serialized_end=16735
+  _STANDARDDISPLAYDATA_DISPLAYDATA._serialized_start=16671
+  _STANDARDDISPLAYDATA_DISPLAYDATA._serialized_end=16735
+  _LABELLEDPAYLOAD._serialized_start=16738
+  _LABELLEDPAYLOAD._serialized_end=16902
+  _DISPLAYDATA._serialized_start=16904
+  _DISPLAYDATA._serialized_end=16947
+  _MESSAGEWITHCOMPONENTS._serialized_start=16950
+  _MESSAGEWITHCOMPONENTS._serialized_end=17783
+  _EXECUTABLESTAGEPAYLOAD._serialized_start=17786
+  _EXECUTABLESTAGEPAYLOAD._serialized_end=18867
+  _EXECUTABLESTAGEPAYLOAD_SIDEINPUTID._serialized_start=18468
+  _EXECUTABLESTAGEPAYLOAD_SIDEINPUTID._serialized_end=18523
+  _EXECUTABLESTAGEPAYLOAD_USERSTATEID._serialized_start=18525
+  _EXECUTABLESTAGEPAYLOAD_USERSTATEID._serialized_end=18580
+  _EXECUTABLESTAGEPAYLOAD_TIMERID._serialized_start=18582
+  _EXECUTABLESTAGEPAYLOAD_TIMERID._serialized_end=18633
+  _EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID._serialized_start=18635
+  _EXECUTABLESTAGEPAYLOAD_TIMERFAMILYID._serialized_end=18692
+  _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING._serialized_start=18695
+  _EXECUTABLESTAGEPAYLOAD_WIRECODERSETTING._serialized_end=18867
+  _STANDARDRESOURCEHINTS._serialized_start=18870
+  _STANDARDRESOURCEHINTS._serialized_end=19013
+  _STANDARDRESOURCEHINTS_ENUM._serialized_start=18895
+  _STANDARDRESOURCEHINTS_ENUM._serialized_end=19013
+  _TESTSTREAMSERVICE._serialized_start=19016
+  _TESTSTREAMSERVICE._serialized_end=19159
+# @@protoc_insertion_point(module_scope)
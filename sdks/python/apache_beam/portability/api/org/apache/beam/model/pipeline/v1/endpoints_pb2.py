@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: org/apache/beam/model/pipeline/v1/endpoints.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n1org/apache/beam/model/pipeline/v1/endpoints.proto\x12!org.apache.beam.model.pipeline.v1\"r\n\x14\x41piServiceDescriptor\x12\x0b\n\x03url\x18\x01 \x01(\t\x12M\n\x0e\x61uthentication\x18\x02 \x01(\x0b\x32\x35.org.apache.beam.model.pipeline.v1.AuthenticationSpec\"2\n\x12\x41uthenticationSpec\x12\x0b\n\x03urn\x18\x01 \x01(\t\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\x42x\n!org.apache.beam.model.pipeline.v1B\tEndpointsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+
+
+_APISERVICEDESCRIPTOR = DESCRIPTOR.message_types_by_name['ApiServiceDescriptor']
+_AUTHENTICATIONSPEC = DESCRIPTOR.message_types_by_name['AuthenticationSpec']
+ApiServiceDescriptor = _reflection.GeneratedProtocolMessageType('ApiServiceDescriptor', (_message.Message,), {
+  'DESCRIPTOR' : _APISERVICEDESCRIPTOR,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.endpoints_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ApiServiceDescriptor)
+  })
+_sym_db.RegisterMessage(ApiServiceDescriptor)
+
+AuthenticationSpec = _reflection.GeneratedProtocolMessageType('AuthenticationSpec', (_message.Message,), {
+  'DESCRIPTOR' : _AUTHENTICATIONSPEC,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.endpoints_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.AuthenticationSpec)
+  })
+_sym_db.RegisterMessage(AuthenticationSpec)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\tEndpointsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _APISERVICEDESCRIPTOR._serialized_start=88
+  _APISERVICEDESCRIPTOR._serialized_end=202
+  _AUTHENTICATIONSPEC._serialized_start=204
+  _AUTHENTICATIONSPEC._serialized_end=254
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: org/apache/beam/model/pipeline/v1/external_transforms.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from . import schema_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_schema__pb2
+from . import beam_runner_api_pb2 as org_dot_apache_dot_beam_dot_model_dot_pipeline_dot_v1_dot_beam__runner__api__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n;org/apache/beam/model/pipeline/v1/external_transforms.proto\x12!org.apache.beam.model.pipeline.v1\x1a.org/apache/beam/model/pipeline/v1/schema.proto\x1a\x37org/apache/beam/model/pipeline/v1/beam_runner_api.proto\"j\n\x1c\x45xternalConfigurationPayload\x12\x39\n\x06schema\x18\x01 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x0f\n\x07payload\x18\x02 \x01(\x0c\"\xac\x01\n\x10\x45xpansionMethods\"\x97\x01\n\x04\x45num\x12H\n\x11JAVA_CLASS_LOOKUP\x10\x00\x1a\x31\xa2\xb4\xfa\xc2\x05+beam:expansion:payload:java_class_lookup:v1\x12\x45\n\x10SCHEMA_TRANSFORM\x10\x01\x1a/\xa2\xb4\xfa\xc2\x05)beam:expansion:payload:schematransform:v1\"\xf7\x01\n\x16JavaClassLookupPayload\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\x1a\n\x12\x63onstructor_method\x18\x02 \x01(\t\x12\x45\n\x12\x63onstructor_schema\x18\x03 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x1b\n\x13\x63onstructor_payload\x18\x04 \x01(\x0c\x12I\n\x0f\x62uilder_methods\x18\x05 \x03(\x0b\x32\x30.org.apache.beam.model.pipeline.v1.BuilderMethod\"i\n\rBuilderMethod\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x39\n\x06schema\x18\x02 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x0f\n\x07payload\x18\x03 \x01(\x0c\"\x90\x01\n\x16SchemaTransformPayload\x12\x12\n\nidentifier\x18\x01 \x01(\t\x12G\n\x14\x63onfiguration_schema\x18\x02 \x01(\x0b\x32).org.apache.beam.model.pipeline.v1.Schema\x12\x19\n\x11\x63onfiguration_row\x18\x03 \x01(\x0c\x42\x81\x01\n!org.apache.beam.model.pipeline.v1B\x12\x45xternalTransformsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1b\x06proto3')
+
+
+
+_EXTERNALCONFIGURATIONPAYLOAD = DESCRIPTOR.message_types_by_name['ExternalConfigurationPayload']
+_EXPANSIONMETHODS = DESCRIPTOR.message_types_by_name['ExpansionMethods']
+_JAVACLASSLOOKUPPAYLOAD = DESCRIPTOR.message_types_by_name['JavaClassLookupPayload']
+_BUILDERMETHOD = DESCRIPTOR.message_types_by_name['BuilderMethod']
+_SCHEMATRANSFORMPAYLOAD = DESCRIPTOR.message_types_by_name['SchemaTransformPayload']
+_EXPANSIONMETHODS_ENUM = _EXPANSIONMETHODS.enum_types_by_name['Enum']
+ExternalConfigurationPayload = _reflection.GeneratedProtocolMessageType('ExternalConfigurationPayload', (_message.Message,), {
+  'DESCRIPTOR' : _EXTERNALCONFIGURATIONPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExternalConfigurationPayload)
+  })
+_sym_db.RegisterMessage(ExternalConfigurationPayload)
+
+ExpansionMethods = _reflection.GeneratedProtocolMessageType('ExpansionMethods', (_message.Message,), {
+  'DESCRIPTOR' : _EXPANSIONMETHODS,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.ExpansionMethods)
+  })
+_sym_db.RegisterMessage(ExpansionMethods)
+
+JavaClassLookupPayload = _reflection.GeneratedProtocolMessageType('JavaClassLookupPayload', (_message.Message,), {
+  'DESCRIPTOR' : _JAVACLASSLOOKUPPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.JavaClassLookupPayload)
+  })
+_sym_db.RegisterMessage(JavaClassLookupPayload)
+
+BuilderMethod = _reflection.GeneratedProtocolMessageType('BuilderMethod', (_message.Message,), {
+  'DESCRIPTOR' : _BUILDERMETHOD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.BuilderMethod)
+  })
+_sym_db.RegisterMessage(BuilderMethod)
+
+SchemaTransformPayload = _reflection.GeneratedProtocolMessageType('SchemaTransformPayload', (_message.Message,), {
+  'DESCRIPTOR' : _SCHEMATRANSFORMPAYLOAD,
+  '__module__' : 'org.apache.beam.model.pipeline.v1.external_transforms_pb2'
+  # @@protoc_insertion_point(class_scope:org.apache.beam.model.pipeline.v1.SchemaTransformPayload)
+  })
+_sym_db.RegisterMessage(SchemaTransformPayload)
+
+if _descriptor._USE_C_DESCRIPTORS == False:
+
+  DESCRIPTOR._options = None
+  DESCRIPTOR._serialized_options = b'\n!org.apache.beam.model.pipeline.v1B\022ExternalTransformsZHgithub.com/apache/beam/sdks/v2/go/pkg/beam/model/pipeline_v1;pipeline_v1'
+  _EXPANSIONMETHODS_ENUM.values_by_name["JAVA_CLASS_LOOKUP"]._options = None
+  _EXPANSIONMETHODS_ENUM.values_by_name["JAVA_CLASS_LOOKUP"]._serialized_options = b'\242\264\372\302\005+beam:expansion:payload:java_class_lookup:v1'
+  _EXPANSIONMETHODS_ENUM.values_by_name["SCHEMA_TRANSFORM"]._options = None
+  _EXPANSIONMETHODS_ENUM.values_by_name["SCHEMA_TRANSFORM"]._serialized_options = b'\242\264\372\302\005)beam:expansion:payload:schematransform:v1'
+  _EXTERNALCONFIGURATIONPAYLOAD._serialized_start=203
+  _EXTERNALCONFIGURATIONPAYLOAD._serialized_end=309
+  _EXPANSIONMETHODS._serialized_start=312
+  _EXPANSIONMETHODS._serialized_end=484
+  _EXPANSIONMETHODS_ENUM._serialized_start=333
+  _EXPANSIONMETHODS_ENUM._serialized_end=484
+  _JAVACLASSLOOKUPPAYLOAD._serialized_start=487
+  _JAVACLASSLOOKUPPAYLOAD._serialized_end=734
+  _BUILDERMETHOD._serialized_start=736
+  _BUILDERMETHOD._serialized_end=841
+  _SCHEMATRANSFORMPAYLOAD._serialized_start=844
+  _SCHEMATRANSFORMPAYLOAD._serialized_end=988
+# @@protoc_insertion_point(module_scope)